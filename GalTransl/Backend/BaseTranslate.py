@@ -1,4 +1,6 @@
 import asyncio
+import copy
+import weakref
 import httpx
 from opencc import OpenCC
 from typing import Optional, List
@@ -15,18 +17,44 @@ from GalTransl.CSentense import CSentense, CTransList
 from GalTransl.Cache import save_transCache_to_json
 from GalTransl.Dictionary import CGptDict
 from GalTransl.Utils import load_guideline_file, fix_quotes2
-from openai import RateLimitError, AsyncOpenAI
+from openai import RateLimitError, APIConnectionError, APITimeoutError, AsyncOpenAI
 from openai import DefaultAioHttpClient
 from openai._types import NOT_GIVEN
 import random
 import time
 from contextlib import suppress
 from GalTransl.TerminalOutput import should_print_translation_logs
+from GalTransl import Events
+from GalTransl.TokenBudget import MAX_PACKED_LINES, estimate_tokens, pack_request
+from GalTransl.RateLimit import get_limiter, retry_after_from_exception
+from GalTransl.Routing import EndpointRouter
 
 
 _GLOBAL_RPM_LOCK = Lock()
 _GLOBAL_NEXT_ALLOWED_TS = 0.0
 
+# 常驻翻译进程（translate.py --serve）在同一个事件循环里连续执行多个任务。
+# 开启后 AsyncOpenAI 客户端按 (事件循环, key, 端点, 代理) 复用，任务结束时不关闭，
+# 连接池与 TLS 会话跨任务保持温热。
+KEEP_WARM_CLIENTS = False
+# 对冲触发延迟的下限（秒），避免 p95 很低时几乎每个请求都被对冲
+HEDGE_MIN_DELAY = 1.0
+_WARM_CLIENTS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _warm_client_bucket() -> Optional[dict]:
+    if not KEEP_WARM_CLIENTS:
+        return None
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    bucket = _WARM_CLIENTS.get(loop)
+    if bucket is None:
+        bucket = {}
+        _WARM_CLIENTS[loop] = bucket
+    return bucket
+
 
 class RequestHealthMetrics:
     def __init__(self) -> None:
@@ -66,8 +94,52 @@ class RequestHealthMetrics:
                 "avg_latency": avg_latency,
             }
 
+    def percentile(self, q: float, window_seconds: float = 120.0, min_samples: int = 20) -> Optional[float]:
+        """最近窗口内成功请求延迟的分位数；样本不足返回 None"""
+        now = time.monotonic()
+        with self._lock:
+            self._trim_locked(now, window_seconds)
+            latencies = sorted(lat for _, lat, limited in self._samples if not limited)
+        if len(latencies) < max(1, min_samples):
+            return None
+        index = min(len(latencies) - 1, int(q * len(latencies)))
+        return latencies[index]
+
+
+class HedgeBudget:
+    """对冲请求配额：对冲数不超过总请求数 * max_ratio；计数与判断在锁内完成"""
+
+    def __init__(self, max_ratio: float) -> None:
+        self.max_ratio = max(0.0, float(max_ratio))
+        self.requests = 0
+        self.hedges = 0
+        self._lock = Lock()
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def try_acquire(self) -> bool:
+        """占用一次对冲配额，超出上限返回 False"""
+        with self._lock:
+            if self.hedges + 1 > self.max_ratio * self.requests:
+                return False
+            self.hedges += 1
+            return True
+
+    def refund(self) -> None:
+        """配额已占用但对冲未发出时归还"""
+        with self._lock:
+            self.hedges = max(0, self.hedges - 1)
+
 
 class BaseTranslate:
+    # 后端是否实现了校对（proofread=True 时用 proofread_prompt 并把结果写入 proofread_zh）
+    supports_proofread = False
+    proofread_prompt = ""
+    # 后端能输出的目标语言（LANG_SUPPORTED 的键），空为不限；多目标语言时跳过不支持的目标
+    supported_target_langs: tuple = ()
+
     def __init__(
         self,
         config: CProjectConfig,
@@ -139,6 +211,10 @@ class BaseTranslate:
 
         self.smartRetry:bool=config.getKey("smartRetry", True)
 
+        # token 预算：任一项大于 0 时按估算 token 数打包请求，句数仍不超过 numPerRequestTranslate
+        self.token_limit = int(config.getKey("gpt.token_limit", 0) or 0)
+        self.output_token_limit = int(config.getKey("gpt.outputTokenLimit", 0) or 0)
+
         metrics = getattr(config, "request_health_metrics", None)
         if metrics is None:
             metrics = RequestHealthMetrics()
@@ -157,6 +233,19 @@ class BaseTranslate:
             backend_rpm = 0
         self.global_request_rpm = max(0, backend_rpm)
 
+        # 按端点 + key 的 AIMD 并发限制，开启后取代全局 autoAdjustWorkers
+        self.endpoint_limiting = bool(config.getKey("endpointAdaptiveConcurrency", False))
+        self.max_endpoint_concurrency = max(1, int(config.getKey("workersPerProject") or 1))
+
+        # 对冲请求：超过近期 p95 延迟仍未返回时向另一个 key/端点再发一份，先返回者胜出
+        self.hedge_requests = bool(config.getKey("gpt.hedgeRequests", False))
+        self.hedge_max_ratio = max(0.0, float(config.getKey("gpt.hedgeMaxRatio", 0.05) or 0))
+        self._hedge_budget = HedgeBudget(self.hedge_max_ratio)
+
+        # 翻译记忆：相似度达到该值的相似句作为参考译文附在术语表后
+        self.transl_memory_hint = float(config.getKey("translMemoryHint", 0.6) or 0)
+        self.transl_memory = getattr(config, "transl_memory", None)
+
         if config.getKey("internals.enableProxy") == True:
             self.proxyProvider = proxy_pool
         else:
@@ -172,6 +261,23 @@ class BaseTranslate:
 
         pass
 
+    def for_target_lang(self, lang: str, transl_memory=None) -> "BaseTranslate":
+        """复制一个输出 lang 的实例：与本实例共用客户端、令牌与限流状态，上文记录与翻译记忆各自独立"""
+        if lang not in LANG_SUPPORTED.keys():
+            raise ValueError(get_text("invalid_target_language", lang, lang))
+        api = copy.copy(self)
+        api.target_lang = LANG_SUPPORTED[lang]
+        if api.target_lang == "Simplified_Chinese":
+            api.opencc = OpenCC("t2s.json")
+        elif api.target_lang == "Traditional_Chinese":
+            api.opencc = OpenCC("s2tw.json")
+        if isinstance(getattr(self, "last_translations", None), dict):
+            api.last_translations = {}
+        api.last_file_name = ""
+        api.transl_memory = transl_memory
+        api._hedge_budget = HedgeBudget(self.hedge_max_ratio)
+        return api
+
     def init_chatbot(self, eng_type, config: CProjectConfig):
         section_name = "OpenAI-Compatible"
 
@@ -229,19 +335,26 @@ class BaseTranslate:
         trust_env = False  # 不使用系统代理
         proxy_kwargs = build_httpx_proxy_kwargs(proxy_addr)
         self.client_list = []
+        warm_bucket = _warm_client_bucket()
+        self._warm_clients = warm_bucket is not None
         for token in self.tokenProvider.get_available_token():
-            client = AsyncOpenAI(
-                api_key=token.token,
-                base_url=token.domain,
-                max_retries=0,
-                http_client=DefaultAioHttpClient(
-                    trust_env=trust_env,
-                    limits=httpx.Limits(
-                        max_keepalive_connections=None, max_connections=None
+            client_key = (token.token, token.domain, proxy_addr)
+            client = warm_bucket.get(client_key) if warm_bucket is not None else None
+            if client is None:
+                client = AsyncOpenAI(
+                    api_key=token.token,
+                    base_url=token.domain,
+                    max_retries=0,
+                    http_client=DefaultAioHttpClient(
+                        trust_env=trust_env,
+                        limits=httpx.Limits(
+                            max_keepalive_connections=None, max_connections=None
+                        ),
+                        **proxy_kwargs,
                     ),
-                    **proxy_kwargs,
-                ),
-            )
+                )
+                if warm_bucket is not None:
+                    warm_bucket[client_key] = client
             self.client_list.append((client, token))
 
         pass
@@ -265,8 +378,55 @@ class BaseTranslate:
             return f"{start_idx}~{end_idx}"
         return str(start_idx)
 
-    def _build_prompt_request(self, input_src: str, gptdict: str) -> str:
+    def _request_overhead_tokens(self, filename: str = "") -> int:
+        """估算每次请求中与句子无关的 token 开销（系统提示、翻译模板、规范、上文）"""
+        overhead = estimate_tokens(getattr(self, "system_prompt", "") or "")
+        overhead += estimate_tokens(getattr(self, "trans_prompt", "") or "")
+        guideline = getattr(self.pj_config, "translation_guideline", "")
+        if isinstance(guideline, str):
+            overhead += estimate_tokens(guideline)
+        last_translations = getattr(self, "last_translations", None)
+        if isinstance(last_translations, dict):
+            overhead += estimate_tokens(last_translations.get(filename, "") or "")
+        return overhead
+
+    def _next_request(
+        self,
+        translist_unhit: CTransList,
+        start: int,
+        num_pre_request: int,
+        filename: str = "",
+        gen_dic=None,
+        hint_style: str = "",
+    ):
+        """取下一次请求的句子与术语表 prompt；设置了 token 预算时在 num_pre_request 句以内按预算打包。
+
+        hint_style 非空时在术语表后附上翻译记忆中的相似句参考（格式同术语表）。
+        """
+        memory = getattr(self, "transl_memory", None)
+        if hint_style and memory is not None and self.transl_memory_hint > 0:
+            base_gen_dic = gen_dic
+            gen_dic = lambda split: (base_gen_dic(split) if base_gen_dic else "") + memory.hint_prompt(
+                split, self.transl_memory_hint, hint_style
+            )
+        if not (self.token_limit or self.output_token_limit):
+            trans_list_split = translist_unhit[start : start + num_pre_request]
+            return trans_list_split, gen_dic(trans_list_split) if gen_dic else ""
+        return pack_request(
+            translist_unhit,
+            start,
+            min(num_pre_request, MAX_PACKED_LINES) if num_pre_request > 0 else MAX_PACKED_LINES,
+            self.token_limit,
+            self.output_token_limit,
+            self._request_overhead_tokens(filename),
+            gen_dic,
+        )
+
+    def _build_prompt_request(self, input_src: str, gptdict: str, proofread: bool = False) -> str:
         prompt_req = self.trans_prompt
+        if proofread and self.proofread_prompt:
+            prompt_req = self.proofread_prompt
+            prompt_req = prompt_req.replace("[NamePrompt3]", "").replace("[ConfRecord]", "")
         prompt_req = prompt_req.replace(
             "[translation_guideline]", self.pj_config.translation_guideline
         )
@@ -347,7 +507,15 @@ class BaseTranslate:
         emit_runtime_success: bool = False,
         emitted_success_indices=None,
         result_index: Optional[int] = None,
+        proofread: bool = False,
     ) -> tuple[bool, str]:
+        if proofread:
+            current_tran.proofread_zh = line_dst
+            current_tran.post_zh = line_dst
+            current_tran.proofread_by = model_name
+            result_trans_list.append(current_tran)
+            cursor["success_count"] = cursor.get("success_count", 0) + 1
+            return True, ""
         current_tran.pre_zh = line_dst
         current_tran.post_zh = line_dst
         current_tran.trans_by = model_name
@@ -449,19 +617,21 @@ class BaseTranslate:
 
         while i < len_trans_list:
             self._check_stop_requested()
-            trans_list_split = (
-                translist_unhit[i : i + num_pre_request]
-                if (i + num_pre_request < len_trans_list)
-                else translist_unhit[i:]
-            )
-
             if gpt_dic:
                 if glossary_style:
-                    dic_prompt = gpt_dic.gen_prompt(trans_list_split, glossary_style)
+                    gen_dic = lambda split: gpt_dic.gen_prompt(split, glossary_style)
                 else:
-                    dic_prompt = gpt_dic.gen_prompt(trans_list_split)
+                    gen_dic = gpt_dic.gen_prompt
             else:
-                dic_prompt = ""
+                gen_dic = None
+            trans_list_split, dic_prompt = self._next_request(
+                translist_unhit,
+                i,
+                num_pre_request,
+                filename,
+                gen_dic,
+                "" if proofread else (glossary_style or "gpt"),
+            )
 
             num, trans_result = await self.translate(
                 trans_list_split,
@@ -504,7 +674,8 @@ class BaseTranslate:
 
             if num > 0:
                 i += num
-            self.pj_config.bar(num)
+            if not proofread:
+                self.pj_config.bar(num)
 
             result_output = ""
             for trans in trans_result:
@@ -517,6 +688,9 @@ class BaseTranslate:
                     self._record_runtime_success(filename, trans)
                 result_output += repr(trans)
 
+            Events.emit_results(
+                filename, trans_result, len(trans_result_list) + len(trans_result), len_trans_list
+            )
             LOGGER.info(result_output)
             trans_result_list += trans_result
             transl_step_count += 1
@@ -567,6 +741,136 @@ class BaseTranslate:
         if wait_seconds > 0:
             await self._interruptible_sleep(wait_seconds)
 
+    def _endpoint_limiter(self, token: COpenAIToken):
+        if not self.endpoint_limiting:
+            return None
+        # 新端点按 key 数均分初始并发，健康的 key 一开始就能跑满
+        share = -(-self.max_endpoint_concurrency // max(1, len(self.client_list)))
+        return get_limiter(
+            token.domain,
+            token.token,
+            max_limit=self.max_endpoint_concurrency,
+            name=f"{token.domain}[{token.maskToken()}]",
+            initial=max(4.0, float(share)),
+        )
+
+    def _pick_random_client(self):
+        """随机选择客户端，优先选当前未被限流、还有并发余量的端点"""
+        if self.endpoint_limiting and len(self.client_list) > 1:
+            ready = [
+                item
+                for item in self.client_list
+                if self._endpoint_limiter(item[1]).available()
+            ]
+            if ready:
+                return random.choice(ready)
+        return random.choices(self.client_list, k=1)[0]
+
+    def _router(self) -> EndpointRouter:
+        router = getattr(self, "_endpoint_router", None)
+        if router is None or router.items != self.client_list:
+            router = EndpointRouter(
+                self.client_list,
+                key_of=lambda item: (item[1].domain, item[1].token),
+                name_of=lambda item: f"{item[1].domain}[{item[1].maskToken()}]",
+            )
+            self._endpoint_router = router
+        return router
+
+    def _pick_client(self, exclude=()):
+        """按 tokenStrategy 选择客户端；adaptive 按实时延迟/在途数/错误率做二选一"""
+        if self.tokenStrategy == "adaptive" and len(self.client_list) > 1:
+            ready = None
+            if self.endpoint_limiting:
+                ready = lambda item: self._endpoint_limiter(item[1]).available()
+            return self._router().pick(exclude, ready)
+        return self._pick_random_client()
+
+    def _hedge_delay(self) -> float:
+        """返回本次请求的对冲触发延迟（秒），0 表示不对冲"""
+        if not self.hedge_requests or len(self.client_list) < 2:
+            return 0.0
+        p95 = self.request_health_metrics.percentile(0.95)
+        if p95 is None:
+            return 0.0
+        return max(HEDGE_MIN_DELAY, p95)
+
+    def _launch_hedge(self, primary, create_task):
+        """向与 primary 同模型的另一个端点发出对冲请求；超出额外开销上限或无可用端点时返回 None"""
+        if not self._hedge_budget.try_acquire():
+            return None
+        model_name = primary[1].model_name
+        others = [
+            item
+            for item in self.client_list
+            if item is not primary and item[1].model_name == model_name
+        ]
+        if not others:
+            self._hedge_budget.refund()
+            return None
+        if self.tokenStrategy == "adaptive":
+            exclude = [item for item in self.client_list if item not in others]
+            choice = self._router().pick(exclude)
+        else:
+            choice = random.choice(others)
+        limiter = self._endpoint_limiter(choice[1])
+        if limiter is not None and not limiter.try_acquire():
+            self._hedge_budget.refund()
+            return None
+        routed = None
+        if self.tokenStrategy == "adaptive":
+            routed = choice
+            self._router().start(routed)
+        LOGGER.debug(f"Hedge request to {choice[1].domain} with token {choice[1].maskToken()}")
+        Events.emit("hedge", endpoint=choice[1].domain, model=model_name)
+        return create_task(choice), (choice, limiter, routed, time.monotonic())
+
+    def _drop_side_request(self, task, meta, error=None) -> None:
+        """结算落败/失败的并行请求：释放其限流槽与路由计数，已返回的流式响应需关闭"""
+        choice, limiter, routed, started = meta
+        latency = time.monotonic() - started
+        if error is not None:
+            is_rate_limited = isinstance(error, RateLimitError)
+            if limiter is not None:
+                limiter.release(
+                    latency,
+                    ok=False,
+                    rate_limited=is_rate_limited,
+                    retry_after=retry_after_from_exception(error),
+                    congested=isinstance(error, (APITimeoutError, APIConnectionError)),
+                )
+            if routed is not None:
+                self._router().finish(routed, latency, ok=False, rate_limited=is_rate_limited)
+            return
+        if limiter is not None:
+            limiter.release(latency, ok=False)
+        if routed is not None:
+            self._router().cancel(routed)
+
+        def _close_loser(done_task):
+            if done_task.cancelled() or done_task.exception() is not None:
+                return
+            close = getattr(done_task.result(), "aclose", None) or getattr(done_task.result(), "close", None)
+            if callable(close):
+                with suppress(Exception):
+                    maybe_coro = close()
+                    if asyncio.iscoroutine(maybe_coro):
+                        asyncio.ensure_future(maybe_coro)
+
+        if not task.done():
+            task.cancel()
+        task.add_done_callback(_close_loser)
+
+    def _drop_pending_requests(self, api_task, pending) -> None:
+        """结算本轮未结算的并行请求；主请求的限流槽与路由计数由调用方持有，这里只取消其任务"""
+        for task, meta in pending.items():
+            if task is api_task:
+                if not task.done():
+                    task.cancel()
+            else:
+                self._drop_side_request(task, meta)
+        pending.clear()
+
     def _record_request_health(self, latency_seconds: float, is_rate_limited: bool) -> None:
         try:
             self.request_health_metrics.record(latency_seconds, is_rate_limited)
@@ -591,7 +895,8 @@ class BaseTranslate:
         api_try_count = base_try_count
         client: AsyncOpenAI
         token: COpenAIToken
-        client, token = random.choices(self.client_list, k=1)[0]
+        choice = self._pick_client()
+        client, token = choice
         if messages is None:
             messages = [
                 {"role": "system", "content": system},
@@ -610,55 +915,107 @@ class BaseTranslate:
                 raise JobCancelledError()
 
             request_started = time.monotonic()
+            limiter = None
+            routed = None
+            api_task = None
+            pending = {}
             try:
                 if self.tokenStrategy == "random":
                     if api_try_count % 2 == 0:
-                        client, token = random.choices(self.client_list, k=1)[0]
+                        choice = self._pick_client()
                 elif self.tokenStrategy == "fallback":
                     index = api_try_count % len(self.client_list)
-                    client, token = self.client_list[index]
+                    choice = self.client_list[index]
+                elif self.tokenStrategy == "adaptive":
+                    # 重试时避开刚失败的端点
+                    choice = self._pick_client(
+                        exclude=[choice] if api_try_count > base_try_count else ()
+                    )
                 else:
-                    raise ValueError("tokenStrategy must be random or fallback")
+                    raise ValueError("tokenStrategy must be random, fallback or adaptive")
+                client, token = choice
                 is_stream=stream if stream != NOT_GIVEN else token.stream
                 self._last_chatbot_was_stream = bool(is_stream)
                 self._last_chatbot_model_name = getattr(token, "model_name", "")
                 LOGGER.debug(f"Call {token.domain} withs token {token.maskToken()}")
 
                 await self._wait_for_global_rpm_slot()
+                endpoint_limiter = self._endpoint_limiter(token)
+                if endpoint_limiter is not None:
+                    limiter = await endpoint_limiter.acquire(self._check_stop_requested)
+                    request_started = time.monotonic()
+                if self.tokenStrategy == "adaptive":
+                    routed = choice
+                    self._router().start(routed)
+
+                def create_task(target):
+                    target_client, target_token = target
+                    return asyncio.ensure_future(
+                        target_client.chat.completions.create(
+                            model=target_token.model_name,
+                            messages=messages,
+                            stream=is_stream,
+                            temperature=temperature,
+                            frequency_penalty=frequency_penalty,
+                            max_tokens=max_tokens,
+                            timeout=self.api_timeout,
+                            top_p=top_p,
+                            reasoning_effort=reasoning_effort,
+                        )
+                    )
 
                 # Create the API call as a task so we can cancel it if
                 # the user requests a stop while the request is in-flight.
-                api_task = asyncio.ensure_future(
-                    client.chat.completions.create(
-                        model=token.model_name,
-                        messages=messages,
-                        stream=is_stream,
-                        temperature=temperature,
-                        frequency_penalty=frequency_penalty,
-                        max_tokens=max_tokens,
-                        timeout=self.api_timeout,
-                        top_p=top_p,
-                        reasoning_effort=reasoning_effort,
-                    )
-                )
+                api_task = create_task(choice)
+                self._hedge_budget.record_request()
+                pending = {api_task: (choice, limiter, routed, request_started)}
+                hedge_delay = self._hedge_delay()
+                hedge_at = request_started + hedge_delay if hedge_delay > 0 else None
 
                 # Poll stop_event while waiting for the API response.
                 # This ensures that a stop request is detected within 0.5s
                 # even when the LLM endpoint is slow or unresponsive.
-                while not api_task.done():
+                # 开启对冲时，超过 hedge_at 仍未返回则再发一份，先成功返回者胜出；
+                # 对冲只覆盖到响应开始返回为止（流式请求即首包）。
+                winner = None
+                while winner is None:
                     if self._is_stop_requested(self.pj_config):
-                        api_task.cancel()
+                        for task in pending:
+                            task.cancel()
                         with suppress(BaseException):
-                            await api_task
+                            await asyncio.gather(*pending, return_exceptions=True)
                         from GalTransl.Service import JobCancelledError
                         raise JobCancelledError()
-                    done, _ = await asyncio.wait({api_task}, timeout=0.5)
-                    if done:
-                        break
-
-                response = api_task.result()
+                    timeout = 0.5
+                    if hedge_at is not None:
+                        timeout = max(0.01, min(timeout, hedge_at - time.monotonic()))
+                    done, _ = await asyncio.wait(
+                        set(pending), timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        error = task.exception() if not task.cancelled() else None
+                        if error is None or len(pending) == 1:
+                            winner = task
+                            break
+                        # 一路失败而另一路仍在进行：结算失败的一路，继续等另一路
+                        self._drop_side_request(task, pending.pop(task), error=error)
+                        if task is api_task:
+                            limiter = routed = None
+                    if winner is None and hedge_at is not None and time.monotonic() >= hedge_at:
+                        hedge_at = None
+                        hedge = self._launch_hedge(choice, create_task)
+                        if hedge is not None:
+                            pending[hedge[0]] = hedge[1]
+
+                choice, limiter, routed, request_started = pending.pop(winner)
+                for task, meta in pending.items():
+                    self._drop_side_request(task, meta)
+                pending.clear()
+                client, token = choice
+                response = winner.result()
                 result = ""
                 lastline = ""
+                usage = None
                 if is_stream:
                     stream_abort_requested = False
                     stream_line_buffer = ""
@@ -671,6 +1028,8 @@ class BaseTranslate:
                                 stream_abort_requested = True
                                 from GalTransl.Service import JobCancelledError
                                 raise JobCancelledError()
+                            if getattr(chunk, "usage", None):
+                                usage = chunk.usage
                             if not chunk.choices:
                                 continue
                             if hasattr(chunk.choices[0].delta, "reasoning_content"):
@@ -725,10 +1084,25 @@ class BaseTranslate:
                         raise ValueError(
                             "response.choices[0].message.content is None, no_candidates"
                         )
+                    usage = getattr(response, "usage", None)
                 self._record_request_health(
                     time.monotonic() - request_started,
                     is_rate_limited=False,
                 )
+                if limiter is not None:
+                    limiter.release(time.monotonic() - request_started, ok=True)
+                    limiter = None
+                if routed is not None:
+                    self._router().finish(routed, time.monotonic() - request_started, ok=True)
+                    routed = None
+                if usage is not None:
+                    Events.emit(
+                        "usage",
+                        model=token.model_name,
+                        prompt_tokens=getattr(usage, "prompt_tokens", 0) or 0,
+                        completion_tokens=getattr(usage, "completion_tokens", 0) or 0,
+                        total_tokens=getattr(usage, "total_tokens", 0) or 0,
+                    )
                 return result, token
             except Exception as e:
                 is_rate_limited = isinstance(e, RateLimitError)
@@ -736,12 +1110,38 @@ class BaseTranslate:
                     time.monotonic() - request_started,
                     is_rate_limited=is_rate_limited,
                 )
+                retry_after = retry_after_from_exception(e)
+                if limiter is not None:
+                    limiter.release(
+                        time.monotonic() - request_started,
+                        ok=False,
+                        rate_limited=is_rate_limited,
+                        retry_after=retry_after,
+                        congested=isinstance(e, (APITimeoutError, APIConnectionError)),
+                    )
+                    limiter = None
+                if routed is not None:
+                    self._router().finish(
+                        routed,
+                        time.monotonic() - request_started,
+                        ok=False,
+                        rate_limited=is_rate_limited,
+                    )
+                    routed = None
+                self._drop_pending_requests(api_task, pending)
 
                 from GalTransl.Service import JobCancelledError
                 if isinstance(e, JobCancelledError):
                     raise
 
                 api_try_count += 1
+                Events.emit(
+                    "error",
+                    message=str(e),
+                    endpoint=token.domain,
+                    rate_limited=is_rate_limited,
+                    attempt=api_try_count,
+                )
                 # gemini no_candidates
                 if "candidates" in str(e) and api_try_count > 1:
                     return "", token
@@ -751,6 +1151,9 @@ class BaseTranslate:
                     # https://aws.amazon.com/cn/blogs/architecture/exponential-backoff-and-jitter/
                     sleep_time = 2 ** min(api_try_count, 6)
                     sleep_time = random.randint(0, sleep_time)
+                if self.endpoint_limiting and (is_rate_limited or retry_after is not None):
+                    # 等待交给该端点的限流器（按服务端要求的时长），其他端点可以立即接手
+                    sleep_time = random.random()
 
                 if len(self.client_list) > 1:
                     token_info = f"[{token.maskToken()}]"
@@ -812,6 +1215,14 @@ class BaseTranslate:
                         pass
 
                 await self._interruptible_sleep(sleep_time)
+            finally:
+                # asyncio.CancelledError 不属于 Exception，不会经过上面的 except；
+                # 在此兜底归还限流槽与路由计数（含对冲请求），避免在途数泄漏、端点卡在探测状态
+                self._drop_pending_requests(api_task, pending)
+                if limiter is not None:
+                    limiter.release(time.monotonic() - request_started, ok=False)
+                if routed is not None:
+                    self._router().cancel(routed)
 
     def clean_up(self):
         pass
@@ -820,6 +1231,9 @@ class BaseTranslate:
         if self._shutdown_done:
             return
         self._shutdown_done = True
+        if getattr(self, "_warm_clients", False):
+            # 复用的客户端归常驻进程所有，随事件循环一起释放
+            return
 
         for client, _ in getattr(self, "client_list", []):
             if client is None:
@@ -882,14 +1296,14 @@ class BaseTranslate:
         transl_step_count = 0
         while i < len_trans_list:
             # await asyncio.sleep(1)
-            trans_list_split = (
-                translist_unhit[i : i + num_pre_request]
-                if (i + num_pre_request < len_trans_list)
-                else translist_unhit[i:]
+            trans_list_split, dic_prompt = self._next_request(
+                translist_unhit,
+                i,
+                num_pre_request,
+                filename,
+                gpt_dic.gen_prompt if gpt_dic else None,
             )
 
-            dic_prompt = gpt_dic.gen_prompt(trans_list_split) if gpt_dic else ""
-
             num, trans_result = await self.translate(
                 trans_list_split, dic_prompt, proofread=proofread
             )
@@ -899,6 +1313,9 @@ class BaseTranslate:
             result_output = ""
             for trans in trans_result:
                 result_output = result_output + repr(trans)
+            Events.emit_results(
+                filename, trans_result, len(trans_result_list) + len(trans_result), len_trans_list
+            )
             if should_print_translation_logs(self.pj_config):
                 LOGGER.info(result_output)
             trans_result_list += trans_result
@@ -29,6 +29,8 @@ from openai._types import NOT_GIVEN
 
 class ForGalJsonTranslate(BaseTranslate):
     _SIGCHARS = "abcdefghijklmnopqrstuvwxyz0123456789"
+    supports_proofread = True
+    proofread_prompt = DEEPSEEK_PROOFREAD_PROMPT
 
     def _encode_sig_jsonline(self, sig: str, obj: dict) -> str:
         return f"{sig}|" + json.dumps(obj, ensure_ascii=False)
@@ -117,7 +119,7 @@ class ForGalJsonTranslate(BaseTranslate):
 
         self.restore_context(trans_list, self.contextNum, filename)
 
-        prompt_template = self._build_prompt_request(input_src, gptdict)
+        prompt_template = self._build_prompt_request(input_src, gptdict, proofread)
 
         retry_count = 0
         emitted_success_indices = set()
@@ -381,6 +383,7 @@ class ForGalJsonTranslate(BaseTranslate):
             emit_runtime_success=emit_runtime_success,
             emitted_success_indices=emitted_success_indices,
             result_index=i,
+            proofread=(key_name == "newdst"),
         )
 
     async def batch_translate(
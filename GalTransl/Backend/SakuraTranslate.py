@@ -3,6 +3,7 @@ from opencc import OpenCC
 from typing import Optional
 from random import choice
 from GalTransl import LOGGER, LANG_SUPPORTED
+from GalTransl import Events
 from GalTransl.ConfigHelper import CProjectConfig, CProxyPool
 from GalTransl.CSentense import CSentense, CTransList
 from GalTransl.Cache import save_transCache_to_json
@@ -23,6 +24,9 @@ from GalTransl.TerminalOutput import should_print_translation_logs
 
 
 class CSakuraTranslate(BaseTranslate):
+    # Sakura/GalTransl 模型只输出中文
+    supported_target_langs = ("zh-cn", "zh-tw")
+
     # init
     def __init__(
         self,
@@ -42,16 +46,6 @@ class CSakuraTranslate(BaseTranslate):
             self.transl_dropout = val
         else:
             self.transl_dropout = 0
-        # token_limit
-        if val := config.getKey("gpt.token_limit"):
-            self.token_limit = val
-            import tiktoken
-
-            self.tokenizer = tiktoken.get_encoding("o200k_base")
-        else:
-            self.token_limit = 0
-            self.tokenizer = None
-
         if self.target_lang == "Simplified_Chinese":
             self.opencc = OpenCC("t2s.json")
         elif self.target_lang == "Traditional_Chinese":
@@ -77,39 +71,47 @@ class CSakuraTranslate(BaseTranslate):
         import httpx
         import re
 
-        self.tokenStrategy =  "random"
         backendSpecific = config.projectConfig["backendSpecific"]
         section_name = "SakuraLLM" if "SakuraLLM" in backendSpecific else "Sakura"
+        self.tokenStrategy = config.getBackendConfigSection(section_name).get(
+            "tokenStrategy", "random"
+        )
         model_name = config.getBackendConfigSection(section_name).get(
             "rewriteModelName","sakura"
         )
         self.apiErrorWait = 0
         self.model_name = model_name if model_name else "sakura"
 
-        endpoint = self.endpoint
-        endpoint = endpoint[:-1] if endpoint.endswith("/") else endpoint
-        base_path = "/v1" if not re.search(r"/v\d+$", endpoint) else ""
-        self.stream = True
-        if "sakura-share" in endpoint:
-            self.stream = False
+        # 共享的 gptapi 实例为全部端点各建一个客户端，由路由器按延迟/错误率分配请求
+        endpoints = [self.endpoint] + [
+            ep for ep in getattr(config, "sakuraEndpoints", []) if ep != self.endpoint
+        ]
+        self.stream = "sakura-share" not in self.endpoint
 
         if self.proxyProvider:
             from GalTransl.ConfigHelper import build_httpx_proxy_kwargs
             self.proxy = self.proxyProvider.getProxy()
             proxy_kwargs = build_httpx_proxy_kwargs(self.proxy.addr if self.proxy else None)
-            client = httpx.AsyncClient(trust_env=False, **proxy_kwargs)
         else:
-            client = httpx.AsyncClient(trust_env=False)
+            proxy_kwargs = {}
 
-        chatbot = AsyncOpenAI(
-            api_key="sk-sakura",
-            base_url=f"{endpoint}{base_path}",
-            max_retries=0,
-            http_client=client,
-        )
-        token=COpenAIToken("sk-sakura",f"{endpoint}{base_path}",model_name,True)
         self.client_list=[]
-        self.client_list.append((chatbot,token))
+        for endpoint in endpoints:
+            endpoint = endpoint[:-1] if endpoint.endswith("/") else endpoint
+            base_path = "/v1" if not re.search(r"/v\d+$", endpoint) else ""
+            chatbot = AsyncOpenAI(
+                api_key="sk-sakura",
+                base_url=f"{endpoint}{base_path}",
+                max_retries=0,
+                http_client=httpx.AsyncClient(trust_env=False, **proxy_kwargs),
+            )
+            token = COpenAIToken(
+                "sk-sakura",
+                f"{endpoint}{base_path}",
+                model_name,
+                "sakura-share" not in endpoint,
+            )
+            self.client_list.append((chatbot, token))
 
     def clean_up(self):
         self.pj_config.endpointQueue.put_nowait(self.endpoint)
@@ -169,7 +171,6 @@ class CSakuraTranslate(BaseTranslate):
                 frequency_penalty=self.frequency_penalty,
                 top_p=self.top_p,
                 max_tokens=len(input_str) * 2,
-                stream=self.stream,
             )
 
             result_list = resp.strip("\n").split("\n")
@@ -321,16 +322,20 @@ class CSakuraTranslate(BaseTranslate):
             self._check_stop_requested()
             # await asyncio.sleep(1)
 
-            trans_list_split = translist_unhit[i : i + num_pre_request]
-            dic_prompt = (
-                gpt_dic.gen_prompt(trans_list_split, type="sakura")
+            trans_list_split, dic_prompt = self._next_request(
+                translist_unhit,
+                i,
+                num_pre_request,
+                filename,
+                (lambda split: gpt_dic.gen_prompt(split, type="sakura"))
                 if gpt_dic != None
-                else ""
+                else None,
+                "sakura",
             )
 
             num, trans_result = await self.translate(trans_list_split, dic_prompt, filename)
 
-            if self.transl_dropout > 0 and num == num_pre_request:
+            if self.transl_dropout > 0 and num == len(trans_list_split):
                 if self.transl_dropout < num:
                     num -= self.transl_dropout
                     trans_result = trans_result[:num]
@@ -348,6 +353,7 @@ class CSakuraTranslate(BaseTranslate):
                 if trans.pre_zh and "(Failed)" not in trans.pre_zh and "(翻译失败)" not in trans.pre_zh:
                     self._record_runtime_success(filename, trans)
 
+            Events.emit_results(filename, trans_result, len(trans_result_list), len_trans_list)
             LOGGER.info("".join([repr(tran) for tran in trans_result]))
             LOGGER.info(
                 f"{filename}: {str(len(trans_result_list))}/{str(len_trans_list)}"
@@ -15,6 +15,12 @@ from openai import OpenAI
 from GalTransl.TerminalOutput import should_print_translation_logs, terminal_progress
 
 
+# 已通过可用性检查的令牌 (key, 端点, 模型, 代理) -> 检查时间。
+# 常驻翻译进程连续执行多个任务时，有效期内不再重复发起测试请求。
+TOKEN_CHECK_TTL = 600.0
+_CHECKED_TOKENS: dict[tuple, float] = {}
+
+
 class COpenAIToken:
     """
     OpenAI 令牌
@@ -186,11 +192,17 @@ class COpenAITokenPool:
         proxy: CProxy = None,
         max_retries: int = 2,
     ) -> Tuple[bool, COpenAIToken]:
+        check_key = (token.token, token.domain, token.model_name, proxy.addr if proxy else None)
+        checked_at = _CHECKED_TOKENS.get(check_key)
+        if checked_at is not None and time() - checked_at < TOKEN_CHECK_TTL:
+            self.bar()
+            return True, token
         is_available = False
         for retry_count in range(max_retries):
             self._raise_if_stop_requested()
             is_available, token = await self._isTokenAvailable(token, proxy)
             if is_available:
+                _CHECKED_TOKENS[check_key] = time()
                 self.bar()
                 return is_available, token
             else:
@@ -325,6 +337,7 @@ async def init_sakura_endpoint_queue(projectConfig: CProjectConfig) -> Optional[
         endpoints = projectConfig.getBackendConfigSection(section_name)["endpoints"]
     else:
         endpoints = [projectConfig.getBackendConfigSection(section_name)["endpoint"]]
+    projectConfig.sakuraEndpoints = list(dict.fromkeys(endpoints))
     repeated = (workersPerProject + len(endpoints) - 1) // len(endpoints)
     for _ in range(repeated):
         for endpoint in endpoints:
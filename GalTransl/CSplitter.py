@@ -5,6 +5,7 @@ import json
 import threading
 from GalTransl import LOGGER
 from GalTransl.Loader import load_transList
+from GalTransl.TokenBudget import LINE_OVERHEAD_TOKENS, estimate_tokens
 
 # Thread-local storage for per-job chunk tracking.
 # Each thread (i.e. each translation job) gets its own tracker dict,
@@ -38,6 +39,7 @@ class SplitChunkMetadata:
     chunk_size: 包括交叉部分的实际块大小
     cross_num: 交叉句子数量
     content: 块的实际内容
+    target_lang: 额外目标语言，空为项目的目标语言（多目标语言时每个额外目标一份 chunk）
     """
 
     def __init__(
@@ -50,6 +52,7 @@ class SplitChunkMetadata:
         cross_num: int,
         json_list: List[Dict],
         file_path: str,
+        target_lang: str = "",
     ):
         self.chunk_index = chunk_index  # 块索引
         self.start_index = start_index  # 块起始索引
@@ -72,24 +75,52 @@ class SplitChunkMetadata:
             trans.runtime_index = runtime_index
         self.file_path = file_path  # 文件路径
         self.total_chunks = 0  # 总块数
+        self.carry_over: Dict[int, Dict] = {}  # 增量重翻：id(tran) → 可沿用的旧缓存条目
+        self.target_lang = target_lang  # 额外目标语言
+        self.shared_preprocess = None  # 同一分片各目标语言共用的前处理结果
         tracker = _get_tracker()
-        if self.file_path not in tracker:
-            tracker[self.file_path] = []
+        if self._tracker_key() not in tracker:
+            tracker[self._tracker_key()] = []
+
+    def _tracker_key(self) -> str:
+        # 各目标语言分别统计文件是否完成
+        return f"{self.file_path}|{self.target_lang}" if self.target_lang else self.file_path
+
+    def for_target_lang(self, target_lang: str) -> "SplitChunkMetadata":
+        """复制一份翻译到 target_lang 的 chunk；json 行各自复制，写出时互不影响"""
+        chunk = SplitChunkMetadata(
+            self.chunk_index,
+            self.start_index,
+            self.end_index,
+            self.chunk_non_cross_size,
+            self.chunk_size,
+            self.cross_num,
+            [dict(row) if isinstance(row, dict) else row for row in self.json_list],
+            self.file_path,
+            target_lang,
+        )
+        chunk.update_total_chunks(self.total_chunks)
+        return chunk
+
+    def non_cross_range(self) -> Tuple[int, int]:
+        """trans_list 中非交叉部分的 [起, 止)；首块前面没有交叉句"""
+        start = self.start_index - max(0, self.start_index - self.cross_num)
+        return start, start + self.chunk_non_cross_size
 
     def update_total_chunks(self, total_chunks: int):
         self.total_chunks = total_chunks
 
     def update_file_finished_chunk(self):
-        _get_tracker()[self.file_path].append(self)
+        _get_tracker()[self._tracker_key()].append(self)
 
     def is_file_finished(self):
         return (
-            len(_get_tracker()[self.file_path])
+            len(_get_tracker()[self._tracker_key()])
             == self.total_chunks
         )
 
     def get_file_finished_chunks(self):
-        return _get_tracker()[self.file_path]
+        return _get_tracker()[self._tracker_key()]
 
     @staticmethod
     def clear_file_finished_chunk():
@@ -174,6 +205,85 @@ class DictionaryCountSplitter(InputSplitter):
         return result
 
 
+class TokenCountSplitter(InputSplitter):
+    """
+    基于token数的分割器，每个分割块的原文估算token数不超过指定值。
+    """
+
+    def __init__(self, token_count: int, cross_num: int = 0):
+        """
+        初始化分割器。
+
+        参数:
+        token_count: 每个分割块的原文token预算
+        """
+        self.token_count = token_count
+        self.cross_num = cross_num
+
+    @staticmethod
+    def _item_tokens(item: Dict) -> int:
+        if not isinstance(item, dict):
+            return LINE_OVERHEAD_TOKENS
+        name = item.get("name", "")
+        return (
+            estimate_tokens(str(item.get("message", "") or ""))
+            + estimate_tokens(name if isinstance(name, str) else "")
+            + LINE_OVERHEAD_TOKENS
+        )
+
+    def split(
+        self, json_list: List[Dict], file_path: str = ""
+    ) -> List[SplitChunkMetadata]:
+        """
+        实现分割方法，按累计token数分割，单句超出预算时独占一块。
+
+        参数:
+        content: 要分割的内容
+        cross_num: 交叉句子的数量
+
+        返回:
+        分割后的SplitChunkMetadata列表
+        """
+
+        total_items = len(json_list)
+        bounds = []
+        start = 0
+        used = 0
+        for idx, item in enumerate(json_list):
+            tokens = self._item_tokens(item)
+            if idx > start and used + tokens > self.token_count:
+                bounds.append((start, idx))
+                start = idx
+                used = 0
+            used += tokens
+        if start < total_items:
+            bounds.append((start, total_items))
+
+        result = []
+        for start, end in bounds:
+            chunk_start = max(0, start - self.cross_num)
+            chunk_end = min(total_items, end + self.cross_num)
+            chunk = json_list[chunk_start:chunk_end]
+            result.append(
+                SplitChunkMetadata(
+                    chunk_index=len(result),
+                    start_index=start,
+                    end_index=end,
+                    chunk_non_cross_size=end - start,
+                    chunk_size=len(chunk),
+                    cross_num=self.cross_num,
+                    json_list=chunk,
+                    file_path=file_path,
+                )
+            )
+
+        # 更新总块数
+        for chunk in result:
+            chunk.update_total_chunks(len(result))
+
+        return result
+
+
 class EqualPartsSplitter(InputSplitter):
     """
     将输入内容平均分割成指定数量的部分。
@@ -7,8 +7,8 @@ from GalTransl import LOGGER
 from typing import List
 import orjson
 import os,shutil
+import difflib
 from GalTransl.i18n import get_text,GT_LANG
-import aiofiles
 
 # 缓存JSON key映射：新key -> 旧key（用于兼容读取旧缓存）
 _CACHE_KEY_COMPAT = {
@@ -119,6 +119,8 @@ def _build_cache_dict_from_snapshot(cache_list: list) -> tuple[dict, list[str]]:
 
 
 async def _compact_cache_from_append(cache_file_path: str, append_file_path: str) -> None:
+    import aiofiles
+
     cache_list = []
     if os.path.exists(cache_file_path):
         async with aiofiles.open(cache_file_path, mode="rb") as f:
@@ -184,6 +186,28 @@ async def compact_cache_append_logs(cache_dir: str) -> int:
     return compacted_count
 
 
+def _apply_cache_obj(tran, cache_obj: dict) -> None:
+    """把缓存条目的译文写回句子，post_zh 初始值取校对译文或 pre_dst"""
+    tran.pre_zh = _cache_get(cache_obj, "pre_dst")
+    if "trans_by" in cache_obj:
+        tran.trans_by = cache_obj["trans_by"]
+    if _cache_has(cache_obj, "proofread_dst"):
+        tran.proofread_zh = _cache_get(cache_obj, "proofread_dst")
+    if "proofread_by" in cache_obj:
+        tran.proofread_by = cache_obj["proofread_by"]
+    if "trans_conf" in cache_obj:
+        tran.trans_conf = cache_obj["trans_conf"]
+    if "doub_content" in cache_obj:
+        tran.doub_content = cache_obj["doub_content"]
+    if "unknown_proper_noun" in cache_obj:
+        tran.unknown_proper_noun = cache_obj["unknown_proper_noun"]
+
+    if tran.proofread_zh != "":
+        tran.post_zh = tran.proofread_zh
+    else:
+        tran.post_zh = tran.pre_zh
+
+
 async def save_transCache_to_json(trans_list: CTransList, cache_file_path, post_save=False):
     """
     此函数将翻译缓存保存到 JSON 文件中。
@@ -194,6 +218,8 @@ async def save_transCache_to_json(trans_list: CTransList, cache_file_path, post_
         cache_file_path (str): 要保存到的 JSON 文件的路径。
         post_save (bool, optional): 是否是翻译结束后的存储。默认为 False。
     """
+    import aiofiles
+
     if not cache_file_path.endswith(".json"):
         cache_file_path += ".json"
 
@@ -271,6 +297,8 @@ async def get_transCache_from_json(
     Returns:
         Tuple[List[CTrans], List[CTrans]]: 包含两个列表的元组：击中缓存的翻译列表和未击中缓存的翻译列表。
     """
+    import aiofiles
+
     if not cache_file_path.endswith(".json"):
         if not os.path.exists(cache_file_path):
             cache_file_path += ".json"
@@ -416,24 +444,7 @@ async def get_transCache_from_json(
                         continue
 
         # 击中缓存的,post_zh初始值赋pre_dst
-        tran.pre_zh = _cache_get(cache_dict[cache_key], "pre_dst")
-        if "trans_by" in cache_dict[cache_key]:
-            tran.trans_by = cache_dict[cache_key]["trans_by"]
-        if _cache_has(cache_dict[cache_key], "proofread_dst"):
-            tran.proofread_zh = _cache_get(cache_dict[cache_key], "proofread_dst")
-        if "proofread_by" in cache_dict[cache_key]:
-            tran.proofread_by = cache_dict[cache_key]["proofread_by"]
-        if "trans_conf" in cache_dict[cache_key]:
-            tran.trans_conf = cache_dict[cache_key]["trans_conf"]
-        if "doub_content" in cache_dict[cache_key]:
-            tran.doub_content = cache_dict[cache_key]["doub_content"]
-        if "unknown_proper_noun" in cache_dict[cache_key]:
-            tran.unknown_proper_noun = cache_dict[cache_key]["unknown_proper_noun"]
-
-        if tran.proofread_zh != "":
-            tran.post_zh = tran.proofread_zh
-        else:
-            tran.post_zh = tran.pre_zh
+        _apply_cache_obj(tran, cache_dict[cache_key])
 
         # 校对模式下，未校对的
         if proofread and tran.proofread_zh == "":
@@ -467,3 +478,126 @@ def check_retran_key(retran_key, target):
     elif isinstance(retran_key, list):
         return any(key in target for key in retran_key if key)
     return False
+
+
+# 相邻分片快照的交叉部分最多按这么多句去重
+_MAX_CROSS_OVERLAP = 64
+
+
+def _read_cache_snapshot(cache_file_path: str) -> list:
+    try:
+        with open(cache_file_path, "rb") as f:
+            cache_list = orjson.loads(f.read())
+    except Exception:
+        return []
+    return [cache for cache in cache_list if isinstance(cache, dict)] if isinstance(cache_list, list) else []
+
+
+def _cache_seq_key(cache: dict) -> str:
+    return _cache_get(cache, "pre_src", "") or ""
+
+
+def load_file_cache_sequence(cache_dir: str, file_name: str, taken_names=()) -> list:
+    """
+    按原文顺序读取某个输入文件上一次的全部缓存快照（不分片的 `file_name.json` 或分片的 `file_name_N.json`）。
+
+    相邻分片快照中重复的交叉句只保留一份。taken_names 为本次其他输入文件的缓存名，
+    用于排除 `file_name_N` 恰好是另一个文件的情况。
+    """
+    base_path = os.path.join(cache_dir, file_name + ".json")
+    parts = []
+    prefix = file_name + "_"
+    try:
+        names = os.listdir(cache_dir)
+    except OSError:
+        return []
+    for name in names:
+        if not name.startswith(prefix) or not name.endswith(".json"):
+            continue
+        part = name[len(prefix) : -len(".json")]
+        if part.isdigit() and name[: -len(".json")] not in taken_names:
+            parts.append((int(part), os.path.join(cache_dir, name)))
+    parts.sort()
+
+    # 分片与不分片的快照同时存在时取较新的一组
+    if parts and os.path.exists(base_path):
+        newest_part = max(os.path.getmtime(path) for _, path in parts)
+        if os.path.getmtime(base_path) >= newest_part:
+            parts = []
+    if not parts:
+        return _read_cache_snapshot(base_path) if os.path.exists(base_path) else []
+
+    sequence: list = []
+    for _, path in parts:
+        snapshot = _read_cache_snapshot(path)
+        overlap = 0
+        for k in range(min(_MAX_CROSS_OVERLAP, len(sequence), len(snapshot)), 0, -1):
+            if [_cache_seq_key(c) for c in sequence[-k:]] == [_cache_seq_key(c) for c in snapshot[:k]]:
+                overlap = k
+                break
+        sequence.extend(snapshot[overlap:])
+    return sequence
+
+
+def align_cache_sequence(old_sequence: list, new_sources: List[str], context: int = 1) -> dict:
+    """
+    行级对齐新原文序列与上一次的缓存序列。
+
+    返回 {new_sources 下标: 可沿用的缓存条目}：只包含对齐为"未改动"且与任何改动（替换/插入/删除）
+    相距超过 context 句的行。new_sources 中的空串不参与对齐。
+    """
+    new_positions = [i for i, src in enumerate(new_sources) if src]
+    new_keys = [new_sources[i] for i in new_positions]
+    old_keys = [_cache_seq_key(cache) for cache in old_sequence]
+    matcher = difflib.SequenceMatcher(None, old_keys, new_keys, autojunk=False)
+
+    dirty = [False] * len(new_keys)
+    carried = {}
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            for offset in range(j2 - j1):
+                carried[j1 + offset] = old_sequence[i1 + offset]
+            continue
+        # 删除没有对应的新行，改动点两侧的行同样视为上下文
+        for j in range(max(0, j1 - context), min(len(new_keys), j2 + context)):
+            dirty[j] = True
+    return {
+        new_positions[j]: cache for j, cache in carried.items() if not dirty[j]
+    }
+
+
+def carry_over_cache(
+    translist_unhit: CTransList,
+    carried: dict,
+    retry_failed=False,
+    retran_key="",
+):
+    """
+    为未命中缓存的句子沿用增量对齐得到的旧缓存条目。
+
+    carried 为 {id(tran): 缓存条目}。post_src 与当前 post_jp 不一致、pre_dst 为空、
+    需重试的失败句与命中 retran_key 的句子仍然重翻。
+
+    Returns:
+        Tuple[List[CTrans], List[CTrans]]: 沿用的句子与仍需翻译的句子。
+    """
+    translist_hit = []
+    translist_rest = []
+    for tran in translist_unhit:
+        cache_obj = carried.get(id(tran))
+        if cache_obj is None:
+            translist_rest.append(tran)
+            continue
+        pre_dst = _cache_get(cache_obj, "pre_dst", "") or ""
+        if (
+            pre_dst == ""
+            or tran.post_jp != _cache_get(cache_obj, "post_src")
+            or (retry_failed and "(Failed)" in pre_dst)
+            or (retran_key and check_retran_key(retran_key, _cache_get(cache_obj, "pre_src", "") or ""))
+            or (retran_key and check_retran_key(retran_key, cache_obj.get("problem", "") or ""))
+        ):
+            translist_rest.append(tran)
+            continue
+        _apply_cache_obj(tran, cache_obj)
+        translist_hit.append(tran)
+    return translist_hit, translist_rest
@@ -136,6 +136,12 @@ class CProjectConfig:
         self.tokenPool = None  # 令牌池
         self.proxyPool = None  # 代理池
         self.endpointQueue = None  # 端点队列
+        self.sakuraEndpoints = []  # 去重后的 Sakura 端点列表
+        self.cpu_executor = None  # 前/后处理线程池（doLLMTranslate 运行期间有效）
+        self.line_dedup = None  # 跨文件重复短句去重表（doLLMTranslate 运行期间有效）
+        self.transl_memory = None  # 翻译记忆
+        self.proofread_stage = None  # 校对阶段（doLLMTranslate 运行期间有效）
+        self.translation_targets = {}  # 各目标语言的缓存/输出目录、后端与字典（doLLMTranslate 运行期间有效）
         self.input_splitter = None  # 输入分割器
         self.active_workers: int=0
         self.target_lang=""
@@ -0,0 +1,126 @@
+"""
+跨文件的重复短句去重。
+
+字幕项目中「はい」「ありがとうございます」、OP/ED 歌词、固定台词等短句会在各文件中反复出现，
+而缓存 key 含前后句，每次出现都会单独请求一次。这里在 chunk 入队前把所有文件中规范化后
+相同的短句分组：每组只翻译第一次出现的句子（代表句），其余句子（跟随句）等代表句译完后
+直接复用其译文。长度超过 dedupMaxChars 的句子依赖上下文，不参与去重。
+
+代表句取调度顺序中的第一次出现，chunk 只会等待比自己更早出队的 chunk，不会互相等待。
+代表句翻译失败时跟随句各自回退为正常翻译。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import unicodedata
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+_SPACES = re.compile(r"\s+")
+_FAILED_MARKERS = ("(Failed)", "(翻译失败)")
+# 跟随句从代表句复制的字段
+_RESULT_FIELDS = (
+    "pre_zh",
+    "post_zh",
+    "proofread_zh",
+    "trans_by",
+    "proofread_by",
+    "trans_conf",
+    "doub_content",
+    "unknown_proper_noun",
+)
+
+
+def normalize_line(text: str) -> str:
+    """去重用的规范化：NFKC（全半角统一）并去掉所有空白（ASR 断句空格）"""
+    return _SPACES.sub("", unicodedata.normalize("NFKC", text))
+
+
+class DedupGroup:
+    __slots__ = ("key", "representative", "followers", "future")
+
+    def __init__(self, key: str, representative: Any) -> None:
+        self.key = key
+        self.representative = representative
+        self.followers: List[Any] = []
+        self.future: Optional[asyncio.Future] = None
+
+
+class LineDeduplicator:
+    def __init__(self, max_chars: int = 10) -> None:
+        self.max_chars = max_chars
+        self.groups: Dict[str, DedupGroup] = {}
+        # id(tran) → 所在的组（只登记有跟随句的组）
+        self._group_of: Dict[int, DedupGroup] = {}
+
+    def _dedup_key(self, tran) -> str:
+        if tran.pre_jp == "" or tran.pre_zh != "":
+            return ""
+        key = normalize_line(tran.pre_jp)
+        if not key or len(key) > self.max_chars:
+            return ""
+        return key
+
+    def add_chunks(self, chunks: Iterable[Any]) -> Tuple[int, int]:
+        """按调度顺序登记各 chunk 的非交叉部分，返回 (重复组数, 可省去的句数)"""
+        groups: Dict[str, DedupGroup] = {}
+        for chunk in chunks:
+            start, end = chunk.non_cross_range()
+            for tran in chunk.trans_list[start:end]:
+                key = self._dedup_key(tran)
+                if not key:
+                    continue
+                group = groups.get(key)
+                if group is None:
+                    groups[key] = DedupGroup(key, tran)
+                else:
+                    group.followers.append(tran)
+
+        loop = asyncio.get_running_loop()
+        saved = 0
+        for key, group in groups.items():
+            if not group.followers:
+                continue
+            group.future = loop.create_future()
+            self.groups[key] = group
+            self._group_of[id(group.representative)] = group
+            for tran in group.followers:
+                self._group_of[id(tran)] = group
+            saved += len(group.followers)
+        return len(self.groups), saved
+
+    def is_follower(self, tran) -> bool:
+        group = self._group_of.get(id(tran))
+        return group is not None and group.representative is not tran
+
+    def split_followers(self, trans_list: List[Any]) -> Tuple[List[Any], List[Any]]:
+        """把未命中列表拆成 (需要自己翻译的, 等待代表句的跟随句)"""
+        own, followers = [], []
+        for tran in trans_list:
+            (followers if self.is_follower(tran) else own).append(tran)
+        return own, followers
+
+    def resolve(self, trans_list: Iterable[Any]) -> None:
+        """登记 trans_list 中代表句的当前译文；没有可用译文的记为 None，跟随句将回退为正常翻译"""
+        for tran in trans_list:
+            group = self._group_of.get(id(tran))
+            if group is None or group.representative is not tran or group.future.done():
+                continue
+            result = None
+            if tran.pre_zh and not any(marker in tran.pre_zh for marker in _FAILED_MARKERS):
+                result = {field: getattr(tran, field) for field in _RESULT_FIELDS}
+            group.future.set_result(result)
+
+    async def fill_followers(self, followers: List[Any]) -> Tuple[List[Any], List[Any]]:
+        """等待各跟随句的代表句完成并复制译文，返回 (已填充, 需回退翻译)"""
+        filled, leftover = [], []
+        for tran in followers:
+            result = await asyncio.shield(self._group_of[id(tran)].future)
+            if result is None:
+                leftover.append(tran)
+                continue
+            for field, value in result.items():
+                setattr(tran, field, value)
+            filled.append(tran)
+        return filled, leftover
@@ -9,7 +9,7 @@ backendSpecific:
         endpoint: https://openrouter.ai/api/v1/chat/completions # /chat/completions结尾则不自动补v1
         modelName: deepseek/deepseek-chat-v3-0324:free
         stream: true # 支持为单个token设置流式请求
-    tokenStrategy: "random" # 令牌策略，random随机轮询；fallback优先第一个，出现[API错误]或[解析错误]时使用下一个
+    tokenStrategy: "random" # 令牌策略，random随机轮询；fallback优先第一个，出现[API错误]或[解析错误]时使用下一个；adaptive按实时延迟/在途数/错误率分配并摘除故障key
     checkAvailable: true # 翻译前检查API是否可用[True/False]
     checkAvailableConcurrency: 4 # checkAvailable阶段的并发检测数，避免启动时瞬时打满请求。[1-16]
     globalRequestRPM: 0 # 全局跨任务请求限速（每分钟请求数）。0表示不限制。[0-60000]
@@ -22,6 +22,7 @@ backendSpecific:
       - http://127.0.0.1:8080
       #- https://sakura-share.one/ # 可以使用sakura-share的免费sakura-v1.0模型
     rewriteModelName: "" # 设置自定义的模型名称，在使用ollama时要修改
+    tokenStrategy: "random" # 多个endpoints间的分配策略，random随机；adaptive按实时延迟/在途数/错误率分配并摘除故障端点
 
 # 插件，插件列表可在启动程序后选择show-plugs查看，或在plugins目录内查看
 plugin:
@@ -37,14 +38,25 @@ plugin:
 common:
   gpt.numPerRequestTranslate: 16 # 每次请求包含的句子数，建议不超过16。[1-32]
   workersPerProject: 16 # 项目级并行文件数；单文件并行需配合splitFile。
-  autoAdjustWorkers: true # 基于近期429比例和响应延迟自动调节并发worker数。[True/False]
-  sortBy: "size" # 文件调度顺序：name按文件名，size优先大文件（并行时通常更快）。[name/size]
+  autoAdjustWorkers: true # 基于近期429比例和响应延迟自动调节并发worker数；开启endpointAdaptiveConcurrency后改由其接管。[True/False]
+  gpt.hedgeRequests: false # 对冲请求：请求超过近期p95延迟仍未返回时向另一个同模型key/端点再发一份，先返回者胜出（流式请求仅覆盖首包前）。[True/False]
+  gpt.hedgeMaxRatio: 0.05 # 对冲请求占总请求数的上限，用于控制额外花费。[0-1]
+  endpointAdaptiveConcurrency: false # 按端点+key分别自适应并发（AIMD），遵守Retry-After等限流响应头，慢或被限流的key不拖累其他key；开启后autoAdjustWorkers不生效。[True/False]
+  sortBy: "size" # 文件调度顺序：name按文件名，size优先大文件（并行时通常更快），fair每个文件尽早出结果并按优先级分层。[name/size/fair]
+  filePriority: {} # (fair) 文件优先级，{通配符: 数字}，数字大的先翻，如 {"ep01*": 10}；未匹配的为0。
+  dedupShortLines: true # 跨文件重复短句去重：规范化后相同的短句（如「はい」、OP/ED歌词）只翻译一次，其余出现处复用译文。[True/False]
+  dedupMaxChars: 10 # 参与去重的短句最大字数；更长的句子依赖上下文，仍逐句翻译。
+  translMemory: true # 翻译记忆：收录已完成文件的译文，未命中缓存的相似句直接复用或作为参考译文提供给模型。[True/False]
+  translMemoryPath: "" # 翻译记忆文件路径，留空为项目目录下的transl_memory.jsonl；多个项目（如同一系列的各集）可指向同一文件共享，各条目按目标语言与翻译引擎区分。
+  translMemoryReuse: true # 原文规范化（全半角统一、去空白）后完全相同的句子直接复用记忆中的译文；只有标点不同的句子与相似句不直接复用，只按translMemoryHint作为参考。[True/False]
+  translMemoryHint: 0.6 # 相似度不低于该值的相似句作为参考译文附在术语表后；0关闭。[0-1]
   language: "zh-cn" # 目标输出语言。[zh-cn/zh-tw/en/ja/ko/ru/fr]
+  extraTargetLanguages: [] # 额外的目标语言，如 [en, zh-tw]：读取、分片、前处理只做一次，各目标语言分别请求，缓存与输出写入 transl_cache_<语言>、gt_output_<语言>；gpt字典、后处理字典与name替换表只用同目录下的 <文件名>_<语言> 版本（如 项目GPT字典_en.txt、name替换表_en.csv），不沿用language的。
 
   # 单文件分割设置
   ###【重要】分割设置直接影响缓存文件的读取命中，迁移旧项目请确保单文件分割设置一致 ###
-  splitFile: "Num" # 单文件分片模式：no关闭；Num每n句切一片；Equal每文件均分n片。[no/Num/Equal]
-  splitFileNum: 2048 # 分片参数：Num模式表示每片句数；Equal模式表示分片总数。
+  splitFile: "Num" # 单文件分片模式：no关闭；Num每n句切一片；Equal每文件均分n片；Token每片约n个原文token。[no/Num/Equal/Token]
+  splitFileNum: 2048 # 分片参数：Num模式表示每片句数；Equal模式表示分片总数；Token模式表示每片token数。
   splitFileCrossNum: 0 # 分片重叠句数（上下文缓冲），可提升片段衔接质量。[推荐0或10]
 
   save_steps: 1 # 每处理n个批次保存一次缓存；值越大保存更少、速度可能更快。[1-999]
@@ -52,6 +64,8 @@ common:
   linebreakSymbol: "auto" # JSON内换行符类型，供问题检测/自动修复使用，不改变翻译语义。
   skipH: false # 是否跳过可能触发敏感词检测的句子。[True/False]
   smartRetry: True # 解析失败时自动缩小批次并重置上下文，减少无效重试。[True/False]
+  incrementalRetransl: true # 增量重翻：输入文件改动后与上次的缓存做行级对齐，只重翻改动的行及其上下文，其余沿用旧译文。[True/False]
+  incrementalContext: 1 # 增量重翻时改动行前后一并重翻的句数；0为只重翻改动行。
   retranslFail: false # 程序重启时是否自动重翻标记为"(Failed)"的句子。[True/False]
   retranslKey: # 在下方添加需要重翻的关键字，匹配原文/译文/problem 中的子串；留空不重翻。
     #- "翻译失败" # 启动时重翻命中“翻译失败”的句子
@@ -63,8 +77,13 @@ common:
   gpt.enhance_jailbreak: False # 是否启用“抗拒答”增强提示，降低模型拒答概率。[True/False]
   gpt.change_prompt: "no" # Prompt修改模式：no不改；AdditionalPrompt追加；OverwritePrompt覆盖默认提示词。[no/AdditionalPrompt/OverwritePrompt]
   gpt.prompt_content: "翻译结果使用文言文" # Prompt自定义内容；仅在change_prompt为AdditionalPrompt/OverwritePrompt时生效。
+  gpt.enableProofRead: false # (ForGal-json/r1) 译后校对：chunk译完后交给独立的校对阶段，与后续chunk的翻译并行。[True/False]
+  gpt.numPerRequestProofRead: 8 # 每次校对请求包含的句子数。[1-32]
+  gpt.proofReadWorkers: 0 # 校对阶段的并发数，不占用翻译并发；0表示与workersPerProject相同。
+  gpt.proofReadOnlyProblems: false # 只校对问题检测（problemAnalyze）标记出问题的句子。[True/False]
   # Sakura/GalTransl
-  gpt.token_limit: 0 # (Sakura/GalTransl) 单轮token上限；0表示不限制。用于避免上下文溢出。
+  gpt.token_limit: 0 # 单次请求输入token预算（含提示词、术语表、上文）；大于0时按预算打包句子（每次不超过numPerRequestTranslate句，且最多64句），0表示按numPerRequestTranslate句数切分。
+  gpt.outputTokenLimit: 0 # 单次请求输出token预算（按原文长度估算译文）；0表示不限制。
   # 调试日志
   loggingLevel: info # 日志输出级别：debug详细，info常规，warning仅警告。[debug/info/warning]
   saveLog: false # 是否将日志写入文件。[True/False]
@@ -1,5 +1,6 @@
 from typing import List
-from os import path
+from os import path, stat
+from collections import OrderedDict
 from GalTransl.CSentense import CSentense, CTransList
 from GalTransl import LOGGER
 from GalTransl.Utils import process_escape
@@ -480,3 +481,34 @@ class CGptDict:
                 )
 
         return ", ".join(problem_list)
+
+
+_DIC_CACHE: "OrderedDict[tuple, object]" = OrderedDict()
+DIC_CACHE_SIZE = 16  # 最多保留的已解析字典组数
+
+
+def _dic_file_stamp(dic_path: str):
+    try:
+        st = stat(dic_path)
+    except OSError:
+        return (dic_path, None, None)
+    return (dic_path, st.st_mtime_ns, st.st_size)
+
+
+def load_dic_cached(dic_class, dic_paths: list, sort: bool):
+    """载入字典并按 (文件路径, 修改时间, 大小) 缓存解析结果。
+
+    字典载入后只读，常驻翻译进程的后续任务直接复用同一对象；任一文件改动即重新解析。
+    """
+    key = (dic_class.__name__, tuple(_dic_file_stamp(p) for p in dic_paths), sort)
+    dic = _DIC_CACHE.get(key)
+    if dic is not None:
+        _DIC_CACHE.move_to_end(key)
+        return dic
+    dic = dic_class(dic_paths)
+    if sort:
+        dic.sort_dic()
+    _DIC_CACHE[key] = dic
+    while len(_DIC_CACHE) > DIC_CACHE_SIZE:
+        _DIC_CACHE.popitem(last=False)
+    return dic
@@ -0,0 +1,68 @@
+"""
+机器可读的翻译事件流（JSONL）。
+
+GALTRANSL_EVENTS 环境变量选择输出通道：
+- "stdout"：每个事件写成一行 EVENT_PREFIX + JSON，前端按前缀识别，无需解析人类可读日志
+- 其他非空值：视为文件路径，逐行追加 JSON，便于无界面运行与基准测试读取
+未设置时 emit 为空操作。
+
+事件类型：lines（逐句结果）、progress（文件进度）、usage（token 用量）、
+error（请求失败与重试）、job（任务结束状态）。
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from threading import Lock
+from typing import Any, Iterable
+
+EVENT_PREFIX = "@@GT_EVENT "
+
+_lock = Lock()
+
+
+def _target() -> str:
+    return os.environ.get("GALTRANSL_EVENTS", "").strip()
+
+
+def enabled() -> bool:
+    return bool(_target())
+
+
+def emit(event: str, **fields: Any) -> None:
+    target = _target()
+    if not target:
+        return
+    payload = {"event": event, "ts": round(time.time(), 3), **fields}
+    line = json.dumps(payload, ensure_ascii=False, default=str)
+    with _lock:
+        try:
+            if target == "stdout":
+                sys.stdout.write(EVENT_PREFIX + line + "\n")
+                sys.stdout.flush()
+            else:
+                with open(target, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+        except (OSError, ValueError):
+            pass
+
+
+def emit_results(filename: str, trans_list: Iterable[Any], done: int, total: int) -> None:
+    """发送一批翻译结果及该文件的进度"""
+    if not enabled():
+        return
+    lines = []
+    for tran in trans_list:
+        lines.append(
+            {
+                "id": tran.index,
+                "speaker": tran.get_speaker_name(),
+                "src": tran.post_jp,
+                "dst": tran.proofread_zh if tran.proofread_zh != "" else tran.post_zh,
+            }
+        )
+    emit("lines", file=filename, lines=lines)
+    emit("progress", file=filename, done=done, total=total)
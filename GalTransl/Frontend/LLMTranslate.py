@@ -2,10 +2,11 @@
 
 该模块把项目配置转化为一轮完整的翻译流水线：
 1. 读取输入文件 → 通过文件插件解析为 trans_list
-2. 按 splitter 切成多个 chunk，按 name/size 排序
+2. 按 splitter 切成多个 chunk，交给 sortBy 选定的调度器（name/size/fair），并对跨文件的重复短句分组去重；
+   设置了 extraTargetLanguages 时每个额外目标语言复制一份 chunk，同一分片的前处理只做一次
 3. 载入字典 / name 替换表 / 初始化后端 gptapi
-4. 启动 worker 协程池（带信号量 + 自适应并发调节）消费 chunk 队列
-5. 每个 chunk：前处理 → 读缓存命中判定 → 调 gptapi.batch_translate →（可选）校对 → 后处理
+4. 启动 worker 协程池（带信号量 + 自适应并发调节）从调度器取 chunk
+5. 每个 chunk：前处理 → 读缓存命中判定 → 调 gptapi.batch_translate →（可选）交给独立并发的校对阶段 → 后处理
 6. 文件全部 chunk 完成后：find_problems + 写完整快照缓存(post_save) + 合并输出 + 通过文件插件保存
 
 注：启动时不再做全局 jsonl 合并，仅在单文件完成时通过 `save_transCache_to_json(..., post_save=True)`
@@ -14,29 +15,40 @@
 
 from typing import List, Dict, Any, Optional, Union, Tuple
 from os import makedirs, cpu_count, sep as os_sep,listdir
-from os.path import join as joinpath, exists as isPathExists, dirname
+from os.path import join as joinpath, exists as isPathExists, dirname, splitext
 from venv import logger
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from time import time
 import asyncio
+import copy
 from dataclasses import dataclass
+from functools import partial
 
-from GalTransl import LOGGER, NEED_OpenAITokenPool
+from GalTransl import LOGGER, NEED_OpenAITokenPool, LANG_SUPPORTED
 from GalTransl.i18n import get_text, GT_LANG
-from GalTransl.Cache import get_transCache_from_json
+from GalTransl.Cache import (
+    align_cache_sequence,
+    carry_over_cache,
+    get_transCache_from_json,
+    load_file_cache_sequence,
+)
 from GalTransl.ConfigHelper import initDictList, CProjectConfig
 from GalTransl.Dictionary import CGptDict, CNormalDic
 from GalTransl.Problem import find_problems
 from GalTransl.Cache import save_transCache_to_json
 from GalTransl.Name import load_name_table, dump_name_table_from_chunks
 from GalTransl.CSerialize import update_json_with_transList, save_json
-from GalTransl.Dictionary import CNormalDic, CGptDict
+from GalTransl.Dictionary import CNormalDic, CGptDict, load_dic_cached
 from GalTransl.ConfigHelper import CProjectConfig, initDictList
 from GalTransl.Utils import get_file_list
 from GalTransl.CSplitter import (
     SplitChunkMetadata,
     DictionaryCombiner,
 )
+from GalTransl.Scheduler import create_scheduler, resolve_priorities
+from GalTransl.Dedup import LineDeduplicator
+from GalTransl.TranslationMemory import MEMORY_FILE_NAME, load_translation_memory
+from GalTransl import Events
 from GalTransl.TerminalOutput import should_print_translation_logs, terminal_progress
 
 
@@ -110,6 +122,62 @@ class AdaptiveWorkerState:
     effective_workers: int
 
 
+@dataclass
+class TranslationTarget:
+    """一个目标语言的运行时状态；lang 为空表示项目的目标语言（language）。
+
+    额外目标语言的缓存与输出写入 transl_cache_<lang>、gt_output_<lang>；
+    字典与 name 替换表见 target_dict_paths。
+    """
+    lang: str
+    cache_dir: str
+    output_dir: str
+    gptapi: Any = None
+    gpt_dic: Optional[CGptDict] = None
+    post_dic: Optional[CNormalDic] = None
+    name_replaceDict: Optional[dict] = None
+    line_dedup: Optional[LineDeduplicator] = None
+    transl_memory: Any = None
+
+
+class SharedPreprocess:
+    """同一分片在各目标语言间共用的前处理结果：先取到锁的 chunk 做前处理，其余复制"""
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.snapshot = None
+
+
+class ProofreadStage:
+    """校对阶段：chunk 译完后提交到这里，按独立的并发预算校对，翻译 worker 不等待校对完成。
+
+    - workers: 校对请求的并发上限，不占用翻译信号量
+    - only_problems: 只校对 find_problems 标记出问题的句子
+    """
+
+    def __init__(self, workers: int, only_problems: bool = False):
+        self.semaphore = asyncio.Semaphore(max(1, workers))
+        self.only_problems = only_problems
+        self._tasks: List[asyncio.Task] = []
+
+    def submit(self, coro) -> None:
+        self._tasks.append(asyncio.create_task(coro))
+
+    async def join(self) -> None:
+        """等待已提交的校对全部完成；任一失败则取消其余并抛出"""
+        try:
+            await asyncio.gather(*self._tasks)
+        except BaseException:
+            await self.cancel()
+            raise
+
+    async def cancel(self) -> None:
+        for task in self._tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
 async def auto_tune_workers(
     projectConfig: CProjectConfig,
     adaptive_state: AdaptiveWorkerState,
@@ -148,6 +216,18 @@ async def auto_tune_workers(
             await apply_limit(target)
 
 
+async def _run_cpu_stage(projectConfig: CProjectConfig, func, *args):
+    """在 cpu_executor 中执行 CPU 密集的前/后处理，避免阻塞事件循环上的网络 I/O。
+
+    executor 只有一个线程：文本插件与字典未按并发设计，这里保持与原先一致的串行执行。
+    未设置 executor（如单独调用）时直接在当前线程执行。
+    """
+    executor = getattr(projectConfig, "cpu_executor", None)
+    if executor is None:
+        return func(*args)
+    return await asyncio.get_running_loop().run_in_executor(executor, partial(func, *args))
+
+
 def _check_stop_requested(projectConfig: CProjectConfig):
     """协作式取消检查点：若桌面端/服务端触发 stop_event，则抛出 JobCancelledError 中止当前任务。
 
@@ -160,6 +240,106 @@ def _check_stop_requested(projectConfig: CProjectConfig):
         raise JobCancelledError()
 
 
+def target_dict_paths(paths: List[str], lang: str) -> List[str]:
+    """额外目标语言使用的字典文件：只取同目录下存在的 <文件名>_<lang><扩展名>。
+
+    不沿用项目目标语言的字典：其中的译文是项目目标语言，混入其他语言的提示词或译文只会出错。
+    """
+    result = []
+    for path in paths:
+        root, ext = splitext(path)
+        variant = f"{root}_{lang}{ext}"
+        if isPathExists(variant):
+            result.append(variant)
+    return result
+
+
+def resolve_extra_target_langs(projectConfig: CProjectConfig) -> List[str]:
+    """读取 extraTargetLanguages（列表或逗号分隔），去掉重复项、项目目标语言与不支持的语言"""
+    value = projectConfig.getKey("extraTargetLanguages", []) or []
+    if isinstance(value, str):
+        value = value.split(",")
+    langs = []
+    for lang in value:
+        lang = str(lang).strip()
+        if not lang or lang == projectConfig.target_lang or lang in langs:
+            continue
+        if lang not in LANG_SUPPORTED:
+            LOGGER.warning(f"不支持的额外目标语言 {lang}，已跳过")
+            continue
+        langs.append(lang)
+    return langs
+
+
+def _target_dir(path: str, lang: str) -> str:
+    """额外目标语言的缓存/输出目录：与原目录同级，加 _<lang> 后缀"""
+    return path.rstrip("/\\") + f"_{lang}"
+
+
+def _chunk_target(projectConfig: CProjectConfig, chunk: SplitChunkMetadata) -> TranslationTarget:
+    """chunk 所属目标语言的运行时状态；未经 doLLMTranslate 初始化时按项目目标语言构造"""
+    targets = getattr(projectConfig, "translation_targets", None) or {}
+    target = targets.get(chunk.target_lang)
+    if target is None:
+        target = TranslationTarget(
+            "",
+            projectConfig.getCachePath(),
+            projectConfig.getOutputPath(),
+            gpt_dic=projectConfig.gpt_dic,
+            post_dic=projectConfig.post_dic,
+            name_replaceDict=projectConfig.name_replaceDict,
+            line_dedup=getattr(projectConfig, "line_dedup", None),
+            transl_memory=getattr(projectConfig, "transl_memory", None),
+        )
+    return target
+
+
+def _cache_file_name(file_path: str, input_dir: str) -> str:
+    """输入文件对应的缓存文件名（多级目录以 -} 连接，不含分片后缀）"""
+    return file_path.replace(input_dir, "").lstrip(os_sep).replace(os_sep, "-}")
+
+
+def prepare_incremental_carry_over(
+    chunks: List[SplitChunkMetadata], cache_dir: str, input_dir: str, context: int = 1
+) -> Tuple[int, int]:
+    """增量重翻：逐文件把新原文与上一次的缓存快照做行级对齐，结果写入各 chunk 的 carry_over。
+
+    输入文件重新生成后（重跑 ASR、手改某段），改动行的前后句缓存 key 随之变化，
+    分片边界也会移动；对齐后只有改动行及其前后 context 句需要重翻。
+    返回 (可沿用的句数, 需重翻的句数)。
+    """
+    file_chunks: Dict[str, List[SplitChunkMetadata]] = {}
+    for chunk in chunks:
+        file_chunks.setdefault(chunk.file_path, []).append(chunk)
+    taken_names = {_cache_file_name(file_path, input_dir) for file_path in file_chunks}
+
+    total_carried = 0
+    total_changed = 0
+    for file_path, parts in file_chunks.items():
+        old_sequence = load_file_cache_sequence(
+            cache_dir, _cache_file_name(file_path, input_dir), taken_names
+        )
+        if not old_sequence:
+            continue
+        parts.sort(key=lambda x: x.start_index)
+        new_sources = []
+        for chunk in parts:
+            start, end = chunk.non_cross_range()
+            new_sources.extend(tran.pre_jp for tran in chunk.trans_list[start:end])
+        carried = align_cache_sequence(old_sequence, new_sources, context)
+        for chunk in parts:
+            # 交叉句与相邻 chunk 的非交叉部分对应同一文件位置
+            chunk_start = chunk.start_index - chunk.non_cross_range()[0]
+            chunk.carry_over = {
+                id(tran): carried[chunk_start + offset]
+                for offset, tran in enumerate(chunk.trans_list)
+                if chunk_start + offset in carried
+            }
+        total_carried += len(carried)
+        total_changed += sum(1 for src in new_sources if src) - len(carried)
+    return total_carried, total_changed
+
+
 def _build_runtime_file_maps(ordered_chunks: list[SplitChunkMetadata], input_dir: str) -> tuple[dict[str, int], dict[str, str]]:
     """构造两个给前端使用的映射：
 
@@ -276,6 +456,48 @@ def preprocess_trans_list(trans_list, projectConfig, pre_dic, tPlugins=None):
                     )
 
 
+def _snapshot_preprocessed(trans_list) -> List[Dict[str, Any]]:
+    """记录前处理后各句的全部字段（不含前后句链接），供其他目标语言的同一分片复制"""
+    return [
+        {
+            key: copy.copy(value)
+            for key, value in tran.__dict__.items()
+            if key not in ("prev_tran", "next_tran")
+        }
+        for tran in trans_list
+    ]
+
+
+def _apply_preprocessed(trans_list, snapshot: List[Dict[str, Any]]) -> None:
+    for tran, fields in zip(trans_list, snapshot):
+        tran.__dict__.update({key: copy.copy(value) for key, value in fields.items()})
+
+
+def _preprocess_and_snapshot(trans_list, projectConfig, pre_dic, tPlugins=None):
+    preprocess_trans_list(trans_list, projectConfig, pre_dic, tPlugins)
+    return _snapshot_preprocessed(trans_list)
+
+
+async def _preprocess_chunk(
+    split_chunk: SplitChunkMetadata, projectConfig: CProjectConfig, pre_dic, tPlugins=None
+):
+    """前处理；多目标语言时同一分片只做一次，其余目标语言的 chunk 直接复制结果"""
+    shared = split_chunk.shared_preprocess
+    if shared is None:
+        await _run_cpu_stage(
+            projectConfig, preprocess_trans_list, split_chunk.trans_list, projectConfig, pre_dic, tPlugins
+        )
+        return
+    async with shared.lock:
+        if shared.snapshot is None:
+            # 在前处理完成的同时取快照：本 chunk 随后写入的译文不会带给其他目标语言
+            shared.snapshot = await _run_cpu_stage(
+                projectConfig, _preprocess_and_snapshot, split_chunk.trans_list, projectConfig, pre_dic, tPlugins
+            )
+            return
+    await _run_cpu_stage(projectConfig, _apply_preprocessed, split_chunk.trans_list, shared.snapshot)
+
+
 def postprocess_trans_list(trans_list, projectConfig, post_dic, tPlugins=None):
     """翻译后处理：插件before_dst → 恢复对话符号 → 后处理字典替换译文 → 插件after_dst"""
     for tran in trans_list:
@@ -410,33 +632,79 @@ async def doLLMTranslate(
         await gptapi.batch_translate(all_jsons)
         return True
 
-    # ---- 3. 根据 sortBy 决定 chunk 处理顺序 ----
+    # ---- 2.6 多目标语言：每个额外目标语言复制一份 chunk，读取、分片与前处理只做一次 ----
+    targets: Dict[str, TranslationTarget] = {"": TranslationTarget("", cache_dir, output_dir)}
+    target_chunks = total_chunks
+    extra_target_langs = resolve_extra_target_langs(projectConfig)
+    if extra_target_langs:
+        for lang in extra_target_langs:
+            targets[lang] = TranslationTarget(
+                lang, _target_dir(cache_dir, lang), _target_dir(output_dir, lang)
+            )
+            makedirs(targets[lang].cache_dir, exist_ok=True)
+            makedirs(targets[lang].output_dir, exist_ok=True)
+        target_chunks = []
+        for chunk in total_chunks:
+            chunk.shared_preprocess = SharedPreprocess()
+            target_chunks.append(chunk)
+            for lang in extra_target_langs:
+                variant = chunk.for_target_lang(lang)
+                variant.shared_preprocess = chunk.shared_preprocess
+                target_chunks.append(variant)
+        LOGGER.info(f"额外目标语言：{', '.join(extra_target_langs)}")
+    projectConfig.translation_targets = targets
+
+    # ---- 3. 根据 sortBy 选择 chunk 调度器 ----
     # name: 按文件名自然序，文件内按 chunk_index 顺序（方便观察进度）
     # size: 按 chunk 大小倒序（让大 chunk 先进入队列，平滑尾部长尾）
-    soryBy = projectConfig.getKey("sortBy", "name")
-    if soryBy == "name":
-        # 按文件分组chunks，保持文件内部的顺序
-        file_chunks = {}
-        for chunk in total_chunks:
-            if chunk.file_path not in file_chunks:
-                file_chunks[chunk.file_path] = []
-            file_chunks[chunk.file_path].append(chunk)
-
-        # 确保每个文件内的chunks按索引排序
-        for file_path in file_chunks:
-            file_chunks[file_path].sort(key=lambda x: x.chunk_index)
-
-        # 按照file_list的顺序处理文件，保持文件间的顺序
-        ordered_chunks = []
-        for file_path in file_list:
-            if file_path in file_chunks:
-                ordered_chunks.extend(file_chunks[file_path])
-    elif soryBy == "size":
-        total_chunks.sort(key=lambda x: x.chunk_size, reverse=True)
-        ordered_chunks = total_chunks
+    # fair: 按 filePriority 分层，pop 时动态选择：未开始的小文件先发首块，再按剩余工作量最少的文件，尾部按耗时从大到小
+    chunk_scheduler = create_scheduler(
+        projectConfig.getKey("sortBy", "name"),
+        target_chunks,
+        file_list,
+        resolve_priorities(file_list, projectConfig.getKey("filePriority", {}), input_dir),
+        workers=workersPerProject,
+    )
+    ordered_chunks = list(chunk_scheduler)
+
+    # ---- 3.4 增量重翻：与上一次的缓存做行级对齐，只重翻改动行及其上下文 ----
+    if projectConfig.getKey("incrementalRetransl", True) and "rebuild" not in eng_type:
+        carried_lines, changed_lines = 0, 0
+        for lang, target in targets.items():
+            carried, changed = prepare_incremental_carry_over(
+                [chunk for chunk in ordered_chunks if chunk.target_lang == lang],
+                target.cache_dir,
+                input_dir,
+                max(0, int(projectConfig.getKey("incrementalContext", 1) or 0)),
+            )
+            carried_lines += carried
+            changed_lines += changed
+        if carried_lines:
+            LOGGER.info(f"[cache]增量对齐：沿用 {carried_lines} 句，{changed_lines} 句需要翻译")
+
+    # ---- 3.5 跨文件重复短句去重：每组只翻译调度顺序中第一次出现的句子 ----
+    projectConfig.line_dedup = None
+    if projectConfig.getKey("dedupShortLines", True) and "rebuild" not in eng_type:
+        # 各目标语言分别分组，代表句的译文只复用给同一目标语言
+        dedup_groups, dedup_saved = 0, 0
+        for lang, target in targets.items():
+            line_dedup = LineDeduplicator(int(projectConfig.getKey("dedupMaxChars", 10) or 0))
+            groups, saved = line_dedup.add_chunks(
+                [chunk for chunk in ordered_chunks if chunk.target_lang == lang]
+            )
+            if saved > 0:
+                target.line_dedup = line_dedup
+                dedup_groups += groups
+                dedup_saved += saved
+        projectConfig.line_dedup = targets[""].line_dedup
+        if dedup_saved > 0:
+            LOGGER.info(f"[dedup] {dedup_groups} 组重复短句，复用代表句译文可省去 {dedup_saved} 句")
+            Events.emit("dedup", groups=dedup_groups, saved=dedup_saved)
 
     total_lines = sum([len(chunk.trans_list) for chunk in ordered_chunks])
-    runtime_file_totals, runtime_cache_map = _build_runtime_file_maps(ordered_chunks, input_dir)
+    runtime_file_totals, runtime_cache_map = _build_runtime_file_maps(
+        [chunk for chunk in ordered_chunks if not chunk.target_lang], input_dir
+    )
     _update_runtime(projectConfig, file_totals=runtime_file_totals, cache_file_display_map=runtime_cache_map)
 
     # ---- 4. name 替换表（首次运行时自动生成）----
@@ -454,20 +722,15 @@ async def doLLMTranslate(
         name_replaceDict_firstime = True
     
     # ---- 5. 载入字典（pre/post/gpt）----
-    projectConfig.pre_dic = CNormalDic(
-        initDictList(pre_dic_list, default_dic_dir, project_dir)
-    )
-    projectConfig.post_dic = CNormalDic(
-        initDictList(post_dic_list, default_dic_dir, project_dir)
+    # 同一字典文件未改动时复用已解析的对象（常驻翻译进程中跨任务生效）
+    sort_dict = bool(projectConfig.getDictCfgSection().get("sortDict", True))
+    post_dic_paths = initDictList(post_dic_list, default_dic_dir, project_dir)
+    gpt_dic_paths = initDictList(gpt_dic_list, default_dic_dir, project_dir)
+    projectConfig.pre_dic = load_dic_cached(
+        CNormalDic, initDictList(pre_dic_list, default_dic_dir, project_dir), sort_dict
     )
-    projectConfig.gpt_dic = CGptDict(
-        initDictList(gpt_dic_list, default_dic_dir, project_dir)
-    )
-
-    if projectConfig.getDictCfgSection().get("sortDict", True):
-        projectConfig.pre_dic.sort_dic()
-        projectConfig.post_dic.sort_dic()
-        projectConfig.gpt_dic.sort_dic()
+    projectConfig.post_dic = load_dic_cached(CNormalDic, post_dic_paths, sort_dict)
+    projectConfig.gpt_dic = load_dic_cached(CGptDict, gpt_dic_paths, sort_dict)
 
     # 载入name替换表
     if isPathExists(name_replaceDict_path_csv):
@@ -479,8 +742,53 @@ async def doLLMTranslate(
             name_replaceDict_path_xlsx, name_replaceDict_firstime,total_chunks,projectConfig
         )
 
+    targets[""].gpt_dic = projectConfig.gpt_dic
+    targets[""].post_dic = projectConfig.post_dic
+    targets[""].name_replaceDict = projectConfig.name_replaceDict
+    # 额外目标语言：gpt 字典、后处理字典与 name 替换表只用 _<lang> 版本
+    for lang in extra_target_langs:
+        target = targets[lang]
+        target.gpt_dic = load_dic_cached(CGptDict, target_dict_paths(gpt_dic_paths, lang), sort_dict)
+        target.post_dic = load_dic_cached(CNormalDic, target_dict_paths(post_dic_paths, lang), sort_dict)
+        target.name_replaceDict = {}
+        for name_table_path in target_dict_paths(
+            [name_replaceDict_path_csv, name_replaceDict_path_xlsx], lang
+        ):
+            target.name_replaceDict = load_name_table(
+                name_table_path, False, total_chunks, projectConfig
+            )
+            break
+
+    # ---- 5.5 翻译记忆（首次启用时从已有缓存导入）----
+    projectConfig.transl_memory = None
+    if projectConfig.getKey("translMemory", True) and "rebuild" not in eng_type:
+        memory_path = projectConfig.getKey("translMemoryPath", "") or joinpath(
+            project_dir, MEMORY_FILE_NAME
+        )
+        for lang, target in targets.items():
+            # 额外目标语言各用一份记忆：transl_memory_<lang>.jsonl
+            target_memory_path = memory_path
+            if lang:
+                root, ext = splitext(memory_path)
+                target_memory_path = f"{root}_{lang}{ext}"
+            target.transl_memory = load_translation_memory(
+                target_memory_path,
+                target.cache_dir,
+                target_lang=lang or projectConfig.target_lang,
+                engine=eng_type,
+            )
+            LOGGER.debug(f"[memory]翻译记忆 {target_memory_path}: {len(target.transl_memory)} 条")
+        projectConfig.transl_memory = targets[""].transl_memory
+
     # ---- 6. 初始化共享的 gptapi 实例（所有 worker 共用同一实例）----
     gptapi = await init_gptapi(projectConfig)
+    targets[""].gptapi = gptapi
+    supported_langs = getattr(gptapi, "supported_target_langs", ())
+    for lang in extra_target_langs:
+        if supported_langs and lang not in supported_langs:
+            raise ValueError(f"翻译引擎 {eng_type} 不支持目标语言 {lang}")
+        # 与主实例共用客户端与限流状态
+        targets[lang].gptapi = gptapi.for_target_lang(lang, targets[lang].transl_memory)
 
     title_update_task = None  # 初始化任务变量
     auto_tune_task = None
@@ -528,34 +836,45 @@ async def doLLMTranslate(
             update_progress_title(bar, semaphore, workersPerProject, projectConfig)
         )
 
-        enable_auto_workers = bool(projectConfig.getKey("autoAdjustWorkers", True))
+        # 开启按端点自适应并发时由各端点的限流器各自收放，不再统一调节全局 worker 数
+        enable_auto_workers = bool(projectConfig.getKey("autoAdjustWorkers", True)) and not bool(
+            projectConfig.getKey("endpointAdaptiveConcurrency", False)
+        )
         if enable_auto_workers and workersPerProject > 1:
             auto_tune_task = asyncio.create_task(
                 auto_tune_workers(projectConfig, adaptive_state, set_effective_workers)
             )
 
-        # 用队列 + 哨兵 None 驱动 worker，避免每个 worker 去算自己的分片
-        worker_count = max(1, workersPerProject)
-        chunk_queue: asyncio.Queue[Optional[SplitChunkMetadata]] = asyncio.Queue()
-        for chunk in ordered_chunks:
-            _check_stop_requested(projectConfig)
-            chunk_queue.put_nowait(chunk)
+        # worker 空闲时向调度器要下一个 chunk，取完（None）即退出。
+        # 并发上限只约束 LLM 阶段；多出的 worker 在前/后处理阶段流水，保证信号量槽位不空等 CPU 工作
+        worker_count = max(1, workersPerProject) * 2
+        projectConfig.cpu_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="gt-cpu-stage"
+        )
 
-        # 每个 worker 取到 None 即退出
-        for _ in range(worker_count):
-            chunk_queue.put_nowait(None)
+        # 校对作为独立的下游阶段：chunk 译完即交给校对，与后续 chunk 的翻译并行
+        proofread_stage = None
+        if projectConfig.getKey("gpt.enableProofRead"):
+            if getattr(gptapi, "supports_proofread", False):
+                proofread_stage = ProofreadStage(
+                    int(projectConfig.getKey("gpt.proofReadWorkers", 0) or 0) or workersPerProject,
+                    bool(projectConfig.getKey("gpt.proofReadOnlyProblems", False)),
+                )
+            else:
+                LOGGER.warning("当前引擎不支持校对，跳过校对步骤")
+        projectConfig.proofread_stage = proofread_stage
 
         async def worker_loop():
             while True:
                 _check_stop_requested(projectConfig)
-                split_chunk = await chunk_queue.get()
+                split_chunk = chunk_scheduler.pop()
                 if split_chunk is None:
                     return
                 await doLLMTranslSingleChunk(
                     semaphore,
                     split_chunk=split_chunk,
                     projectConfig=projectConfig,
-                    gptapi=gptapi,  # 传递共享的 gptapi 实例
+                    gptapi=targets[split_chunk.target_lang].gptapi,  # 该目标语言共享的 gptapi 实例
                 )
 
         worker_tasks = [
@@ -565,11 +884,15 @@ async def doLLMTranslate(
 
         try:
             await asyncio.gather(*worker_tasks)
+            if proofread_stage is not None:
+                await proofread_stage.join()
         except Exception:
             for worker_task in worker_tasks:
                 if not worker_task.done():
                     worker_task.cancel()
             await asyncio.gather(*worker_tasks, return_exceptions=True)
+            if proofread_stage is not None:
+                await proofread_stage.cancel()
             raise
         finally:
             for worker_task in worker_tasks:
@@ -597,6 +920,11 @@ async def doLLMTranslate(
                 except asyncio.CancelledError:
                     pass  # 捕获预期的取消错误
 
+            cpu_executor = getattr(projectConfig, "cpu_executor", None)
+            if cpu_executor is not None:
+                cpu_executor.shutdown(wait=True)
+                projectConfig.cpu_executor = None
+
             shutdown_callable = getattr(gptapi, "shutdown", None)
             if callable(shutdown_callable):
                 try:
@@ -613,124 +941,289 @@ async def doLLMTranslSingleChunk(
 ) -> Tuple[bool, List, List, str, SplitChunkMetadata]:
     """处理单个切片(chunk)的翻译流程。
 
-    顺序：
-    1. acquire 信号量 → 进入并发窗口
-    2. 前处理（插件 before_src → 字典替换 → after_src）
-    3. 读缓存判定命中/未命中（含 append 日志合并）
-    4. 未命中部分调 gptapi.batch_translate；若启用则做校对
-    5. 后处理（恢复符号、post 字典、插件 after_dst）
-    6. 如果该文件所有 chunk 都完成，触发 postprocess_results 合并写出+快照缓存
+    顺序（只有第 3 步占用并发信号量，CPU 阶段在 cpu_executor 线程中执行，不阻塞事件循环）：
+    1. 前处理（插件 before_src → 字典替换 → after_src）
+    2. 读缓存判定命中/未命中（含 append 日志合并），未命中的再按增量对齐沿用旧译文、查翻译记忆
+    3. 未命中部分：acquire 信号量 → gptapi.batch_translate
+       （重复短句的跟随句不请求，等代表句完成后复用其译文）
+    3.5 若启用校对：把 chunk 交给 ProofreadStage，由校对阶段完成校对与第 4、5 步
+    4. 后处理（恢复符号、post 字典、插件 after_dst）
+    5. 如果该文件所有 chunk 都完成，触发 postprocess_results 合并写出+快照缓存
     """
 
-    async with semaphore:
-        _check_stop_requested(projectConfig)
-        st = time()
-        proj_dir = projectConfig.getProjectDir()
-        input_dir = projectConfig.getInputPath()
-        output_dir = projectConfig.getOutputPath()
-        cache_dir = projectConfig.getCachePath()
-        pre_dic = projectConfig.pre_dic
-        post_dic = projectConfig.post_dic
-        gpt_dic = projectConfig.gpt_dic
-        file_path = split_chunk.file_path
-        file_name = (
-            file_path.replace(input_dir, "").lstrip(os_sep).replace(os_sep, "-}")
-        )  # 多级文件夹
-        tPlugins = projectConfig.tPlugins
-        eng_type = projectConfig.select_translator
+    _check_stop_requested(projectConfig)
+    st = time()
+    proj_dir = projectConfig.getProjectDir()
+    input_dir = projectConfig.getInputPath()
+    target = _chunk_target(projectConfig, split_chunk)
+    output_dir = target.output_dir
+    cache_dir = target.cache_dir
+    pre_dic = projectConfig.pre_dic
+    gpt_dic = target.gpt_dic
+    file_path = split_chunk.file_path
+    file_name = (
+        file_path.replace(input_dir, "").lstrip(os_sep).replace(os_sep, "-}")
+    )  # 多级文件夹
+    tPlugins = projectConfig.tPlugins
+    eng_type = projectConfig.select_translator
 
-        total_splits = split_chunk.total_chunks
-        file_index = split_chunk.chunk_index
-        input_file_path = file_path
-        output_file_path = input_file_path.replace(input_dir, output_dir)
+    total_splits = split_chunk.total_chunks
+    file_index = split_chunk.chunk_index
+    input_file_path = file_path
+    output_file_path = input_file_path.replace(input_dir, output_dir)
 
-        cache_file_path = joinpath(
-            cache_dir,
-            file_name + (f"_{file_index}" if total_splits > 1 else ""),
-        )
+    cache_file_path = joinpath(
+        cache_dir,
+        file_name + (f"_{file_index}" if total_splits > 1 else ""),
+    )
 
-        part_info = f" (part {file_index+1}/{total_splits})" if total_splits > 1 else ""
-        _update_runtime(
-            projectConfig,
-            current_file=file_name,
-        )
-        LOGGER.info(f">>> 开始翻译 (project_dir){split_chunk.file_path.replace(proj_dir,'')}")
-        LOGGER.debug(f"文件 {file_name} 分块 {file_index+1}/{total_splits}:")
-        LOGGER.debug(f"  开始索引: {split_chunk.start_index}")
-        LOGGER.debug(f"  结束索引: {split_chunk.end_index}")
-        LOGGER.debug(f"  非交叉大小: {split_chunk.chunk_non_cross_size}")
-        LOGGER.debug(f"  实际大小: {split_chunk.chunk_size}")
-        LOGGER.debug(f"  交叉数量: {split_chunk.cross_num}")
-
-        # 翻译前处理
-        preprocess_trans_list(split_chunk.trans_list, projectConfig, pre_dic, tPlugins)
-
-        translist_hit, translist_unhit = await get_transCache_from_json(
-            split_chunk.trans_list,
-            cache_file_path,
+    lang_info = f" [{split_chunk.target_lang}]" if split_chunk.target_lang else ""
+    part_info = (f" (part {file_index+1}/{total_splits})" if total_splits > 1 else "") + lang_info
+    _update_runtime(
+        projectConfig,
+        current_file=file_name,
+    )
+    LOGGER.info(f">>> 开始翻译 (project_dir){split_chunk.file_path.replace(proj_dir,'')}{lang_info}")
+    LOGGER.debug(f"文件 {file_name} 分块 {file_index+1}/{total_splits}:")
+    LOGGER.debug(f"  开始索引: {split_chunk.start_index}")
+    LOGGER.debug(f"  结束索引: {split_chunk.end_index}")
+    LOGGER.debug(f"  非交叉大小: {split_chunk.chunk_non_cross_size}")
+    LOGGER.debug(f"  实际大小: {split_chunk.chunk_size}")
+    LOGGER.debug(f"  交叉数量: {split_chunk.cross_num}")
+
+    # 翻译前处理（CPU 阶段，不占并发槽；多目标语言时同一分片只做一次）
+    await _preprocess_chunk(split_chunk, projectConfig, pre_dic, tPlugins)
+
+    translist_hit, translist_unhit = await get_transCache_from_json(
+        split_chunk.trans_list,
+        cache_file_path,
+        retry_failed=projectConfig.getKey("retranslFail"),
+        proofread=False,
+        retran_key=projectConfig.getKey("retranslKey"),
+        eng_type=eng_type,
+    )
+
+    # 缓存 key 因邻句改动或分片移动而失效的句子，沿用增量对齐得到的旧译文
+    if split_chunk.carry_over and translist_unhit:
+        carried, translist_unhit = carry_over_cache(
+            translist_unhit,
+            split_chunk.carry_over,
             retry_failed=projectConfig.getKey("retranslFail"),
-            proofread=False,
             retran_key=projectConfig.getKey("retranslKey"),
-            eng_type=eng_type,
         )
+        translist_hit = translist_hit + carried
+
+    if len(translist_hit) > 0:
+        projectConfig.bar(len(translist_hit), skipped=True) # 更新进度条
 
-        if len(translist_hit) > 0:
-            projectConfig.bar(len(translist_hit), skipped=True) # 更新进度条
+    # 翻译记忆中原文相同（仅全半角/空白不同）的句子直接复用；只有标点不同的句子与相似句只作为参考译文
+    transl_memory = target.transl_memory
+    if transl_memory is not None and translist_unhit and projectConfig.getKey("translMemoryReuse", True):
+        reused, translist_unhit = transl_memory.reuse(
+            translist_unhit,
+            projectConfig.getKey("retranslKey"),
+        )
+        if reused:
+            translist_hit = translist_hit + reused
+            projectConfig.bar(len(reused), skipped=True)
+            Events.emit_results(file_name, reused, len(reused), len(reused))
+
+    # 重复短句的跟随句不自己请求，等代表句译完后复用其译文
+    line_dedup = target.line_dedup
+    followers = []
+    if line_dedup is not None:
+        line_dedup.resolve(translist_hit)
+        translist_unhit, followers = line_dedup.split_followers(translist_unhit)
 
+    try:
         if len(translist_unhit) > 0:
             _check_stop_requested(projectConfig)
             await ensure_model_available_if_needed(projectConfig)
-            # 执行翻译
-            await gptapi.batch_translate(
+            # 只有 LLM 请求阶段计入并发上限
+            async with semaphore:
+                await _translate_chunk_llm(
+                    split_chunk, projectConfig, gptapi, file_name, file_index, total_splits,
+                    cache_file_path, gpt_dic, translist_hit, translist_unhit,
+                )
+    finally:
+        # 出错时也要登记，避免其他 chunk 的跟随句一直等待
+        if line_dedup is not None:
+            line_dedup.resolve(split_chunk.trans_list)
+
+    if followers:
+        filled, leftover = await line_dedup.fill_followers(followers)
+        if filled:
+            projectConfig.bar(len(filled))
+            Events.emit_results(file_name, filled, len(filled), len(followers))
+        if leftover:
+            # 代表句翻译失败：跟随句按正常流程翻译
+            _check_stop_requested(projectConfig)
+            await ensure_model_available_if_needed(projectConfig)
+            async with semaphore:
+                await _translate_chunk_llm(
+                    split_chunk, projectConfig, gptapi, file_name, file_index, total_splits,
+                    cache_file_path, gpt_dic, translist_hit, leftover,
+                )
+
+    proofread_stage = getattr(projectConfig, "proofread_stage", None)
+    if proofread_stage is not None:
+        # 交给校对阶段，翻译 worker 立即去取下一个 chunk
+        proofread_stage.submit(
+            _proofread_and_finish_chunk(
+                proofread_stage,
+                split_chunk,
+                projectConfig,
+                gptapi,
                 file_name + (f"_{file_index}" if total_splits > 1 else ""),
                 cache_file_path,
-                split_chunk.trans_list,
-                projectConfig.getKey("gpt.numPerRequestTranslate"),
-                retry_failed=projectConfig.getKey("retranslFail"),
-                gpt_dic=gpt_dic,
-                retran_key=projectConfig.getKey("retranslKey"),
-                translist_hit=translist_hit,
-                translist_unhit=translist_unhit,
+                gpt_dic,
+                file_name,
+                part_info,
+                st,
             )
+        )
+        return
 
-            # 执行校对（如果启用）
-            if projectConfig.getKey("gpt.enableProofRead"):
-                _check_stop_requested(projectConfig)
-                if "gpt4" in eng_type:
-                    await gptapi.batch_translate(
-                        file_name,
-                        cache_file_path,
-                        split_chunk.trans_list,
-                        projectConfig.getKey("gpt.numPerRequestProofRead"),
-                        retry_failed=projectConfig.getKey("retranslFail"),
-                        gpt_dic=gpt_dic,
-                        proofread=True,
-                        retran_key=projectConfig.getKey("retranslKey"),
-                    )
-                else:
-                    LOGGER.warning("当前引擎不支持校对，跳过校对步骤")
-            gptapi.clean_up()
+    # 翻译后处理（CPU 阶段）
+    await _finish_chunk(split_chunk, projectConfig, file_name, part_info, st)
 
-        # 翻译后处理
-        _check_stop_requested(projectConfig)
-        postprocess_trans_list(split_chunk.trans_list, projectConfig, post_dic, tPlugins)
 
-        et = time()
-        LOGGER.info(
-            get_text(
-                "file_translation_completed", GT_LANG, file_name, part_info, et - st
-            )
+async def _translate_chunk_llm(
+    split_chunk: SplitChunkMetadata,
+    projectConfig: CProjectConfig,
+    gptapi: Any,
+    file_name: str,
+    file_index: int,
+    total_splits: int,
+    cache_file_path: str,
+    gpt_dic: CGptDict,
+    translist_hit: list,
+    translist_unhit: list,
+):
+    """chunk 的 LLM 翻译阶段：翻译未命中部分。调用方持有并发信号量。"""
+    await gptapi.batch_translate(
+        file_name + (f"_{file_index}" if total_splits > 1 else ""),
+        cache_file_path,
+        split_chunk.trans_list,
+        projectConfig.getKey("gpt.numPerRequestTranslate"),
+        retry_failed=projectConfig.getKey("retranslFail"),
+        gpt_dic=gpt_dic,
+        retran_key=projectConfig.getKey("retranslKey"),
+        translist_hit=translist_hit,
+        translist_unhit=translist_unhit,
+    )
+    gptapi.clean_up()
+
+
+def _find_problem_lines(
+    trans_list, projectConfig: CProjectConfig, gpt_dic: CGptDict, target_lang: str = ""
+) -> list:
+    """返回 find_problems 会标记的句子；各句原有的 problem 保持不变（文件完成时还会再查一次）"""
+    saved = [tran.problem for tran in trans_list]
+    find_problems(trans_list, projectConfig, gpt_dic, target_lang)
+    flagged = [tran for tran, before in zip(trans_list, saved) if tran.problem != before]
+    for tran, before in zip(trans_list, saved):
+        tran.problem = before
+    return flagged
+
+
+async def _proofread_chunk(
+    stage: "ProofreadStage",
+    split_chunk: SplitChunkMetadata,
+    projectConfig: CProjectConfig,
+    gptapi: Any,
+    request_name: str,
+    cache_file_path: str,
+    gpt_dic: CGptDict,
+):
+    """校对 chunk 中已翻译、尚未校对的句子（only_problems 时只校对有问题的句子），占用校对阶段的并发槽"""
+    targets = split_chunk.trans_list
+    if stage.only_problems:
+        targets = await _run_cpu_stage(
+            projectConfig,
+            _find_problem_lines,
+            split_chunk.trans_list,
+            projectConfig,
+            gpt_dic,
+            split_chunk.target_lang,
+        )
+    targets = [
+        tran
+        for tran in targets
+        if tran.post_jp
+        and tran.pre_zh
+        and tran.proofread_zh == ""
+        and not any(marker in tran.pre_zh for marker in ("(Failed)", "(翻译失败)"))
+    ]
+    if not targets:
+        return
+    _check_stop_requested(projectConfig)
+    async with stage.semaphore:
+        await gptapi.batch_translate(
+            request_name,
+            cache_file_path,
+            split_chunk.trans_list,
+            projectConfig.getKey("gpt.numPerRequestProofRead", 8),
+            retry_failed=projectConfig.getKey("retranslFail"),
+            gpt_dic=gpt_dic,
+            proofread=True,
+            retran_key=projectConfig.getKey("retranslKey"),
+            translist_unhit=targets,
         )
 
-        # 登记本 chunk 已完成；只有当"同一文件的全部 chunk"都完成时才做整文件后处理
-        split_chunk.update_file_finished_chunk()
-        if split_chunk.is_file_finished():
-            LOGGER.debug(get_text("file_chunks_completed", GT_LANG, file_name))
-            await postprocess_results(
-                split_chunk.get_file_finished_chunks(), projectConfig
-            )
 
-        _update_runtime(projectConfig, current_file=file_name)
+async def _finish_chunk(
+    split_chunk: SplitChunkMetadata,
+    projectConfig: CProjectConfig,
+    file_name: str,
+    part_info: str,
+    st: float,
+):
+    """chunk 收尾：后处理；同一文件的全部 chunk 完成时触发 postprocess_results"""
+    _check_stop_requested(projectConfig)
+    await _run_cpu_stage(
+        projectConfig,
+        postprocess_trans_list,
+        split_chunk.trans_list,
+        projectConfig,
+        _chunk_target(projectConfig, split_chunk).post_dic,
+        projectConfig.tPlugins,
+    )
+
+    et = time()
+    LOGGER.info(
+        get_text(
+            "file_translation_completed", GT_LANG, file_name, part_info, et - st
+        )
+    )
+
+    # 登记本 chunk 已完成；只有当"同一文件的全部 chunk"都完成时才做整文件后处理
+    split_chunk.update_file_finished_chunk()
+    if split_chunk.is_file_finished():
+        LOGGER.debug(get_text("file_chunks_completed", GT_LANG, file_name))
+        await postprocess_results(
+            split_chunk.get_file_finished_chunks(), projectConfig
+        )
+
+    _update_runtime(projectConfig, current_file=file_name)
+
+
+async def _proofread_and_finish_chunk(
+    stage: "ProofreadStage",
+    split_chunk: SplitChunkMetadata,
+    projectConfig: CProjectConfig,
+    gptapi: Any,
+    request_name: str,
+    cache_file_path: str,
+    gpt_dic: CGptDict,
+    file_name: str,
+    part_info: str,
+    st: float,
+):
+    await _proofread_chunk(
+        stage, split_chunk, projectConfig, gptapi, request_name, cache_file_path, gpt_dic
+    )
+    await _finish_chunk(split_chunk, projectConfig, file_name, part_info, st)
 
 
 async def postprocess_results(
@@ -740,17 +1233,20 @@ async def postprocess_results(
     """单个文件翻译完成后的收尾工作。
 
     对每个 chunk 逐一：find_problems 标注问题 → save_transCache_to_json(post_save=True)
-    写完整 jsonl 快照（这也是唯一一次把 append 日志合并入主快照的时机）。
+    写完整 jsonl 快照（这也是唯一一次把 append 日志合并入主快照的时机），并把译文收录进翻译记忆。
     随后合并所有 chunk 的结果，套用 name 替换表并经文件插件写出最终译文。
+    缓存与输出目录、字典和翻译记忆均取 chunk 所属的目标语言。
     """
 
     proj_dir = projectConfig.getProjectDir()
     input_dir = projectConfig.getInputPath()
-    output_dir = projectConfig.getOutputPath()
-    cache_dir = projectConfig.getCachePath()
+    target = _chunk_target(projectConfig, resultChunks[0])
+    output_dir = target.output_dir
+    cache_dir = target.cache_dir
     eng_type = projectConfig.select_translator
-    gpt_dic = projectConfig.gpt_dic
-    name_replaceDict = projectConfig.name_replaceDict
+    gpt_dic = target.gpt_dic
+    name_replaceDict = target.name_replaceDict
+    transl_memory = target.transl_memory
 
     # 对每个分块执行错误检查和缓存保存
     for i, chunk in enumerate(resultChunks):
@@ -764,9 +1260,16 @@ async def postprocess_results(
 
         # rebuildr 是"只重建输出文件"模式，不应修改缓存；其余引擎正常刷新
         if eng_type != "rebuildr":
-            find_problems(trans_list, projectConfig, gpt_dic)
+            await _run_cpu_stage(
+                projectConfig, find_problems, trans_list, projectConfig, gpt_dic, chunk.target_lang
+            )
             # post_save=True → 写完整快照并删除对应 .append 日志（即合并 jsonl）
             await save_transCache_to_json(trans_list, cache_file_path, post_save=True)
+            if transl_memory is not None:
+                transl_memory.add_trans(trans_list)
+
+    if transl_memory is not None:
+        await _run_cpu_stage(projectConfig, transl_memory.flush)
 
     # 使用output_combiner合并结果，即使只有一个结果
     all_trans_list, all_json_list = DictionaryCombiner.combine(resultChunks)
@@ -776,11 +1279,15 @@ async def postprocess_results(
     save_func = projectConfig.file_save_funcs.get(file_path, save_json)
 
     if all_trans_list and all_json_list:
-        final_result = update_json_with_transList(
-            all_trans_list, all_json_list, name_replaceDict
-        )
-        makedirs(dirname(output_file_path), exist_ok=True)
-        save_func(output_file_path, final_result)
+
+        def _write_output():
+            final_result = update_json_with_transList(
+                all_trans_list, all_json_list, name_replaceDict
+            )
+            makedirs(dirname(output_file_path), exist_ok=True)
+            save_func(output_file_path, final_result)
+
+        await _run_cpu_stage(projectConfig, _write_output)
         LOGGER.info(f"+++ 结果保存 (project_dir){output_file_path.replace(proj_dir,'')}")  # 添加保存确认日志
 
 
@@ -29,6 +29,7 @@ def find_problems(
     trans_list: CTransList,
     projectConfig: CProjectConfig,
     gpt_dict: CGptDict = None,
+    target_lang: str = "",
 ) -> None:
     """
     此函数接受一个翻译列表，查找其中的问题并将其记录在每个翻译对象的 `problem` 属性中。
@@ -37,6 +38,7 @@ def find_problems(
     - trans_list: 翻译对象列表。
     - find_type: 要查找的问题类型列表。
     - arinashi_dict: 一个自定义字典，其中的键值对将会被用于查找问题。
+    - target_lang: 译文的目标语言，留空为项目的目标语言（多目标语言时各目标分别检查）。
 
     返回值:
     - 无返回值，但会修改每个翻译对象的 `problem` 属性。
@@ -45,6 +47,7 @@ def find_problems(
     find_type = projectConfig.getProblemAnalyzeConfig("problemList")
     if not find_type:
         find_type = projectConfig.getProblemAnalyzeConfig("GPT35")  # 兼容旧版
+    target_lang = target_lang or projectConfig.target_lang
 
     for tran in trans_list:
         pre_jp = tran.pre_jp
@@ -125,13 +128,13 @@ def find_problems(
         if CProblemType.字典使用 in find_type:
             if val := gpt_dict.check_dic_use(pre_zh, tran):
                 problem_list.append(val)
-        if CProblemType.引入英文 in find_type:
+        if CProblemType.引入英文 in find_type and target_lang != "en":
             if not contains_english(post_jp) and contains_english(pre_zh):
                 eng_chars= contains_english(post_zh)
                 if len(eng_chars)>4:
                     problem_list.append(f"引入英文：{eng_chars}")
         if CProblemType.语言不通 in find_type:
-            if "zh" in projectConfig.target_lang:
+            if "zh" in target_lang:
                 if not is_all_gbk(pre_zh):
                     non_gbk_whites=["♪","♥"]
                     non_gbk_chars = is_all_gbk(post_zh)
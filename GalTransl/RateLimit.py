@@ -0,0 +1,204 @@
+"""
+按端点 + key 的自适应并发限制（AIMD）。
+
+每个 (端点, key) 一个 AdaptiveLimiter，同一进程内共享（常驻翻译进程跨任务保留学到的并发上限）：
+- 请求成功且延迟不高于基线的 2 倍：并发上限每轮 +1（每次成功 +1/limit）
+- 429 / 超时 / 延迟显著升高：并发上限减半（乘性减）
+- 服务端给出 Retry-After 或 x-ratelimit-reset-*：该端点在指定时间前不再放行请求，其余端点不受影响；
+  未给出时按连续 429 次数指数退避
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+
+# 延迟基线的 EWMA 平滑系数
+LATENCY_ALPHA = 0.2
+# 延迟超过基线该倍数时视为拥塞
+LATENCY_TOLERANCE = 2.0
+# 两次乘性减之间的最小间隔，避免同一波失败把上限连续砍到底
+DECREASE_COOLDOWN = 2.0
+# 429 未给出等待时长时的封禁时长：1s 起按连续次数翻倍，最长 30s
+RATE_LIMIT_BACKOFF_MAX = 30.0
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+
+
+def parse_duration(value: Any) -> Optional[float]:
+    """解析 Retry-After（秒数）与 x-ratelimit-reset-*（如 "1s"、"6m0s"、"120ms"）"""
+    if value is None:
+        return None
+    text = str(value).strip().lower()
+    if not text:
+        return None
+    try:
+        return max(0.0, float(text))
+    except ValueError:
+        pass
+    total = 0.0
+    matched = False
+    for number, unit in _DURATION_PART.findall(text):
+        matched = True
+        number = float(number)
+        total += {"ms": number / 1000.0, "s": number, "m": number * 60.0, "h": number * 3600.0}[unit]
+    if matched:
+        return total
+    try:
+        from email.utils import parsedate_to_datetime
+
+        return max(0.0, parsedate_to_datetime(text).timestamp() - time.time())
+    except Exception:
+        return None
+
+
+def retry_after_from_headers(headers: Any) -> Optional[float]:
+    """从响应头取服务端要求的等待秒数"""
+    if not headers:
+        return None
+    try:
+        if (ms := headers.get("retry-after-ms")) is not None:
+            return max(0.0, float(ms) / 1000.0)
+    except (TypeError, ValueError):
+        pass
+    wait = parse_duration(headers.get("retry-after"))
+    if wait is not None:
+        return wait
+    waits = []
+    for kind in ("requests", "tokens"):
+        remaining = headers.get(f"x-ratelimit-remaining-{kind}")
+        if remaining is not None and str(remaining).strip() in ("0", "0.0"):
+            reset = parse_duration(headers.get(f"x-ratelimit-reset-{kind}"))
+            if reset is not None:
+                waits.append(reset)
+    return max(waits) if waits else None
+
+
+def retry_after_from_exception(ex: BaseException) -> Optional[float]:
+    response = getattr(ex, "response", None)
+    return retry_after_from_headers(getattr(response, "headers", None))
+
+
+class AdaptiveLimiter:
+    def __init__(self, name: str, initial: float = 4.0, max_limit: float = 64.0) -> None:
+        self.name = name
+        self.max_limit = float(max_limit)
+        self.limit = min(float(initial), self.max_limit)
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self.latency_ewma = 0.0
+        self._last_decrease = 0.0
+        self._consecutive_limited = 0
+        self._lock = Lock()
+
+    def _try_acquire(self) -> float:
+        """成功返回 0，否则返回建议等待的秒数"""
+        now = time.monotonic()
+        with self._lock:
+            if now < self.blocked_until:
+                return self.blocked_until - now
+            if self.in_flight < max(1, int(self.limit)):
+                self.in_flight += 1
+                return 0.0
+        return 0.05
+
+    async def acquire(self, stop_check=None) -> "AdaptiveLimiter":
+        while True:
+            wait = self._try_acquire()
+            if wait <= 0:
+                return self
+            if stop_check is not None:
+                stop_check()
+            await asyncio.sleep(min(wait, 0.5))
+
+    def try_acquire(self) -> bool:
+        """不等待地尝试占用一个并发槽"""
+        return self._try_acquire() <= 0
+
+    def available(self) -> bool:
+        with self._lock:
+            return time.monotonic() >= self.blocked_until and self.in_flight < max(1, int(self.limit))
+
+    def _decrease_locked(self, now: float) -> None:
+        if now - self._last_decrease >= DECREASE_COOLDOWN:
+            self.limit = max(1.0, self.limit / 2.0)
+            self._last_decrease = now
+
+    def release(
+        self,
+        latency: float,
+        ok: bool,
+        rate_limited: bool = False,
+        retry_after: Optional[float] = None,
+        congested: bool = False,
+    ) -> None:
+        """归还并发槽并调整上限；congested 表示请求超时或连接失败，与 429 一样乘性减"""
+        now = time.monotonic()
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+            if rate_limited:
+                self._consecutive_limited += 1
+                if retry_after is None:
+                    retry_after = min(
+                        RATE_LIMIT_BACKOFF_MAX, 2.0 ** (self._consecutive_limited - 1)
+                    )
+            elif ok:
+                self._consecutive_limited = 0
+            if retry_after is not None and retry_after > 0:
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+            if rate_limited or congested:
+                self._decrease_locked(now)
+                return
+            if not ok:
+                return
+            slow = (
+                self.latency_ewma > 0
+                and latency > self.latency_ewma * LATENCY_TOLERANCE
+            )
+            if self.latency_ewma <= 0:
+                self.latency_ewma = latency
+            else:
+                self.latency_ewma += LATENCY_ALPHA * (latency - self.latency_ewma)
+            if slow:
+                self._decrease_locked(now)
+            else:
+                self.limit = min(self.max_limit, self.limit + 1.0 / max(1.0, self.limit))
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "limit": round(self.limit, 2),
+                "in_flight": self.in_flight,
+                "blocked_for": round(max(0.0, self.blocked_until - time.monotonic()), 2),
+                "latency_ewma": round(self.latency_ewma, 3),
+            }
+
+
+_LIMITERS: Dict[Tuple[str, str], AdaptiveLimiter] = {}
+_LIMITERS_LOCK = Lock()
+
+
+def get_limiter(
+    domain: str, token: str, max_limit: float = 64.0, name: str = "", initial: float = 4.0
+) -> AdaptiveLimiter:
+    """取 (端点, key) 共享的限流器；initial 只在首次创建时生效，之后沿用学到的上限"""
+    key = (domain, token)
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(key)
+        if limiter is None:
+            limiter = AdaptiveLimiter(name or domain, initial=initial, max_limit=max_limit)
+            _LIMITERS[key] = limiter
+        else:
+            limiter.max_limit = float(max_limit)
+            limiter.limit = min(limiter.limit, limiter.max_limit)
+        return limiter
+
+
+def limiter_snapshots() -> list:
+    with _LIMITERS_LOCK:
+        limiters = list(_LIMITERS.values())
+    return [limiter.snapshot() for limiter in limiters]
@@ -0,0 +1,173 @@
+"""
+按实时延迟与错误率在多个 key / 端点间路由请求（tokenStrategy: adaptive）。
+
+- 每个 (端点, key) 记录 EWMA 延迟、在途请求数、最近 N 次请求的错误率
+- 选择时随机抽两个候选，取负载分更低者（power of two choices），既跟随实际容量又避免一窝蜂涌向同一个端点
+- 连续失败或错误率过高的端点被摘除一段时间（5s 起翻倍，最长 120s）；到期后只放一个探测请求，
+  成功则恢复，失败则继续摘除
+- 429 由 RateLimit 的限流器处理，不计入错误率
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from collections import deque
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence
+
+LATENCY_ALPHA = 0.3
+# 尚无样本的端点按该延迟估计，保证新端点会被尝试
+DEFAULT_LATENCY = 1.0
+ERROR_WINDOW = 20
+EJECT_CONSECUTIVE_FAILURES = 3
+EJECT_ERROR_RATE = 0.5
+EJECT_MIN_SAMPLES = 6
+EJECT_BASE_SECONDS = 5.0
+EJECT_MAX_SECONDS = 120.0
+
+
+class EndpointStats:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.latency_ewma = 0.0
+        self.in_flight = 0
+        self.outcomes: deque[bool] = deque(maxlen=ERROR_WINDOW)
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+        self.eject_seconds = EJECT_BASE_SECONDS
+        self.probing = False
+
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return sum(1 for ok in self.outcomes if not ok) / len(self.outcomes)
+
+    def score(self) -> float:
+        """负载分：预计排队时间 / 成功率，越低越好"""
+        latency = self.latency_ewma if self.latency_ewma > 0 else DEFAULT_LATENCY
+        return (self.in_flight + 1) * latency / max(0.05, 1.0 - self.error_rate())
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "latency_ewma": round(self.latency_ewma, 3),
+            "in_flight": self.in_flight,
+            "error_rate": round(self.error_rate(), 3),
+            "ejected_for": round(max(0.0, self.ejected_until - time.monotonic()), 1),
+        }
+
+
+_STATS: Dict[Hashable, EndpointStats] = {}
+_LOCK = Lock()
+
+
+def _stats_for(key: Hashable, name: str) -> EndpointStats:
+    stats = _STATS.get(key)
+    if stats is None:
+        stats = EndpointStats(name)
+        _STATS[key] = stats
+    return stats
+
+
+class EndpointRouter:
+    """在 items 中路由；key_of(item) 决定统计归属，同一进程内相同 key 的统计共享"""
+
+    def __init__(
+        self,
+        items: Sequence[Any],
+        key_of: Callable[[Any], Hashable],
+        name_of: Callable[[Any], str] = str,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self.items = list(items)
+        self._key_of = key_of
+        self._rng = rng or random.Random()
+        with _LOCK:
+            for item in self.items:
+                _stats_for(key_of(item), name_of(item))
+
+    def stats(self, item: Any) -> EndpointStats:
+        return _STATS[self._key_of(item)]
+
+    def pick(
+        self,
+        exclude: Sequence[Any] = (),
+        ready: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        now = time.monotonic()
+        with _LOCK:
+            healthy: List[Any] = []
+            probe = None
+            for item in self.items:
+                if any(item is other for other in exclude):
+                    continue
+                stats = self.stats(item)
+                if stats.ejected_until <= 0:
+                    healthy.append(item)
+                elif now >= stats.ejected_until and not stats.probing and probe is None:
+                    probe = item
+            if probe is not None:
+                self.stats(probe).probing = True
+                return probe
+            if ready is not None:
+                healthy = [item for item in healthy if ready(item)] or healthy
+            if not healthy:
+                # 全部被摘除：退回最早恢复的端点
+                pool = [item for item in self.items if not any(item is other for other in exclude)] or self.items
+                return min(pool, key=lambda item: self.stats(item).ejected_until)
+            if len(healthy) == 1:
+                return healthy[0]
+            first, second = self._rng.sample(healthy, 2)
+            return first if self.stats(first).score() <= self.stats(second).score() else second
+
+    def start(self, item: Any) -> None:
+        with _LOCK:
+            self.stats(item).in_flight += 1
+
+    def finish(self, item: Any, latency: float, ok: bool, rate_limited: bool = False) -> None:
+        now = time.monotonic()
+        with _LOCK:
+            stats = self.stats(item)
+            stats.in_flight = max(0, stats.in_flight - 1)
+            was_probe = stats.probing
+            stats.probing = False
+            if rate_limited:
+                return
+            stats.outcomes.append(ok)
+            if ok:
+                if stats.latency_ewma <= 0:
+                    stats.latency_ewma = latency
+                else:
+                    stats.latency_ewma += LATENCY_ALPHA * (latency - stats.latency_ewma)
+                stats.consecutive_failures = 0
+                if stats.ejected_until > 0:
+                    # 探测成功，恢复并清空旧的错误记录
+                    stats.ejected_until = 0.0
+                    stats.eject_seconds = EJECT_BASE_SECONDS
+                    stats.outcomes.clear()
+                return
+            stats.consecutive_failures += 1
+            if was_probe:
+                # 探测失败：摘除时间翻倍
+                stats.eject_seconds = min(EJECT_MAX_SECONDS, stats.eject_seconds * 2)
+                stats.ejected_until = now + stats.eject_seconds
+            elif stats.ejected_until <= 0 and (
+                stats.consecutive_failures >= EJECT_CONSECUTIVE_FAILURES
+                or (
+                    len(stats.outcomes) >= EJECT_MIN_SAMPLES
+                    and stats.error_rate() >= EJECT_ERROR_RATE
+                )
+            ):
+                stats.ejected_until = now + stats.eject_seconds
+
+    def cancel(self, item: Any) -> None:
+        """请求被主动取消（如对冲请求落败），不计入统计"""
+        with _LOCK:
+            stats = self.stats(item)
+            stats.in_flight = max(0, stats.in_flight - 1)
+            stats.probing = False
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with _LOCK:
+            return [self.stats(item).snapshot() for item in self.items]
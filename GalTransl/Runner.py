@@ -1,4 +1,4 @@
-import os, time, sys, datetime, threading
+import os, time, sys, datetime, threading, copy
 from os.path import exists as isPathExists
 from os import makedirs as mkdir
 import logging, colorlog
@@ -11,6 +11,7 @@ from GalTransl.Frontend.LLMTranslate import doLLMTranslate
 from GalTransl.i18n import get_text,GT_LANG
 from GalTransl.CSplitter import (
     DictionaryCountSplitter,
+    TokenCountSplitter,
     EqualPartsSplitter,
     DictionaryCombiner,
 )
@@ -86,6 +87,27 @@ class _ServerStatusFilter(logging.Filter):
         return any(msg.startswith(p) for p in self._ALLOWED_INFO_PREFIXES)
 
 
+# 常驻翻译进程（translate.py --serve）连续执行多个任务时开启：插件只扫描、导入一次，
+# 按 (所选插件及其文件修改时间) 复用，每个任务仍以当次项目设置重新 gtp_init。
+REUSE_PLUGINS = False
+_PLUGIN_CACHE: dict = {}
+
+
+def _plugin_cache_key(info_paths):
+    stamps = []
+    for info_path in info_paths:
+        plug_dir = os.path.dirname(info_path)
+        try:
+            mtime = max(
+                os.stat(os.path.join(plug_dir, name)).st_mtime_ns
+                for name in os.listdir(plug_dir)
+            )
+        except (OSError, ValueError):
+            mtime = None
+        stamps.append((info_path, mtime))
+    return tuple(stamps)
+
+
 def _raise_if_stop_requested(stop_event):
     if stop_event is not None and stop_event.is_set():
         from GalTransl.Service import JobCancelledError
@@ -213,34 +235,56 @@ async def run_galtransl(cfg: CProjectConfig, translator: str, stop_event=None):
                 LOGGER.info("%s 文件夹不存在，让我们创建它...", dir_path)
                 mkdir(dir_path)
         # 插件初始化
-        plugin_manager = PluginManager(
-            {"GTextPlugin": GTextPlugin, "GFilePlugin": GFilePlugin},
-            ["plugins", os.path.join(PROJECT_DIR, "plugins")],
-        )
-        plugin_manager.locatePlugins()
-        # 打印插件列表
-        if translator == "show-plugs":
-            print_plugin_list(plugin_manager)
-            return None
-        new_candidates = []
-        for tname in cfg.getTextPluginList():
-            info_path = get_pluginInfo_path(tname)
-            candidate = plugin_manager.getPluginCandidateByInfoPath(info_path)
-            if candidate:
-                new_candidates.append(candidate)
-            else:
-                LOGGER.warning(f"未找到文本插件: {tname}，跳过该插件")
+        plugin_dirs = ["plugins", os.path.join(PROJECT_DIR, "plugins")]
         fname = cfg.getFilePlugin()
+        info_paths = [get_pluginInfo_path(tname) for tname in cfg.getTextPluginList()]
         if fname:
-            info_path = get_pluginInfo_path(fname)
-            candidate = plugin_manager.getPluginCandidateByInfoPath(info_path)
-            assert candidate, f"未找到文件插件: {fname}，请检查设置"
-            new_candidates.append(candidate)
-
-        plugin_manager.setPluginCandidates(new_candidates)
-        plugin_manager.loadPlugins()
-        text_plugins = plugin_manager.getPluginsOfCategory("GTextPlugin")
-        file_plugins = plugin_manager.getPluginsOfCategory("GFilePlugin")
+            info_paths.append(get_pluginInfo_path(fname))
+        cache_key = None
+        if REUSE_PLUGINS and translator != "show-plugs":
+            cache_key = _plugin_cache_key(info_paths)
+        cached = _PLUGIN_CACHE.get(cache_key) if cache_key else None
+        if cached:
+            text_plugins, file_plugins, pristine_confs = cached
+            text_plugins, file_plugins = list(text_plugins), list(file_plugins)
+            # 上个任务合并进来的项目插件设置不能带到本任务
+            for plugin in file_plugins + text_plugins:
+                plugin.yaml_dict = copy.deepcopy(pristine_confs[id(plugin)])
+        else:
+            plugin_manager = PluginManager(
+                {"GTextPlugin": GTextPlugin, "GFilePlugin": GFilePlugin},
+                plugin_dirs,
+            )
+            plugin_manager.locatePlugins()
+            # 打印插件列表
+            if translator == "show-plugs":
+                print_plugin_list(plugin_manager)
+                return None
+            new_candidates = []
+            for tname in cfg.getTextPluginList():
+                info_path = get_pluginInfo_path(tname)
+                candidate = plugin_manager.getPluginCandidateByInfoPath(info_path)
+                if candidate:
+                    new_candidates.append(candidate)
+                else:
+                    LOGGER.warning(f"未找到文本插件: {tname}，跳过该插件")
+            if fname:
+                info_path = get_pluginInfo_path(fname)
+                candidate = plugin_manager.getPluginCandidateByInfoPath(info_path)
+                assert candidate, f"未找到文件插件: {fname}，请检查设置"
+                new_candidates.append(candidate)
+
+            plugin_manager.setPluginCandidates(new_candidates)
+            plugin_manager.loadPlugins()
+            text_plugins = plugin_manager.getPluginsOfCategory("GTextPlugin")
+            file_plugins = plugin_manager.getPluginsOfCategory("GFilePlugin")
+            if cache_key:
+                pristine_confs = {
+                    id(plugin): copy.deepcopy(plugin.yaml_dict)
+                    for plugin in file_plugins + text_plugins
+                }
+                _PLUGIN_CACHE.clear()  # 只保留最近一组，项目切换插件时不累积
+                _PLUGIN_CACHE[cache_key] = (list(text_plugins), list(file_plugins), pristine_confs)
         for plugin in file_plugins + text_plugins:
             _raise_if_stop_requested(stop_event)
             plugin_conf = plugin.yaml_dict
@@ -297,7 +341,7 @@ async def run_galtransl(cfg: CProjectConfig, translator: str, stop_event=None):
                 f"\033[32m更新地址：https://github.com/xd2333/GalTransl/releases\033[0m"
             )
 
-        if project_conf.get("splitFile", "no") in ["Num","Equal"]:
+        if project_conf.get("splitFile", "no") in ["Num","Equal","Token"]:
             val = project_conf.get("splitFile", "no")
             splitFileNum = int(project_conf.get("splitFileNum", -1))
             cross_num = int(project_conf.get("splitFileCrossNum", 0))
@@ -311,6 +355,9 @@ async def run_galtransl(cfg: CProjectConfig, translator: str, stop_event=None):
                 input_splitter = DictionaryCountSplitter(splitFileNum, cross_num)
             elif val == "Equal":
                 input_splitter = EqualPartsSplitter(splitFileNum, cross_num)
+            elif val == "Token":
+                assert splitFileNum > 0, "TokenCountSplitter下分割token数必须大于0"
+                input_splitter = TokenCountSplitter(splitFileNum, cross_num)
             else:
                 raise Exception(f"不支持的分割方法: {val}")
             # 默认的输出合并器
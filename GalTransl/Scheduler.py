@@ -0,0 +1,272 @@
+"""
+chunk 调度器。
+
+doLLMTranslate 的 worker 从调度器取 chunk。sortBy 选择调度器：
+- name：按文件名自然序，文件内按 chunk_index（原有行为）
+- size：按 chunk 大小倒序（原有行为）
+- fair：动态调度，每次 pop 时按各文件剩余工作量决定下一个 chunk（见 FairScheduler）
+
+新调度器继承 ChunkScheduler 后通过 register_scheduler 注册即可被 sortBy 选用。
+simulate 用列表调度模型在合成负载上比较各调度器的完工时间。
+"""
+
+from __future__ import annotations
+
+import copy
+import heapq
+import random
+from collections import deque
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Type
+
+from GalTransl.TokenBudget import sentence_tokens
+
+
+def chunk_cost(chunk: Any) -> float:
+    """估算 chunk 的处理耗时（原文 token 数）；模拟用的对象可直接带 cost 属性"""
+    cost = getattr(chunk, "cost", None)
+    if cost is not None:
+        return float(cost)
+    trans_list = getattr(chunk, "trans_list", None)
+    if trans_list is None:
+        return float(getattr(chunk, "chunk_size", 1))
+    return float(sum(sentence_tokens(tran)[0] for tran in trans_list))
+
+
+class ChunkScheduler:
+    """调度器基类：构造时接收全部 chunk，pop 返回下一个要处理的 chunk，取完返回 None"""
+
+    def __init__(
+        self,
+        chunks: Iterable[Any],
+        file_order: Sequence[str] = (),
+        priorities: Optional[Dict[str, int]] = None,
+        cost: Callable[[Any], float] = chunk_cost,
+        workers: int = 0,
+    ):
+        self._queue = deque(self.order(list(chunks), list(file_order), priorities or {}, cost))
+
+    def order(self, chunks, file_order, priorities, cost) -> List[Any]:
+        return chunks
+
+    def pop(self) -> Optional[Any]:
+        return self._queue.popleft() if self._queue else None
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def __iter__(self):
+        return iter(list(self._queue))
+
+
+class NameScheduler(ChunkScheduler):
+    def order(self, chunks, file_order, priorities, cost):
+        file_chunks: Dict[str, List[Any]] = {}
+        for chunk in chunks:
+            file_chunks.setdefault(chunk.file_path, []).append(chunk)
+        # 按 file_order 的顺序处理文件，文件内按 chunk_index
+        ordered = []
+        for file_path in list(file_order) + [f for f in file_chunks if f not in file_order]:
+            ordered.extend(sorted(file_chunks.pop(file_path, []), key=lambda x: x.chunk_index))
+        return ordered
+
+
+class SizeScheduler(ChunkScheduler):
+    def order(self, chunks, file_order, priorities, cost):
+        return sorted(chunks, key=lambda x: x.chunk_size, reverse=True)
+
+
+class FairScheduler(ChunkScheduler):
+    """动态公平调度：不预先排好队列，每次 pop 时按各文件当前的剩余工作量选下一个 chunk。
+
+    按 filePriority 分层，高层取完再取低层；层内：
+    1. 还没开始的文件先发首块，剩余工作量小的文件优先，小文件往往一块就能完成；
+    2. 之后优先剩余工作量最少的文件（SRPT），已开始的文件尽快全部完成；
+    3. 剩余 chunk 数不超过 workers 时改为按耗时从大到小（LPT），压缩尾部的总完工时间。
+    同一文件的各目标语言分别视为一个文件。
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[Any],
+        file_order: Sequence[str] = (),
+        priorities: Optional[Dict[str, int]] = None,
+        cost: Callable[[Any], float] = chunk_cost,
+        workers: int = 0,
+    ):
+        self._workers = max(0, int(workers or 0))
+        self._levels: Dict[int, Dict[tuple, List[Any]]] = {}
+        self._costs: Dict[int, float] = {}
+        self._remaining: Dict[tuple, float] = {}
+        self._started: set = set()
+        self._count = 0
+        priorities = priorities or {}
+        for chunk in chunks:
+            key = (chunk.file_path, getattr(chunk, "target_lang", ""))
+            level = priorities.get(chunk.file_path, 0)
+            self._levels.setdefault(level, {}).setdefault(key, []).append(chunk)
+            self._costs[id(chunk)] = cost(chunk)
+            self._remaining[key] = self._remaining.get(key, 0.0) + self._costs[id(chunk)]
+            self._count += 1
+        for files in self._levels.values():
+            for file_chunks in files.values():
+                file_chunks.sort(key=lambda x: x.chunk_index)
+
+    def pop(self) -> Optional[Any]:
+        while self._levels:
+            level = max(self._levels)
+            files = self._levels[level]
+            if not files:
+                del self._levels[level]
+                continue
+            fresh = [key for key in files if key not in self._started]
+            if fresh:
+                key = min(fresh, key=lambda k: (self._remaining[k], k))
+                self._started.add(key)
+                chunk = files[key].pop(0)
+            elif self._count <= self._workers:
+                key, index = max(
+                    ((k, i) for k, file_chunks in files.items() for i in range(len(file_chunks))),
+                    key=lambda ki: self._costs[id(files[ki[0]][ki[1]])],
+                )
+                chunk = files[key].pop(index)
+            else:
+                key = min(files, key=lambda k: (self._remaining[k], k))
+                chunk = files[key].pop(0)
+            self._remaining[key] -= self._costs[id(chunk)]
+            if not files[key]:
+                del files[key]
+            self._count -= 1
+            return chunk
+        return None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self):
+        """按当前状态预演剩余的发出顺序，不影响调度器本身"""
+        planned = copy.copy(self)
+        planned._levels = {
+            level: {key: list(file_chunks) for key, file_chunks in files.items()}
+            for level, files in self._levels.items()
+        }
+        planned._remaining = dict(self._remaining)
+        planned._started = set(self._started)
+        order = []
+        while (chunk := planned.pop()) is not None:
+            order.append(chunk)
+        return iter(order)
+
+
+SCHEDULERS: Dict[str, Type[ChunkScheduler]] = {
+    "name": NameScheduler,
+    "size": SizeScheduler,
+    "fair": FairScheduler,
+}
+
+
+def register_scheduler(name: str, scheduler_cls: Type[ChunkScheduler]) -> None:
+    SCHEDULERS[name] = scheduler_cls
+
+
+def resolve_priorities(file_paths: Iterable[str], rules: Any, input_dir: str = "") -> Dict[str, int]:
+    """把 filePriority 配置（{通配符: 优先级}）展开为 {文件路径: 优先级}，先匹配的规则生效"""
+    if not isinstance(rules, dict) or not rules:
+        return {}
+    priorities = {}
+    for file_path in file_paths:
+        rel_path = file_path[len(input_dir):].lstrip("/\\") if input_dir and file_path.startswith(input_dir) else file_path
+        for pattern, level in rules.items():
+            if fnmatch(rel_path, str(pattern)) or fnmatch(file_path, str(pattern)):
+                try:
+                    priorities[file_path] = int(level)
+                except (TypeError, ValueError):
+                    pass
+                break
+    return priorities
+
+
+def create_scheduler(
+    sort_by: str,
+    chunks: Iterable[Any],
+    file_order: Sequence[str] = (),
+    priorities: Optional[Dict[str, int]] = None,
+    workers: int = 0,
+) -> ChunkScheduler:
+    """workers 为并发请求数，动态调度器据此判断何时进入尾部"""
+    scheduler_cls = SCHEDULERS.get(sort_by, NameScheduler)
+    return scheduler_cls(chunks, file_order, priorities, workers=workers)
+
+
+@dataclass
+class SimChunk:
+    file_path: str
+    chunk_index: int
+    cost: float
+
+    @property
+    def chunk_size(self) -> float:
+        return self.cost
+
+
+def synthetic_workload(
+    big_files: int = 3,
+    big_chunks: int = 12,
+    small_files: int = 20,
+    small_chunks: int = 1,
+    seed: int = 0,
+) -> List[SimChunk]:
+    """合成负载：少量大文件（多块、块大）+ 大量小文件"""
+    rng = random.Random(seed)
+    chunks = []
+    for f in range(big_files):
+        for c in range(big_chunks):
+            chunks.append(SimChunk(f"big{f:02d}", c, rng.uniform(60, 120)))
+    for f in range(small_files):
+        for c in range(small_chunks):
+            chunks.append(SimChunk(f"small{f:02d}", c, rng.uniform(5, 30)))
+    return chunks
+
+
+def simulate(scheduler: ChunkScheduler, workers: int) -> Dict[str, Any]:
+    """列表调度模拟：空闲 worker 立即取下一个 chunk，耗时取 chunk.cost。
+
+    返回 makespan（总完工时间）、各文件的首个产出时间与完成时间及其均值。
+    """
+    free_at = [0.0] * max(1, workers)
+    heapq.heapify(free_at)
+    first_output: Dict[str, float] = {}
+    completion: Dict[str, float] = {}
+    while True:
+        chunk = scheduler.pop()
+        if chunk is None:
+            break
+        start = heapq.heappop(free_at)
+        end = start + chunk_cost(chunk)
+        heapq.heappush(free_at, end)
+        first_output[chunk.file_path] = min(first_output.get(chunk.file_path, end), end)
+        completion[chunk.file_path] = max(completion.get(chunk.file_path, 0.0), end)
+    files = len(completion) or 1
+    return {
+        "makespan": max(completion.values(), default=0.0),
+        "mean_first_output": sum(first_output.values()) / files,
+        "mean_completion": sum(completion.values()) / files,
+        "first_output": first_output,
+        "completion": completion,
+    }
+
+
+def compare_schedulers(workers: int = 4, **workload) -> Dict[str, Dict[str, float]]:
+    """在同一合成负载上运行全部已注册的调度器，返回各自的汇总指标"""
+    chunks = synthetic_workload(**workload)
+    file_order = sorted({chunk.file_path for chunk in chunks})
+    results = {}
+    for name in SCHEDULERS:
+        result = simulate(create_scheduler(name, chunks, file_order, workers=workers), workers)
+        results[name] = {
+            key: round(value, 1)
+            for key, value in result.items()
+            if isinstance(value, float)
+        }
+    return results
@@ -7,7 +7,7 @@ import os
 import traceback
 from typing import Any
 
-from GalTransl import LOGGER, DEBUG_LEVEL
+from GalTransl import LOGGER, DEBUG_LEVEL, Events
 from GalTransl.Cache import compact_cache_append_logs
 from GalTransl.ConfigHelper import CProjectConfig
 from GalTransl.Runner import run_galtransl
@@ -241,6 +241,13 @@ async def run_job_async(
                 LOGGER.warning(f"[cache]停止翻译后合并增量缓存失败：{str(ex)}")
         current_state.finished_at = _utcnow_text()
         update_runtime_status(spec.project_dir, workers_active=0)
+        Events.emit(
+            "job",
+            job_id=spec.job_id,
+            project_dir=spec.project_dir,
+            status=current_state.status,
+            error=current_state.error,
+        )
 
     return current_state
 
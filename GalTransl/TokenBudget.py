@@ -0,0 +1,123 @@
+"""
+按 token 预算打包请求与分片。
+
+字幕句子长短差异极大（「はい」与整段独白），按句数切分时请求要么远低于上下文预算，
+要么超出后触发解析失败与拆分重试。这里用本地估算的 token 数来决定每次请求/每个分片
+容纳多少句：有 tiktoken 时用 o200k_base 编码计数，否则按字符类别粗略估算。
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Callable, Optional, Sequence, Tuple
+
+# 每句在 jsonline 输入/输出中的固定开销（sig、id、name、dst 等键名与标点）
+LINE_OVERHEAD_TOKENS = 12
+# 译文 token 数相对原文的估计倍率
+OUTPUT_RATIO = 1.3
+# 启用 token 预算后单次请求的句数上限，避免超短句把一次请求撑到几百行
+MAX_PACKED_LINES = 64
+
+_encoder: Any = None
+_encoder_loaded = False
+
+
+def _get_encoder():
+    global _encoder, _encoder_loaded
+    if not _encoder_loaded:
+        _encoder_loaded = True
+        try:
+            import tiktoken
+
+            _encoder = tiktoken.get_encoding("o200k_base")
+        except Exception:
+            _encoder = None
+    return _encoder
+
+
+def _heuristic_tokens(text: str) -> int:
+    cjk = 0
+    other = 0
+    for ch in text:
+        if ord(ch) >= 0x2E80:
+            cjk += 1
+        else:
+            other += 1
+    # 假名/汉字大多 1 字 1 token，ASCII 约 4 字符 1 token
+    return cjk + (other + 3) // 4
+
+
+@lru_cache(maxsize=65536)
+def estimate_tokens(text: str) -> int:
+    """估算文本的 token 数"""
+    if not text:
+        return 0
+    encoder = _get_encoder()
+    if encoder is not None:
+        try:
+            return len(encoder.encode(text, disallowed_special=()))
+        except Exception:
+            pass
+    return _heuristic_tokens(text)
+
+
+def sentence_tokens(tran) -> Tuple[int, int]:
+    """返回单句的 (输入, 输出) token 估算"""
+    src = estimate_tokens(tran.post_jp) + estimate_tokens(tran.get_speaker_name())
+    return src + LINE_OVERHEAD_TOKENS, int(src * OUTPUT_RATIO) + LINE_OVERHEAD_TOKENS
+
+
+def pack_count(
+    trans_list: Sequence,
+    start: int,
+    max_items: int,
+    input_budget: int,
+    output_budget: int = 0,
+    overhead: int = 0,
+) -> int:
+    """从 start 开始最多取 max_items 句，在输入/输出预算内尽量多装；至少返回 1"""
+    used_in = overhead
+    used_out = 0
+    count = 0
+    for tran in trans_list[start : start + max_items]:
+        tok_in, tok_out = sentence_tokens(tran)
+        if count > 0 and (
+            (input_budget and used_in + tok_in > input_budget)
+            or (output_budget and used_out + tok_out > output_budget)
+        ):
+            break
+        used_in += tok_in
+        used_out += tok_out
+        count += 1
+    return max(count, 1)
+
+
+def pack_request(
+    trans_list: Sequence,
+    start: int,
+    max_items: int,
+    input_budget: int,
+    output_budget: int,
+    overhead: int,
+    gen_dic: Optional[Callable[[Sequence], str]] = None,
+) -> Tuple[Sequence, str]:
+    """打包一次请求，返回 (句子切片, 术语表 prompt)。
+
+    术语表随所选句子变化，先不计术语表打包，再把术语表计入开销复核一次。
+    """
+    count = pack_count(trans_list, start, max_items, input_budget, output_budget, overhead)
+    split = trans_list[start : start + count]
+    dic_prompt = gen_dic(split) if gen_dic else ""
+    if dic_prompt and count > 1:
+        recount = pack_count(
+            trans_list,
+            start,
+            count,
+            input_budget,
+            output_budget,
+            overhead + estimate_tokens(dic_prompt),
+        )
+        if recount < count:
+            split = trans_list[start : start + recount]
+            dic_prompt = gen_dic(split)
+    return split, dic_prompt
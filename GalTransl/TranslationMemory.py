@@ -0,0 +1,240 @@
+"""
+项目级翻译记忆（translation memory）。
+
+缓存按"前句+本句+后句"精确命中，标点/空格略有不同或邻句变化的句子都要重新请求。
+翻译记忆只以本句原文为键，收录每个文件完成后写入 transl_cache 的译文，并持久化为 jsonl：
+- 原文规范化（NFKC、去空白）后相同的句子直接复用记忆中的译文，不再请求（translMemoryReuse）
+- 相似度 ≥ translMemoryHint 的句子把相似句及其译文作为参考附在术语表后，供模型参照
+
+相似句只作参考、不直接复用：一句话与其否定形式的 bigram 相似度可以高达 0.98；
+只有标点不同的句子也可能语气不同（「そうですか。」与「そうですか？」），同样只作参考。
+每条记忆带有目标语言与翻译引擎，载入时只取与当前一致的条目，共享的记忆文件不会串用。
+
+相似度为字符 bigram 集合的 Dice 系数（规范化后完全相同记为 1.0），
+用 bigram 倒排索引取候选，并按长度比剪枝；过于常见的 bigram 不参与召回，单次查询在毫秒内完成。
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import unicodedata
+from glob import glob
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import orjson
+
+from GalTransl import LOGGER
+from GalTransl.Cache import _cache_get, check_retran_key
+
+MEMORY_FILE_NAME = "transl_memory.jsonl"
+# 倒排表长度超过该值的 bigram（如句首的「あ」）召回价值低，查询时跳过
+MAX_POSTINGS = 512
+# 每次请求最多附带的参考译文条数
+MAX_HINTS = 8
+_SPACES = re.compile(r"\s+")
+_FAILED_MARKERS = ("(Failed)", "(翻译失败)")
+
+
+def _normalize(text: str) -> str:
+    return _SPACES.sub("", unicodedata.normalize("NFKC", text))
+
+
+def _grams(key: str) -> set:
+    padded = f"\x02{key}\x03"
+    return {padded[i : i + 2] for i in range(len(padded) - 1)}
+
+
+class TranslationMemory:
+    def __init__(self, path: str = "", target_lang: str = "", engine: str = "") -> None:
+        self.path = path
+        self.target_lang = target_lang
+        self.engine = engine
+        self._src: List[str] = []
+        self._dst: List[str] = []
+        self._gram_count: List[int] = []
+        self._exact: Dict[str, int] = {}
+        self._postings: Dict[str, List[int]] = {}
+        # 尚未写入 jsonl 的新条目
+        self._pending: List[Dict[str, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._src)
+
+    def add(self, src: str, dst: str, record: bool = True) -> bool:
+        key = _normalize(src)
+        if not key or not dst or any(marker in dst for marker in _FAILED_MARKERS):
+            return False
+        idx = self._exact.get(key)
+        if idx is not None:
+            if self._dst[idx] == dst:
+                return False
+            self._dst[idx] = dst
+        else:
+            idx = len(self._src)
+            grams = _grams(key)
+            self._src.append(src)
+            self._dst.append(dst)
+            self._gram_count.append(len(grams))
+            self._exact[key] = idx
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(idx)
+        if record:
+            self._pending.append(
+                {"src": src, "dst": dst, "lang": self.target_lang, "engine": self.engine}
+            )
+        return True
+
+    def add_trans(self, trans_list: Iterable) -> int:
+        """收录已译句子（post_jp → 校对译文或 pre_zh），返回新增/更新的条数；被 find_problems 标记的不收录"""
+        added = 0
+        for tran in trans_list:
+            if tran.problem:
+                continue
+            dst = tran.proofread_zh or tran.pre_zh
+            if tran.post_jp and self.add(tran.post_jp, dst):
+                added += 1
+        return added
+
+    def match(self, text: str, min_score: float) -> Optional[Tuple[float, str, str]]:
+        """返回相似度不低于 min_score 的最佳条目 (score, src, dst)"""
+        key = _normalize(text)
+        if not key or not self._src:
+            return None
+        idx = self._exact.get(key)
+        if idx is not None:
+            return 1.0, self._src[idx], self._dst[idx]
+        if min_score >= 1.0:
+            return None
+
+        grams = _grams(key)
+        size = len(grams)
+        min_score = max(min_score, 0.01)
+        # Dice ≥ t 要求候选的 bigram 数落在 [size*t/(2-t), size*(2-t)/t]
+        low = size * min_score / (2.0 - min_score)
+        high = size * (2.0 - min_score) / min_score
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            postings = self._postings.get(gram)
+            if not postings or len(postings) > MAX_POSTINGS:
+                continue
+            for idx in postings:
+                shared[idx] = shared.get(idx, 0) + 1
+
+        best = None
+        best_score = min_score
+        for idx, count in shared.items():
+            other = self._gram_count[idx]
+            if other < low or other > high:
+                continue
+            score = 2.0 * count / (size + other)
+            if score >= best_score:
+                best, best_score = idx, score
+        if best is None:
+            return None
+        return best_score, self._src[best], self._dst[best]
+
+    def lookup(self, text: str) -> Optional[str]:
+        """返回可直接复用的译文：仅限原文规范化后完全相同"""
+        key = _normalize(text)
+        idx = self._exact.get(key) if key else None
+        return self._dst[idx] if idx is not None else None
+
+    def reuse(self, trans_list: List, retran_key="") -> Tuple[List, List]:
+        """可直接复用的句子套用记忆译文，返回 (已套用, 其余)；命中 retranslKey 的句子总是重翻"""
+        reused, rest = [], []
+        for tran in trans_list:
+            found = None
+            if tran.post_jp and not (retran_key and check_retran_key(retran_key, tran.pre_jp)):
+                found = self.lookup(tran.post_jp)
+            if found is None:
+                rest.append(tran)
+                continue
+            tran.pre_zh = tran.post_zh = found
+            tran.trans_by = "TranslMemory"
+            reused.append(tran)
+        return reused, rest
+
+    def hint_prompt(self, trans_list: Iterable, min_score: float, style: str = "gpt") -> str:
+        """为一次请求生成相似句参考；style 与术语表格式一致（gpt/tsv/sakura）"""
+        hints = []
+        seen = set()
+        for tran in trans_list:
+            found = self.match(tran.post_jp, min_score) if tran.post_jp else None
+            if found is None or found[1] in seen:
+                continue
+            seen.add(found[1])
+            hints.append(found)
+            if len(hints) >= MAX_HINTS:
+                break
+        if not hints:
+            return ""
+        if style == "sakura":
+            return "".join(f"{src}->{dst} #相似句参考译文\n" for _, src, dst in hints)
+        if style == "tsv":
+            return "\nREFERENCE_SRC\tREFERENCE_DST\n" + "".join(
+                f"{src}\t{dst}\n" for _, src, dst in hints
+            )
+        return (
+            "\n# Reference Translations (similar lines translated before)\n"
+            "| Src | Dst |\n| --- | --- |\n"
+            + "".join(f"| {src} | {dst} |\n" for _, src, dst in hints)
+        )
+
+    def load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as f:
+            for line in f:
+                try:
+                    entry = orjson.loads(line)
+                    if entry.get("lang") != self.target_lang or entry.get("engine") != self.engine:
+                        continue
+                    self.add(entry["src"], entry["dst"], record=False)
+                except Exception:
+                    continue
+
+    def import_cache_dir(self, cache_dir: str) -> int:
+        """从 transl_cache 的快照中收录译文（首次启用翻译记忆时）"""
+        added = 0
+        for cache_file in glob(os.path.join(cache_dir, "**", "*.json"), recursive=True):
+            try:
+                with open(cache_file, "rb") as f:
+                    cache_list = orjson.loads(f.read())
+            except Exception:
+                continue
+            if not isinstance(cache_list, list):
+                continue
+            for cache in cache_list:
+                if not isinstance(cache, dict) or cache.get("problem"):
+                    continue
+                dst = _cache_get(cache, "proofread_dst", "") or _cache_get(cache, "pre_dst", "")
+                if self.add(_cache_get(cache, "post_src", "") or "", dst or ""):
+                    added += 1
+        return added
+
+    def flush(self) -> None:
+        """把新条目追加写入 jsonl"""
+        if not self.path or not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        try:
+            with open(self.path, "ab") as f:
+                for entry in pending:
+                    f.write(orjson.dumps(entry))
+                    f.write(b"\n")
+        except Exception as e:
+            LOGGER.warning(f"[memory]写入翻译记忆失败：{self.path}: {e}")
+
+
+def load_translation_memory(
+    path: str, cache_dir: str = "", target_lang: str = "", engine: str = ""
+) -> TranslationMemory:
+    memory = TranslationMemory(path, target_lang, engine)
+    memory.load()
+    if len(memory) == 0 and cache_dir:
+        added = memory.import_cache_dir(cache_dir)
+        if added:
+            LOGGER.info(f"[memory]从缓存导入 {added} 条翻译记忆")
+    memory.flush()
+    return memory
@@ -7,8 +7,12 @@ _TRANSLATE_CMD = ['translate/translate'] if _FROZEN else [sys.executable, 'trans
 _SEPARATE_CMD = ['separate/separate'] if _FROZEN else [sys.executable, 'separate.py']
 import shutil
 import shlex
+import functools
+import hashlib
+import contextlib
 import socket
 import tempfile
+import wave
 
 def _resolve_ffmpeg() -> tuple[str, str]:
     """解析 ffmpeg/ffprobe 路径"""
@@ -55,13 +59,14 @@ import json
 import yaml
 import threading
 import queue
+from concurrent.futures import ThreadPoolExecutor, Future
 
 from dataclasses import dataclass
 import requests
 import httpx
 from openai import OpenAI
 import subprocess
-from time import sleep, time
+from time import monotonic, sleep, time
 from yt_dlp import YoutubeDL
 from bilibili_dl.bilibili_dl.Video import Video
 from bilibili_dl.bilibili_dl.downloader import download
@@ -166,9 +171,12 @@ def _set_command_option(command, option_names, preferred_option, value):
 
 def _build_crispasr_command(
     input_file, output_file, model_file, language, param_crispasr,
-    aligner_file=None, backend=None,
+    aligner_file=None, backend=None, threads=None,
 ):
-    """按 param.txt 模板替换占位符，生成与旧 Whisper 相同风格的启动参数。"""
+    """按 param.txt 模板替换占位符，生成与旧 Whisper 相同风格的启动参数。
+
+    threads 不为空时写入 $threads 占位符并强制 --threads，避免多进程并行时超额订阅 CPU。
+    """
     crispasr_dir = Path('crispasr').resolve()
     executable_name = 'crispasr.exe' if os.name == 'nt' else 'crispasr'
     executable = crispasr_dir / executable_name
@@ -200,6 +208,7 @@ def _build_crispasr_command(
         '$language': language or 'auto',
         '$output_file': str(Path(output_file).resolve()),
         '$input_file': str(Path(input_file).resolve()),
+        '$threads': str(threads or os.cpu_count() or 1),
     }
     command = _split_command_template(param_crispasr)
     for index, token in enumerate(command):
@@ -210,9 +219,152 @@ def _build_crispasr_command(
         raise ValueError('CrispASR param.txt is empty')
     _set_command_option(command, ('--backend',), '--backend', selected_backend)
     _set_command_option(command, ('--aligner-model', '-am'), '--aligner-model', str(aligner_path.resolve()))
+    if threads:
+        _set_command_option(command, ('--threads', '-t'), '--threads', str(threads))
     return command
 
 
+_FICLONE = 0x40049409  # Linux ioctl：btrfs/xfs 等文件系统上的写时复制克隆
+
+
+def _stage_file(src, dst):
+    """把 src 放到 dst 供子进程只读使用，尽量不复制数据。
+
+    依次尝试 reflink（写时复制）、硬链接，都不可用时才退回完整复制。
+    返回实际使用的方式：'reflink' / 'hardlink' / 'copy'。
+    """
+    src, dst = str(src), str(dst)
+    if os.name != 'nt':
+        try:
+            import fcntl
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            return 'reflink'
+        except (ImportError, OSError):
+            try:
+                os.remove(dst)
+            except OSError:
+                pass
+    try:
+        os.link(src, dst)
+        return 'hardlink'
+    except OSError:
+        shutil.copyfile(src, dst)
+        return 'copy'
+
+
+_ASR_CACHE_DIR = os.path.join('project', 'cache', 'asr')
+_ASR_CACHE_MAX_BYTES = 256 * 1024 * 1024  # 听写缓存总大小上限
+_ASR_CACHE_MAX_AGE = 30 * 24 * 3600  # 超过该时长未命中的条目被清理（秒）
+
+
+def _file_fingerprint(path):
+    """用路径、大小和修改时间标识模型文件，避免对数 GB 权重做全量哈希。"""
+    try:
+        stat = Path(path).stat()
+        return f'{Path(path).resolve()}|{stat.st_size}|{stat.st_mtime_ns}'
+    except OSError:
+        return str(path)
+
+
+def _asr_cache_key(wav_file, model_file, aligner_file, backend, language, param_crispasr,
+                   server_template=''):
+    """计算听写结果缓存键：音频采样内容 + 模型/对齐模型/后端/语言 + 参数模板。
+
+    只哈希 PCM 采样而非整个文件，文件改名、换目录或重新提取都能命中。
+    参数模板按空白切分后参与哈希，输入输出路径等占位符保持未替换状态。
+    常驻听写模式下实际生效的是 param_server.txt，由 server_template 一并计入。
+    """
+    crispasr_dir = Path('crispasr').resolve()
+    model_path = Path(model_file)
+    if not model_path.is_absolute():
+        model_path = crispasr_dir / model_path
+    if aligner_file:
+        aligner_path = Path(aligner_file)
+        if not aligner_path.is_absolute():
+            aligner_path = crispasr_dir / aligner_path
+    else:
+        aligners = _list_crispasr_aligners()
+        aligner_path = crispasr_dir / aligners[0] if aligners else Path('')
+
+    digest = hashlib.sha256()
+    for part in (
+        _file_fingerprint(model_path),
+        _file_fingerprint(aligner_path),
+        str(backend or 'qwen3-1.7b').strip() or 'qwen3-1.7b',
+        language or 'auto',
+        ' '.join(_split_command_template(param_crispasr or '')),
+        ' '.join(_split_command_template(server_template or '')),
+    ):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    with wave.open(str(wav_file), 'rb') as wav:
+        digest.update(repr(wav.getparams()[:3]).encode('ascii'))
+        while True:
+            data = wav.readframes(_WAV_COPY_BLOCK_FRAMES)
+            if not data:
+                break
+            digest.update(data)
+    return digest.hexdigest()
+
+
+def _evict_asr_cache(cache_dir=_ASR_CACHE_DIR, max_bytes=_ASR_CACHE_MAX_BYTES, max_age=_ASR_CACHE_MAX_AGE):
+    """清理听写缓存：先删除超过 max_age 未使用的条目，再按最近使用时间从旧到新删到 max_bytes 以内。
+
+    命中时会刷新条目的修改时间，因此修改时间即最近使用时间。返回删除的条目数。
+    """
+    try:
+        names = os.listdir(cache_dir)
+    except OSError:
+        return 0
+    now = time()
+    entries = []
+    removed = 0
+    for name in names:
+        path = os.path.join(cache_dir, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        if not os.path.isfile(path):
+            continue
+        # 听写中途退出留下的临时文件同样按时长清理
+        if now - stat.st_mtime > max_age:
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _mtime, size, _path in entries)
+    for _mtime, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            removed += 1
+            total -= size
+        except OSError:
+            pass
+    return removed
+
+
+def _crispasr_pool_size(configured_workers=0):
+    """按 CPU 核数推导 CrispASR 并行进程数与每进程线程数。
+
+    configured_workers > 0 时使用用户设置；否则每 8 核一个进程，最多 4 个。
+    线程数按进程数均分全部核心，保证总线程数不超过核数。
+    """
+    cores = os.cpu_count() or 1
+    if configured_workers and configured_workers > 0:
+        workers = min(int(configured_workers), cores)
+    else:
+        workers = max(1, min(4, cores // 8))
+    threads = max(1, cores // workers)
+    return workers, threads
+
+
 def _format_command(command):
     return subprocess.list2cmdline(command) if os.name == 'nt' else shlex.join(command)
 
@@ -286,6 +438,121 @@ def _offline_asr_test_audio(language):
     return sample.resolve()
 
 
+_WAV_COPY_BLOCK_FRAMES = 16000 * 60  # 每次搬运约 1 分钟的 16k PCM
+
+
+def _nominal_cut_frames(total_frames, frame_rate, segment_seconds):
+    """按固定时长计算各片段起始帧；不足 1 秒的尾巴并入最后一段。"""
+    segment_frames = max(1, int(segment_seconds * frame_rate))
+    cuts = list(range(0, total_frames, segment_frames)) or [0]
+    if len(cuts) > 1 and total_frames - cuts[-1] <= frame_rate:
+        cuts.pop()
+    return cuts
+
+
+_VAD_FRAME_SECONDS = 0.02      # 能量帧长 20ms
+_VAD_SMOOTH_SECONDS = 0.3      # 平滑窗口，避免在音节间的短暂停顿处下刀
+_SEGMENT_OVERLAP_SECONDS = 1.0  # 相邻片段共享的音频长度，合并时按归属区间去重
+
+
+def _plan_silence_cut_frames(wav_file, segment_seconds, tolerance_seconds=None):
+    """在 16k PCM 上做一次能量 VAD，把每个切点移到容差窗口内最近的静音处。
+
+    以上一个实际切点 + segment_seconds 作为名义切点，在 ±tolerance_seconds 内
+    优先选择距名义切点最近的静音帧（平滑能量不高于全局 10% 分位数），
+    找不到静音时退而取窗口内最安静的位置。返回各片段起始帧（首项为 0）。
+    缺少 NumPy 时退化为固定时长切分。
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    with wave.open(str(wav_file), 'rb') as src:
+        frame_rate = src.getframerate()
+        total_frames = src.getnframes()
+        if np is None or src.getsampwidth() != 2 or src.getnchannels() != 1:
+            return _nominal_cut_frames(total_frames, frame_rate, segment_seconds)
+
+        hop = max(1, int(frame_rate * _VAD_FRAME_SECONDS))
+        energies = []
+        block_frames = _WAV_COPY_BLOCK_FRAMES - _WAV_COPY_BLOCK_FRAMES % hop
+        while True:
+            data = src.readframes(block_frames)
+            if not data:
+                break
+            samples = np.frombuffer(data, dtype='<i2')
+            usable = samples[:len(samples) - len(samples) % hop].astype(np.float32)
+            if usable.size:
+                energies.append(np.square(usable).reshape(-1, hop).mean(axis=1))
+
+    if not energies:
+        return [0]
+    energy = np.concatenate(energies)
+    smooth_width = max(1, int(_VAD_SMOOTH_SECONDS / _VAD_FRAME_SECONDS))
+    energy = np.convolve(energy, np.ones(smooth_width) / smooth_width, mode='same')
+    silence_level = float(np.percentile(energy, 10))
+
+    frames_per_second = frame_rate / hop
+    segment_len = int(segment_seconds * frames_per_second)
+    if tolerance_seconds is None:
+        tolerance_seconds = min(30.0, segment_seconds / 4)
+    tolerance = int(tolerance_seconds * frames_per_second)
+    tail_guard = int(frames_per_second)  # 不在最后 1 秒内下刀
+
+    cuts = [0]
+    while True:
+        nominal = cuts[-1] + segment_len
+        if nominal >= len(energy) - tail_guard:
+            break
+        low = max(cuts[-1] + segment_len // 2, nominal - tolerance)
+        high = min(len(energy) - tail_guard, nominal + tolerance + 1)
+        if high <= low:
+            break
+        window = energy[low:high]
+        quiet = np.flatnonzero(window <= silence_level)
+        if quiet.size:
+            pick = low + int(quiet[np.argmin(np.abs(quiet + low - nominal))])
+        else:
+            pick = low + int(np.argmin(window))
+        cuts.append(pick)
+    return [cut * hop for cut in cuts]
+
+
+def _write_wav_segments(wav_file, cut_frames, output_dir, overlap_seconds=0.0):
+    """顺序读取 WAV，按 cut_frames 切点写出全部 segment_XXXX.16k.wav。
+
+    cut_frames 为各片段归属区间的起始帧（首项为 0）。除首段外，每段向前多取
+    overlap_seconds 的音频，仅需小幅回退读指针，整体仍是一次线性扫描。
+    返回 [(片段路径, 片段音频起始秒数, 归属区间起点秒数, 归属区间终点秒数)]，
+    最后一段的归属终点为 inf。
+    """
+    segments = []
+    with wave.open(str(wav_file), 'rb') as src:
+        params = src.getparams()
+        frame_rate = src.getframerate()
+        frame_bytes = src.getsampwidth() * src.getnchannels()
+        total_frames = src.getnframes()
+        overlap = int(overlap_seconds * frame_rate)
+        bounds = list(cut_frames) + [total_frames]
+        for index, (cut, next_cut) in enumerate(zip(bounds, bounds[1:])):
+            start = max(0, cut - overlap) if index > 0 else 0
+            segment_file = os.path.join(output_dir, f"segment_{index:04d}.16k.wav")
+            src.setpos(start)
+            written = 0
+            with wave.open(segment_file, 'wb') as dst:
+                dst.setparams(params)
+                while written < next_cut - start:
+                    data = src.readframes(min(next_cut - start - written, _WAV_COPY_BLOCK_FRAMES))
+                    if not data:
+                        break
+                    dst.writeframesraw(data)
+                    written += len(data) // frame_bytes
+            own_end = next_cut / frame_rate if next_cut < total_frames else float('inf')
+            segments.append((segment_file, start / frame_rate, cut / frame_rate, own_end))
+    return segments
+
+
 def open_path(path_value: str):
     target = os.path.abspath(path_value)
     QtGui.QDesktopServices.openUrl(QtCore.QUrl.fromLocalFile(target))
@@ -519,87 +786,52 @@ def _stream_proc_to_queue(proc, msg_queue, label=None):
             pass
 
 
-# GalTransl 逐行翻译输出解析器：将三行格式转换为 JSON，并按批次分组
-# 原始格式:  v--{id}[-{speaker}]\n> Src: {text}\n> Dst: {text}
-# 目标格式:  同一批次的所有 src 先输出，再输出所有 dst（纯 JSON，无前缀）
+# GalTransl 的逐行翻译记录：v--{id}[-{speaker}]\n> Src: {text}\n> Dst: {text}
+# 译文经事件文件送达，人类可读日志中的这些记录由 _TranslationLogFilter 丢弃
 _TRANSLATION_LINE_RE = re.compile(r'^v--(\d+)')
+_LOG_RECORD_HEADER_RE = re.compile(r'^\[\d{2}-\d{2} \d{2}:\d{2}:\d{2}\]\[[A-Z]+\]')  # Runner.CONSOLE_FORMAT
 
-class _TranslationLogParser:
-    """将 GalTransl 逐行翻译记录转换为结构化 JSON，src/dst 分组输出"""
+
+class _TranslationLogFilter:
+    """从 GalTransl 人类可读日志中去掉翻译记录，其余日志原样放行。
+
+    一条日志记录以 "[时间][级别]" 开头，之后不带该前缀的行都是它的续行。
+    翻译记录是消息为空、续行以空行与 v--/Src/Dst 开头的记录，整条（含所有续行）丢弃。
+    """
 
     def __init__(self):
-        self._line_buf: list[str] = []      # 当前翻译条目的三行缓冲
-        self._batch_src: list[str] = []     # 当前批次的 src JSON 行
-        self._batch_dst: list[str] = []     # 当前批次的 dst JSON 行
+        self._held: list[str] = []  # 消息为空的记录头及其后的空行，待判断是否为翻译记录
+        self._suppress = False
+
+    @staticmethod
+    def is_translation_record(line: str) -> bool:
+        return line.startswith(('> Src: ', '> Dst: ')) or bool(_TRANSLATION_LINE_RE.match(line))
 
     def feed(self, line: str) -> list[str]:
-        """输入一行，返回转换后的零行或多行（批次边界时刷新）"""
-        # 匹配翻译输出头部 v--{id}[-{speaker}]
-        header_m = _TRANSLATION_LINE_RE.match(line)
-        if header_m:
-            # 新条目开始，刷新不完整的行缓冲
-            flushed = self._flush_line_buf()
-            self._line_buf = [line]
-            return flushed
-
-        if self._line_buf:
-            if line.startswith('> Src: '):
-                self._line_buf.append(line)
+        header = _LOG_RECORD_HEADER_RE.match(line)
+        if header:
+            released = self.flush()
+            self._suppress = False
+            if not line[header.end():].strip():
+                self._held = [line]
+                return released
+            return released + [line]
+        if self._held:
+            if not line.strip():
+                self._held.append(line)
                 return []
-            if line.startswith('> Dst: '):
-                self._line_buf.append(line)
-                self._add_to_batch()
-                self._line_buf = []
+            if self.is_translation_record(line):
+                self._held = []
+                self._suppress = True
                 return []
-            # 模式中断：刷新所有缓冲区
-            return self._flush_all() + [line]
-
-        # 非翻译行：如果批次中有累积的翻译，先刷新批次
-        flushed = self._flush_batch()
-        if flushed:
-            return flushed + [line]
+            return self.flush() + [line]
+        if self._suppress or self.is_translation_record(line):
+            return []
         return [line]
 
     def flush(self) -> list[str]:
-        """最终刷新所有残留缓冲"""
-        return self._flush_all()
-
-    # 内部方法
-
-    def _add_to_batch(self):
-        """将三行缓冲转换为 JSON 并添加到批次"""
-        if len(self._line_buf) != 3:
-            return
-        header, src_line, dst_line = self._line_buf
-        id_m = _TRANSLATION_LINE_RE.match(header)
-        if not id_m:
-            return
-        trans_id = id_m.group(1)
-        src_text = src_line[7:]   # 去掉 "> Src: " 前缀
-        dst_text = dst_line[7:]   # 去掉 "> Dst: " 前缀
-        self._batch_src.append(json.dumps(
-            {"id": int(trans_id), "src": src_text}, ensure_ascii=False))
-        self._batch_dst.append(json.dumps(
-            {"id": int(trans_id), "dst": dst_text}, ensure_ascii=False))
-
-    def _flush_line_buf(self) -> list[str]:
-        """刷新不完整的行缓冲（模式中断时保留原始文本）"""
-        result = self._line_buf
-        self._line_buf = []
-        return result
-
-    def _flush_batch(self) -> list[str]:
-        """刷新累积的批次：只输出 dst（翻译结果）"""
-        if not self._batch_dst:
-            return []
-        result = list(self._batch_dst)
-        self._batch_src = []
-        self._batch_dst = []
-        return result
-
-    def _flush_all(self) -> list[str]:
-        """刷新所有缓冲"""
-        return self._flush_line_buf() + self._flush_batch()
+        held, self._held = self._held, []
+        return [line for line in held if line.strip()]
 
 @dataclass
 class TranscribedFile:
@@ -609,43 +841,923 @@ class TranscribedFile:
     output_dir: str      # 该文件的输出目录
     output_format: str   # 输出格式（如 '目标SRT', '双语SRT'）
     orig_srt_path: str   # 原始 SRT 路径（用于双语合并，空串表示无）
+    source_path: str = ''  # 所属输入的基本路径（分段时为原文件），空串表示即 base_path
+
+
+@dataclass
+class MediaJob:
+    """流水线中流转的单个输入：下载阶段补全本地路径，提取阶段补全输出目录和 16k 音频"""
+    index: int           # 在输入列表中的序号，用于按原顺序交付
+    input_file: str      # 输入路径 / 链接；下载后替换为本地文件
+    output_dir: str = ''  # 该文件的输出目录
+    wav_file: str = ''   # 提取出的 16k WAV，空串表示无需听写
+
+
+class StagedPipeline:
+    """分阶段流水线：每个阶段有独立的工作线程数，阶段之间用有界队列交接。
+
+    stages 为 [(名称, handler, 线程数)]，handler(item) 返回处理后的 item，
+    返回 None 表示丢弃该项。run() 按输入顺序逐个产出最后一个阶段的结果；
+    stop_event 置位或调用 abort() 后各阶段不再接收新任务。
+    阶段中抛出的异常会在产出到该项时于调用方线程重新抛出。
+    """
+
+    _SENTINEL = object()
+    _POLL_INTERVAL = 0.5
+
+    def __init__(self, stages, stop_event, queue_size=2):
+        self._stages = stages
+        self._stop_event = stop_event
+        self._queue_size = max(1, int(queue_size))
+        self._abort_event = threading.Event()
+
+    def abort(self):
+        """停止接收新任务（不影响 stop_event 关联的其他任务）"""
+        self._abort_event.set()
+
+    def _stopped(self):
+        return self._abort_event.is_set() or self._stop_event.is_set()
+
+    def _put(self, target_queue, entry):
+        """带取消检查的阻塞 put；流水线停止时返回 False"""
+        while not self._stopped():
+            try:
+                target_queue.put(entry, timeout=self._POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, source_queue):
+        """带取消检查的阻塞 get；流水线停止且暂无数据时返回哨兵"""
+        while True:
+            try:
+                return source_queue.get(timeout=self._POLL_INTERVAL)
+            except queue.Empty:
+                if self._stopped():
+                    return self._SENTINEL
+
+    def _feed(self, items, out_queue, consumers):
+        for index, item in enumerate(items):
+            if not self._put(out_queue, (index, item, None)):
+                return
+        for _unused in range(consumers):
+            self._put(out_queue, self._SENTINEL)
+
+    def _stage_worker(self, handler, in_queue, out_queue, state, consumers):
+        while True:
+            entry = self._get(in_queue)
+            if entry is self._SENTINEL:
+                break
+            index, item, error = entry
+            if self._stopped():
+                break
+            if error is None and item is not None:
+                try:
+                    item = handler(item)
+                except Exception as e:
+                    item, error = None, e
+            # 被丢弃的项也要向下游交接，保证按序交付不会卡住
+            if not self._put(out_queue, (index, item, error)):
+                break
+        with state['lock']:
+            state['remaining'] -= 1
+            last = state['remaining'] == 0
+        if last:
+            for _unused in range(consumers):
+                self._put(out_queue, self._SENTINEL)
+
+    def run(self, items):
+        queues = [queue.Queue(maxsize=self._queue_size) for _unused in range(len(self._stages) + 1)]
+        worker_counts = [max(1, int(workers)) for _name, _handler, workers in self._stages]
+        threads = [threading.Thread(
+            target=self._feed, args=(items, queues[0], worker_counts[0]),
+            name='pipeline-feed', daemon=True)]
+        for stage_idx, (name, handler, _workers) in enumerate(self._stages):
+            # 最后一个阶段交接给调用方（单个消费者）
+            consumers = worker_counts[stage_idx + 1] if stage_idx + 1 < len(self._stages) else 1
+            state = {'lock': threading.Lock(), 'remaining': worker_counts[stage_idx]}
+            for worker_idx in range(worker_counts[stage_idx]):
+                threads.append(threading.Thread(
+                    target=self._stage_worker,
+                    args=(handler, queues[stage_idx], queues[stage_idx + 1], state, consumers),
+                    name=f'pipeline-{name}-{worker_idx}', daemon=True))
+        for t in threads:
+            t.start()
+
+        # 多线程阶段可能乱序完成，按输入序号重排后交付
+        reorder = {}
+        next_index = 0
+        try:
+            while True:
+                entry = self._get(queues[-1])
+                if entry is self._SENTINEL:
+                    break
+                index, item, error = entry
+                reorder[index] = (item, error)
+                while next_index in reorder:
+                    item, error = reorder.pop(next_index)
+                    next_index += 1
+                    if error is not None:
+                        raise error
+                    if item is not None and not self._stopped():
+                        yield item
+        finally:
+            # 调用方提前结束（break / 异常）时通知各阶段退出
+            self.abort()
+            for t in threads:
+                t.join(timeout=self._POLL_INTERVAL * 4)
+
+
+class CrispASRPool:
+    """有界 CrispASR 进程池：最多 N 个 crispasr 子进程并行听写。
+
+    transcribe(wav_file, json_path, proc_name, threads) 由调用方提供，
+    每个槽位使用独立的进程名（crispasr_0、crispasr_1...），submit 返回 Future，
+    调用方按提交顺序取回结果即可保持输出有序。
+    """
+
+    def __init__(self, transcribe, max_workers, threads_per_worker):
+        self._transcribe = transcribe
+        self._max_workers = max(1, int(max_workers))
+        self._threads = threads_per_worker
+        self._slots: queue.Queue = queue.Queue()
+        for slot in range(self._max_workers):
+            self._slots.put(slot)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix='crispasr')
+
+    @property
+    def max_workers(self):
+        return self._max_workers
+
+    def submit(self, wav_file, json_path):
+        """提交一个听写任务，返回 Future（结果为 json_path）"""
+        return self._executor.submit(self._run, wav_file, json_path)
+
+    def _run(self, wav_file, json_path):
+        slot = self._slots.get()
+        try:
+            self._transcribe(wav_file, json_path, f'crispasr_{slot}', self._threads)
+        finally:
+            self._slots.put(slot)
+        return json_path
+
+    def shutdown(self, cancel=False, wait=True):
+        """关闭线程池；cancel=True 时丢弃尚未开始的任务"""
+        self._executor.shutdown(wait=wait, cancel_futures=cancel)
+
+
+_CRISPASR_SERVER_TEMPLATE = os.path.join('crispasr', 'param_server.txt')
+
+
+class ResidentCrispASR:
+    """常驻听写进程：模型只加载一次，通过 stdin/stdout 的逐行 JSON 协议接收任务。
+
+    请求：{"id": n, "input": wav 路径, "output": 输出前缀, "language": 语言}
+    响应：{"id": n, "srt": 字幕路径} 或 {"id": n, "error": 错误信息}
+    其余输出行按日志转发到 detail。command 可以是任何实现该协议的程序，
+    因此测试时可以用一个假的 ASR 脚本替换 crispasr。
+    进程退出或不支持该协议时请求立即失败，调用方应退回逐文件启动 crispasr。
+    """
+
+    POLL_INTERVAL = 1.0  # 等待响应期间检查进程存活的间隔（秒）
+
+    def __init__(self, command, msg_queue, label='crispasr_server'):
+        self._command = list(command)
+        self._msg_queue = msg_queue
+        self._label = label
+        self._proc = None
+        self._reader = None
+        self._write_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._pending = {}
+        self._next_id = 0
+
+    @property
+    def proc(self):
+        return self._proc
+
+    def start(self):
+        creationflags = 0x08000000 if os.name == 'nt' else 0
+        self._proc = subprocess.Popen(
+            self._command,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            creationflags=creationflags,
+        )
+        self._reader = threading.Thread(target=self._read_loop, daemon=True)
+        self._reader.start()
+        return self._proc
+
+    def alive(self):
+        return self._proc is not None and self._proc.poll() is None
+
+    def _read_loop(self):
+        prefix = f"[{self._label}] "
+        stream = self._proc.stdout
+        try:
+            for raw in iter(stream.readline, b''):
+                line = _clean_control_chars(_strip_ansi(_decode_subprocess_line(raw).rstrip('\n\r')))
+                reply = None
+                if line.startswith('{'):
+                    try:
+                        reply = json.loads(line)
+                    except ValueError:
+                        reply = None
+                if isinstance(reply, dict) and 'id' in reply:
+                    with self._pending_lock:
+                        future = self._pending.pop(reply['id'], None)
+                    if future is not None:
+                        future.put(reply)
+                        continue
+                if line.strip():
+                    self._msg_queue.put("detail", prefix + line)
+        except Exception:
+            pass
+        finally:
+            # 进程退出：唤醒所有仍在等待的请求
+            with self._pending_lock:
+                pending, self._pending = self._pending, {}
+            for future in pending.values():
+                future.put({'error': 'CrispASR server exited'})
+
+    def transcribe(self, input_file, output_base, language, timeout=None):
+        """提交一个听写请求并阻塞等待，返回生成的 SRT 路径。
+
+        等待期间定期检查进程是否存活；超过 timeout 秒（None 为不限）未响应时放弃该请求。
+        """
+        if not self.alive():
+            raise RuntimeError('CrispASR server is not running')
+        reply_box = queue.Queue(maxsize=1)
+        with self._pending_lock:
+            self._next_id += 1
+            request_id = self._next_id
+            self._pending[request_id] = reply_box
+        request = {
+            'id': request_id,
+            'input': str(Path(input_file).resolve()),
+            'output': str(Path(output_base).resolve()),
+            'language': language or 'auto',
+        }
+        try:
+            with self._write_lock:
+                self._proc.stdin.write((json.dumps(request, ensure_ascii=False) + '\n').encode('utf-8'))
+                self._proc.stdin.flush()
+        except (OSError, ValueError) as e:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+            raise RuntimeError(f'CrispASR server is not accepting requests: {e}')
+        deadline = None if timeout is None else monotonic() + timeout
+        while True:
+            wait = self.POLL_INTERVAL
+            if deadline is not None:
+                wait = min(wait, max(0.0, deadline - monotonic()))
+            try:
+                reply = reply_box.get(timeout=wait)
+                break
+            except queue.Empty:
+                pass
+            if not self.alive():
+                # 进程已退出：读线程排空输出后会送来响应或退出错误
+                try:
+                    reply = reply_box.get(timeout=2)
+                    break
+                except queue.Empty:
+                    reply = {'error': 'CrispASR server exited'}
+                    break
+            if deadline is not None and monotonic() >= deadline:
+                reply = {'error': f'CrispASR server did not answer within {timeout}s'}
+                break
+        with self._pending_lock:
+            self._pending.pop(request_id, None)
+        if reply.get('error'):
+            raise RuntimeError(str(reply['error']))
+        srt_path = reply.get('srt') or str(Path(output_base).with_suffix('.srt'))
+        return Path(srt_path)
+
+    def close(self):
+        if self._proc is None:
+            return
+        try:
+            self._proc.stdin.close()
+        except Exception:
+            pass
+        try:
+            self._proc.wait(timeout=5)
+        except Exception:
+            try:
+                self._proc.kill()
+            except Exception:
+                pass
+        if self._reader is not None:
+            self._reader.join(timeout=2)
+
+
+_LOCAL_MODEL_PLACEHOLDER_HOSTS = ('127.0.0.1:8989', 'localhost:8989')  # 配置中代表本地模型的端点
+
+
+def _is_local_model_placeholder(endpoint):
+    return any(host in str(endpoint or '') for host in _LOCAL_MODEL_PLACEHOLDER_HOSTS)
+
+
+def _yaml_line_indent(line):
+    """返回 YAML 行的缩进；空行与注释行返回 None"""
+    stripped = line.lstrip(' ')
+    if not stripped.strip() or stripped.startswith('#'):
+        return None
+    return len(line) - len(stripped)
+
+
+def _yaml_key_block(lines, path):
+    """按缩进在块格式 YAML 中定位 path 对应的键，返回 (键所在行, 块结束行)；找不到返回 None。
+
+    只识别块格式的映射，块内的子映射或列表项（允许与键同缩进的 "- "）都算在块内。
+    """
+    start, end, parent_indent = 0, len(lines), -1
+    found = None
+    for key in path:
+        child_indent = None
+        found = None
+        pattern = re.compile(rf'{re.escape(key)}\s*:(\s|$)')
+        for i in range(start, end):
+            indent = _yaml_line_indent(lines[i])
+            if indent is None:
+                continue
+            if indent <= parent_indent:
+                break
+            if child_indent is None:
+                child_indent = indent
+            if indent == child_indent and pattern.match(lines[i][indent:]):
+                found = i
+                break
+        if found is None:
+            return None
+        block_end = found + 1
+        while block_end < end:
+            indent = _yaml_line_indent(lines[block_end])
+            if indent is not None and (indent < child_indent or (
+                    indent == child_indent and not lines[block_end][indent:].startswith('- '))):
+                break
+            block_end += 1
+        # 块尾的空行与注释归属下一个键
+        while block_end > found + 1 and _yaml_line_indent(lines[block_end - 1]) is None:
+            block_end -= 1
+        start, end, parent_indent = found + 1, block_end, child_indent
+    return found, end
+
+
+class LocalModelFarm:
+    """本地 llama-server 集群：在空闲端口上启动一个或多个实例，作为多个翻译端点。
+
+    command_factory(port, parallel) 返回启动命令，测试时可换成任意假的 HTTP 服务；
+    就绪判定只轮询 GET /health（返回 200 即就绪），不再为此发起真实推理。
+    """
+
+    def __init__(self, command_factory, msg_queue, stop_event, instances=1, parallel=1,
+                 label='llama-server', ready_timeout=120):
+        self._command_factory = command_factory
+        self._msg_queue = msg_queue
+        self._stop_event = stop_event
+        self._instances = max(1, int(instances))
+        self._parallel = max(1, int(parallel))
+        self._label = label
+        self._ready_timeout = ready_timeout
+        self._procs: list[tuple[subprocess.Popen, int]] = []
+
+    @property
+    def endpoints(self):
+        return [f'http://127.0.0.1:{port}' for proc, port in self._procs if proc.poll() is None]
+
+    @property
+    def procs(self):
+        return [proc for proc, _port in self._procs]
+
+    def running(self):
+        return any(proc.poll() is None for proc, _port in self._procs)
+
+    @staticmethod
+    def _is_healthy(port):
+        try:
+            return requests.get(f'http://127.0.0.1:{port}/health', timeout=2).status_code == 200
+        except requests.exceptions.RequestException:
+            return False
+
+    def start(self):
+        """启动全部实例并等待 /health 就绪；至少一个实例就绪时返回 True"""
+        creationflags = 0x08000000 if os.name == 'nt' else 0
+        pending = []
+        used_ports = {port for _proc, port in self._procs}
+        for _unused in range(self._instances):
+            port = _find_available_local_port()
+            while port in used_ports:  # 刚释放的端口可能被再次分到
+                port = _find_available_local_port()
+            used_ports.add(port)
+            command = self._command_factory(port, self._parallel)
+            self._msg_queue.put("status", _("status_local_model_starting", port=port))
+            self._msg_queue.put("detail", _format_command(command))
+            proc = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                creationflags=creationflags,
+            )
+            threading.Thread(
+                target=_stream_proc_to_queue,
+                args=(proc, self._msg_queue, self._label),
+                daemon=True,
+            ).start()
+            pending.append((proc, port))
+
+        deadline = time() + self._ready_timeout
+        while pending and not self._stop_event.is_set():
+            for item in list(pending):
+                proc, port = item
+                if proc.poll() is not None:
+                    pending.remove(item)
+                elif self._is_healthy(port):
+                    self._msg_queue.put("status", _("status_local_model_ready", port=port))
+                    self._procs.append(item)
+                    pending.remove(item)
+            if pending and time() > deadline:
+                self._msg_queue.put("status", _("status_local_model_timeout"))
+                break
+            if pending:
+                sleep(0.5)
+
+        for proc, _port in pending:
+            self._terminate(proc)
+        return bool(self._procs)
+
+    @staticmethod
+    def _terminate(proc):
+        try:
+            if proc.poll() is None:
+                proc.terminate()
+                proc.wait(timeout=5)
+        except Exception:
+            try:
+                proc.kill()
+            except Exception:
+                pass
+
+    def stop(self):
+        procs, self._procs = self._procs, []
+        if any(proc.poll() is None for proc, _port in procs):
+            self._msg_queue.put("status", _("status_local_model_stopping"))
+        for proc, _port in procs:
+            self._terminate(proc)
+
+
+class LocalModelDaemon:
+    """跨 MainWorker 运行保持本地模型常驻：按模型路径与启动参数复用同一组 llama-server。
+
+    acquire 在键一致且实例仍存活时直接复用，否则关闭旧实例后重新启动；
+    release 后开始空闲计时，idle_timeout 秒内没有再次 acquire 才真正关闭。
+    """
+
+    idle_timeout: float = 600.0
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._key = None
+        self._farm: LocalModelFarm | None = None
+        self._users = 0
+        self._idle_timer: threading.Timer | None = None
+
+    def _cancel_idle_timer(self):
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+
+    def acquire(self, key, create_farm):
+        """返回 (farm, reused)；create_farm() 需返回已启动的 farm，失败时返回 None"""
+        with self._lock:
+            self._cancel_idle_timer()
+            if self._farm is not None and self._key == key and self._farm.running():
+                self._users += 1
+                return self._farm, True
+            stale, self._farm, self._key, self._users = self._farm, None, None, 0
+        if stale is not None:
+            stale.stop()
+        farm = create_farm()
+        if farm is None:
+            return None, False
+        with self._lock:
+            self._farm, self._key, self._users = farm, key, 1
+        return farm, False
+
+    def release(self, farm):
+        """一次运行结束：没有其他使用者时开始空闲计时"""
+        with self._lock:
+            if farm is not self._farm:
+                stale = farm
+            else:
+                stale = None
+                self._users = max(0, self._users - 1)
+                if self._users == 0:
+                    self._cancel_idle_timer()
+                    self._idle_timer = threading.Timer(self.idle_timeout, self._expire, args=(farm,))
+                    self._idle_timer.daemon = True
+                    self._idle_timer.start()
+        if stale is not None:
+            stale.stop()
+
+    def _expire(self, farm):
+        with self._lock:
+            if farm is not self._farm or self._users > 0:
+                return
+            self._farm, self._key, self._idle_timer = None, None, None
+        farm.stop()
+
+    def running(self):
+        with self._lock:
+            return self._farm is not None and self._farm.running()
+
+    def shutdown(self):
+        """立即关闭常驻实例（程序退出时调用）；返回关闭前的进程列表"""
+        with self._lock:
+            self._cancel_idle_timer()
+            farm, self._farm, self._key, self._users = self._farm, None, None, 0
+        if farm is None:
+            return []
+        procs = farm.procs
+        farm.stop()
+        return procs
+
+
+LOCAL_MODEL_DAEMON = LocalModelDaemon()
+
+
+_GALTRANSL_JOB_DONE = '@@GALTRANSL_JOB_DONE '  # 与 translate.py 中 JOB_DONE_MARKER 保持一致
+
+
+class _TranslationEventReader:
+    """消费 GalTransl 的 JSONL 事件流。
+
+    lines 事件转换为 {"id", "dst"} 行送往界面，usage 事件累计 token 用量。
+    """
+
+    def __init__(self):
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.errors = 0
+
+    def feed(self, payload: str) -> list[str]:
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            return []
+        kind = event.get('event')
+        if kind == 'lines':
+            return [
+                json.dumps({"id": item.get('id'), "dst": item.get('dst', '')}, ensure_ascii=False)
+                for item in event.get('lines') or []
+            ]
+        if kind == 'usage':
+            self.prompt_tokens += int(event.get('prompt_tokens') or 0)
+            self.completion_tokens += int(event.get('completion_tokens') or 0)
+        elif kind == 'error':
+            self.errors += 1
+        return []
+
+
+class _EventFileTailer:
+    """跟读 GalTransl 写入的事件文件（GALTRANSL_EVENTS=路径），把每个完整的 JSON 行交给 on_payload。
+
+    事件走独立文件而不是与日志共用 stdout：日志行可能被插件的 print 或异常输出打断，
+    且 Windows 下向子进程传递额外管道句柄需要逐个声明继承，文件在各平台上都可靠。
+    """
+
+    POLL_INTERVAL = 0.2
+
+    def __init__(self, path, on_payload):
+        self._path = path
+        self._on_payload = on_payload
+        self._stop = threading.Event()
+        self._offset = 0
+        self._partial = b''
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _read_new(self):
+        try:
+            with open(self._path, 'rb') as f:
+                f.seek(self._offset)
+                data = f.read()
+        except OSError:
+            return
+        if not data:
+            return
+        self._offset += len(data)
+        data = self._partial + data
+        *complete, self._partial = data.split(b'\n')
+        for raw in complete:
+            payload = raw.decode('utf-8', errors='replace').strip()
+            if payload:
+                self._on_payload(payload)
+
+    def _run(self):
+        while not self._stop.wait(self.POLL_INTERVAL):
+            self._read_new()
+
+    def stop(self):
+        """停止跟读并读完剩余事件（子进程退出后调用）"""
+        self._stop.set()
+        self._thread.join()
+        self._read_new()
+
+
+class GalTranslWorkerProcess:
+    """常驻 GalTransl 翻译进程（translate.py --serve）。
+
+    每行写入一个 {"id", "project_dir", "translator", "events"} 任务，进程在同一事件循环中调用
+    run_job_async；任务日志照常输出到 stdout，事件写入 events 文件，结束时输出 _GALTRANSL_JOB_DONE 标记行。
+    GalTransl 与插件只导入一次，HTTP 客户端与令牌检查结果跨任务复用。
+    """
+
+    def __init__(self, env):
+        creationflags = 0x08000000 if os.name == 'nt' else 0
+        self._proc = subprocess.Popen(
+            [*_TRANSLATE_CMD, '--serve'],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, encoding='utf-8', errors='replace',
+            creationflags=creationflags, bufsize=1,
+            env=env,
+        )
+        self._next_id = 0
+
+    @property
+    def proc(self):
+        return self._proc
+
+    def alive(self):
+        return self._proc.poll() is None
+
+    def run_job(self, workspace, engine, on_line, events_path=''):
+        """执行一个翻译任务，逐行回调日志；返回 (success, error)"""
+        self._next_id += 1
+        request = {'id': self._next_id, 'project_dir': workspace, 'translator': engine,
+                   'events': events_path}
+        self._proc.stdin.write(json.dumps(request, ensure_ascii=False) + '\n')
+        self._proc.stdin.flush()
+        for line in iter(self._proc.stdout.readline, ''):
+            if line.startswith(_GALTRANSL_JOB_DONE):
+                reply = json.loads(line[len(_GALTRANSL_JOB_DONE):])
+                return bool(reply.get('success')), reply.get('error') or reply.get('status', '')
+            on_line(line)
+        raise RuntimeError(f'GalTransl worker exited with code {self._proc.wait()}')
+
+    def close(self):
+        try:
+            self._proc.stdin.close()
+            self._proc.wait(timeout=5)
+        except Exception:
+            try:
+                self._proc.kill()
+            except Exception:
+                pass
 
 
 class ConcurrentTranslationPool:
-    """并发翻译线程池：每文件一个工作线程，工作空间隔离"""
+    """并发翻译线程池：每文件一个工作线程，工作空间隔离。
+
+    submit 为每个 TranscribedFile 返回 Future；wait 只等待指定文件，
+    不会发送哨兵关闭线程池，整批任务结束后才调用 done/wait_all。
+    """
+
+    verbose_galtransl: bool = False  # 类变量：详细模式开关，由 MainWindow 在启动翻译前设置
+    resident_workers: bool = True  # 类变量：每个工作线程复用一个常驻 GalTransl 进程
+    workspace_max_bytes: int = 2 * 1024 ** 3  # 翻译工作空间总大小上限，超出按 LRU 淘汰
+    workspace_max_age_days: int = 30  # 超过该天数未使用的工作空间直接删除
+    batch_max_files: int = 8  # 队列中已就绪的文件最多合并为一个 GalTransl 任务的数量
+    local_model_instances: int = 1  # 本地模型实例数（每个实例都会完整加载一份模型）
+    local_model_max_parallel: int = 16  # 所有本地模型实例的并行槽位总数上限
+    workspace_evict_interval: float = 60.0  # 两次淘汰扫描之间的最短间隔（秒）
+    _workspace_locks: dict = {}  # 工作空间 -> [锁, 使用/等待者数]，无人使用时移除
+    _workspace_locks_guard = threading.Lock()
+    _workspace_sizes: dict = {}  # 工作空间 -> (修改时间, 大小)，修改时间不变时不再遍历统计
+    _last_evict: dict = {}  # 项目目录 -> 上次淘汰扫描时间
+
+    @staticmethod
+    def _translate_worker_thread(task_queue, result_queue, msg_queue, stop_event,
+                                 project_dir, base_config_path, engine, worker_idx,
+                                 proc_registry=None, local_endpoints=None):
+        """工作线程函数：从队列取任务并执行翻译。
+
+        proc_registry 为 (进程列表, 锁) 时，本线程的常驻翻译进程登记其中，便于 stop 时终止；
+        local_endpoints 为本地模型实例的端点列表，写入各工作空间的配置。
+        """
+        worker_slot = {}
+        try:
+            ConcurrentTranslationPool._translate_worker_loop(
+                task_queue, result_queue, msg_queue, stop_event, project_dir,
+                base_config_path, engine, worker_idx, worker_slot, proc_registry,
+                local_endpoints)
+        finally:
+            ConcurrentTranslationPool._release_worker_process(worker_slot, proc_registry)
+
+    @staticmethod
+    def _release_worker_process(worker_slot, proc_registry):
+        worker = worker_slot.pop('worker', None)
+        if worker is None:
+            return
+        worker.close()
+        if proc_registry is not None:
+            procs, lock = proc_registry
+            with lock:
+                if worker.proc in procs:
+                    procs.remove(worker.proc)
+
+    @staticmethod
+    def _acquire_worker_process(worker_slot, proc_registry):
+        """返回本线程的常驻翻译进程，不存在或已退出时重新启动"""
+        if not ConcurrentTranslationPool.resident_workers:
+            return None
+        worker = worker_slot.get('worker')
+        if worker is not None and worker.alive():
+            return worker
+        ConcurrentTranslationPool._release_worker_process(worker_slot, proc_registry)
+        worker = GalTranslWorkerProcess(ConcurrentTranslationPool._translate_env())
+        worker_slot['worker'] = worker
+        if proc_registry is not None:
+            procs, lock = proc_registry
+            with lock:
+                procs.append(worker.proc)
+        return worker
+
+    @staticmethod
+    def _translate_env():
+        # Force the translation subprocess and this reader to agree on
+        # UTF-8. Windows otherwise selects GBK for redirected pipes, and
+        # valid filename characters such as ♪ make logging.StreamHandler
+        # emit an internal UnicodeEncodeError traceback.
+        proc_env = os.environ.copy()
+        proc_env['PYTHONIOENCODING'] = 'utf-8'
+        proc_env['PYTHONUTF8'] = '1'
+        if ConcurrentTranslationPool.verbose_galtransl:
+            proc_env['GALTRANSL_VERBOSE_STDOUT'] = '1'
+        # 事件文件按任务指定（见 _run_galtransl_job），不继承外部设置
+        proc_env.pop('GALTRANSL_EVENTS', None)
+        return proc_env
+
+    @staticmethod
+    def _translate_worker_loop(task_queue, result_queue, msg_queue, stop_event, project_dir,
+                               base_config_path, engine, worker_idx, worker_slot, proc_registry,
+                               local_endpoints):
+        while not stop_event.is_set():
+            try:
+                task = task_queue.get(timeout=1)
+            except queue.Empty:
+                continue
+
+            if task is None:  # 哨兵信号
+                result_queue.put(('done', worker_idx))
+                break
+
+            tf_dict, future = task
+            if stop_event.is_set() or not future.set_running_or_notify_cancel():
+                result_queue.put(('stopped', worker_idx))
+                continue
+
+            tasks = [task] + ConcurrentTranslationPool._drain_batch(
+                task_queue, project_dir, base_config_path, engine, tf_dict)
+
+            # 执行翻译
+            try:
+                worker = ConcurrentTranslationPool._acquire_worker_process(worker_slot, proc_registry)
+                if len(tasks) == 1:
+                    ConcurrentTranslationPool._translate_one_impl(
+                        tf_dict, worker_idx, project_dir, base_config_path, engine, msg_queue,
+                        worker=worker, local_endpoints=local_endpoints)
+                    errors = [None]
+                else:
+                    errors = ConcurrentTranslationPool._translate_batch_impl(
+                        [t[0] for t in tasks], worker_idx, project_dir, base_config_path,
+                        engine, msg_queue, worker=worker, local_endpoints=local_endpoints)
+            except Exception as e:
+                errors = [e] * len(tasks)
+            for (task_dict, task_future), error in zip(tasks, errors):
+                if error is None:
+                    result_queue.put(('success', worker_idx))
+                    task_future.set_result(task_dict['json_src'])
+                else:
+                    result_queue.put(('error', worker_idx, str(error)))
+                    task_future.set_exception(error)
+
+    @staticmethod
+    def _drain_batch(task_queue, project_dir, base_config_path, engine, first_dict):
+        """取出队列中已就绪的其他文件，与 first_dict 合并为一个 GalTransl 任务。
+
+        共享同一工作空间的重复文件放回队列，留给下一个任务；取到的哨兵排在它们之后放回，
+        否则这些文件会落在所有线程的哨兵之后而永远不被执行。
+        """
+        batch = []
+        if ConcurrentTranslationPool.batch_max_files <= 1:
+            return batch
+        seen = {ConcurrentTranslationPool._workspace_path(
+            project_dir, first_dict, base_config_path, engine)}
+        deferred = []
+        sentinel = False
+        while len(batch) + 1 < ConcurrentTranslationPool.batch_max_files:
+            try:
+                extra = task_queue.get_nowait()
+            except queue.Empty:
+                break
+            if extra is None:  # 哨兵最后放回，由本线程下一轮取到
+                sentinel = True
+                break
+            workspace = ConcurrentTranslationPool._workspace_path(
+                project_dir, extra[0], base_config_path, engine)
+            if workspace in seen:
+                deferred.append(extra)
+                continue
+            if not extra[1].set_running_or_notify_cancel():
+                continue
+            seen.add(workspace)
+            batch.append(extra)
+        for extra in deferred:
+            task_queue.put(extra)
+        if sentinel:
+            task_queue.put(None)
+        return batch
+
+    @staticmethod
+    def _run_galtransl_job(workspace, engine, worker, msg_queue, worker_idx, label):
+        """在工作空间上执行一次 GalTransl：worker 为常驻翻译进程时复用，否则单独启动 translate.py"""
+
+        def send_status(msg):
+            """向统一消息队列发送后端详细日志"""
+            msg_queue.put("detail", msg)
 
-    verbose_galtransl: bool = False  # 类变量：详细模式开关，由 MainWindow 在启动翻译前设置
+        send_status(_("status_translating_with", idx=worker_idx, engine=engine, workspace=workspace))
 
-    @staticmethod
-    def _translate_worker_thread(task_queue, result_queue, msg_queue, stop_event,
-                                 project_dir, base_config_path, engine, worker_idx):
-        """工作线程函数：从队列取任务并执行翻译"""
-        while not stop_event.is_set():
-            try:
-                tf_dict = task_queue.get(timeout=1)
-            except queue.Empty:
-                continue
+        # 译文与用量经事件文件送达；stdout 只转发人类可读日志，其中的翻译记录被过滤
+        log_filter = _TranslationLogFilter()
+        event_reader = _TranslationEventReader()
+        events_path = os.path.abspath(os.path.join(workspace, 'events.jsonl'))
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(events_path)
 
-            if tf_dict is None:  # 哨兵信号
-                result_queue.put(('done', worker_idx))
-                break
+        def feed_event(payload):
+            for output_line in event_reader.feed(payload):
+                send_status(output_line)
 
-            if stop_event.is_set():
-                result_queue.put(('stopped', worker_idx))
-                continue
+        def feed_line(line):
+            # 清除 ANSI 转义序列和控制字符
+            cleaned = _clean_control_chars(_strip_ansi(line.rstrip('\n\r')))
+            for output_line in log_filter.feed(cleaned):
+                if output_line.strip():
+                    send_status(output_line)
 
-            # 执行翻译
+        tailer = _EventFileTailer(events_path, feed_event).start()
+        if worker is not None:
             try:
-                ConcurrentTranslationPool._translate_one_impl(
-                    tf_dict, worker_idx, project_dir, base_config_path, engine, msg_queue)
-                result_queue.put(('success', worker_idx))
-            except Exception as e:
-                result_queue.put(('error', worker_idx, str(e)))
+                success, job_error = worker.run_job(workspace, engine, feed_line, events_path)
+            finally:
+                tailer.stop()
+            retcode = 0 if success else 1
+            if job_error and not success:
+                send_status(str(job_error))
+        else:
+            creationflags = 0x08000000 if os.name == 'nt' else 0
+            proc_env = ConcurrentTranslationPool._translate_env()
+            proc_env['GALTRANSL_EVENTS'] = events_path
+            try:
+                proc = subprocess.Popen(
+                    [*_TRANSLATE_CMD, workspace, engine],
+                    stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                    text=True, encoding='utf-8', errors='replace',
+                    creationflags=creationflags, bufsize=1,
+                    env=proc_env,
+                )
+                for line in iter(proc.stdout.readline, ''):
+                    feed_line(line)
+                proc.stdout.close()
+                retcode = proc.wait()
+            finally:
+                tailer.stop()
+
+        # 放行过滤器中暂存的行
+        for output_line in log_filter.flush():
+            if output_line.strip():
+                send_status(output_line)
+        if event_reader.prompt_tokens or event_reader.completion_tokens:
+            send_status(_("status_translate_usage", idx=worker_idx, base=label,
+                          prompt=event_reader.prompt_tokens,
+                          completion=event_reader.completion_tokens))
+
+        # 短暂等待，确保状态队列中的日志已排空发送到 GUI
+        send_status(_("status_translate_proc_ended", idx=worker_idx, retcode=retcode))
+        sleep(0.1)
+        if retcode != 0:
+            raise subprocess.CalledProcessError(retcode, _TRANSLATE_CMD)
 
     @staticmethod
     def _translate_one_impl(tf_dict, worker_idx, project_dir, base_config_path,
-                            engine, msg_queue):
-        """在线程中执行单个文件的翻译"""
+                            engine, msg_queue, worker=None, local_endpoints=None):
+        """在线程中执行单个文件的翻译；worker 为常驻翻译进程时不再单独启动 translate.py"""
         base_path = tf_dict['base_path']
         json_src = tf_dict['json_src']
         output_dir = tf_dict['output_dir']
@@ -660,87 +1772,284 @@ class ConcurrentTranslationPool:
 
         send_status(_("status_translating_start", idx=worker_idx, base=base))
 
-        # 创建工作空间
-        workspace = ConcurrentTranslationPool._create_workspace_impl(project_dir, worker_idx)
+        # 按输入文件与翻译设置定位工作空间：重跑同一媒体时复用 transl_cache 续翻
+        workspace = ConcurrentTranslationPool._workspace_path(project_dir, tf_dict, base_config_path, engine)
         json_name = os.path.basename(json_src)
 
-        # 将听写产出的 JSON 复制到工作空间的 gt_input
-        shutil.copy(json_src, os.path.join(workspace, 'gt_input', json_name))
+        with ConcurrentTranslationPool._workspace_lock(workspace):
+            ConcurrentTranslationPool._create_workspace_impl(workspace)
+            # 将听写产出的 JSON 复制到工作空间的 gt_input
+            shutil.copy(json_src, os.path.join(workspace, 'gt_input', json_name))
 
-        # 准备独立配置文件
-        ConcurrentTranslationPool._prepare_config_impl(workspace, base_config_path, project_dir)
+            # 准备独立配置文件
+            ConcurrentTranslationPool._prepare_config_impl(
+                workspace, base_config_path, project_dir, local_endpoints)
 
-        try:
-            send_status(_("status_translating_with", idx=worker_idx, engine=engine, workspace=workspace))
-            creationflags = 0x08000000 if os.name == 'nt' else 0
+            try:
+                ConcurrentTranslationPool._run_galtransl_job(
+                    workspace, engine, worker, msg_queue, worker_idx, base)
+            except Exception as e:
+                send_status(_("status_translating_error", idx=worker_idx, base=base, error=e))
+                raise
 
-            # Force the translation subprocess and this reader to agree on
-            # UTF-8. Windows otherwise selects GBK for redirected pipes, and
-            # valid filename characters such as ♪ make logging.StreamHandler
-            # emit an internal UnicodeEncodeError traceback.
-            proc_env = os.environ.copy()
-            proc_env['PYTHONIOENCODING'] = 'utf-8'
-            proc_env['PYTHONUTF8'] = '1'
-            if ConcurrentTranslationPool.verbose_galtransl:
-                proc_env['GALTRANSL_VERBOSE_STDOUT'] = '1'
+            # 生成翻译后字幕
+            send_status(_("status_translating_srt", idx=worker_idx, base=base))
+            ConcurrentTranslationPool._generate_output_impl(
+                json_src, base_path, output_dir, output_format, workspace, orig_srt_path)
 
-            proc = subprocess.Popen(
-                [*_TRANSLATE_CMD, workspace, engine],
-                stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-                text=True, encoding='utf-8', errors='replace',
-                creationflags=creationflags, bufsize=1,
-                env=proc_env,
-            )
+            send_status(_("status_translating_done", idx=worker_idx, base=base))
 
-            # 翻译日志解析器：将 GalTransl 三行格式转换为 JSON
-            _trans_parser = _TranslationLogParser()
+        ConcurrentTranslationPool._evict_workspaces(project_dir)
 
-            for line in iter(proc.stdout.readline, ''):
-                # 清除 ANSI 转义序列和控制字符
-                cleaned = _clean_control_chars(_strip_ansi(line.rstrip('\n\r')))
-                if not cleaned:
-                    continue
-                # 通过解析器转换翻译输出格式（JSON 化），逐行写入日志和发送到 GUI
-                for output_line in _trans_parser.feed(cleaned):
-                    if output_line.strip():
-                        send_status(output_line)
+    @staticmethod
+    def _translate_batch_impl(tf_dicts, worker_idx, project_dir, base_config_path,
+                              engine, msg_queue, worker=None, local_endpoints=None):
+        """把多个文件合并为一个 GalTransl 任务翻译，返回与 tf_dicts 对应的异常列表（成功为 None）。
 
-            # 刷新解析器缓冲区中残留的行
-            for output_line in _trans_parser.flush():
-                if output_line.strip():
-                    send_status(output_line)
+        各文件仍以自己的工作空间保存 transl_cache：任务前把缓存带入临时的合并工作空间，
+        任务后再连同 gt_output 按文件名前缀分拣回去，随后各自生成字幕。
+        """
+        def send_status(msg):
+            msg_queue.put("detail", msg)
+
+        members = []
+        for index, tf_dict in enumerate(tf_dicts):
+            json_src = tf_dict['json_src']
+            members.append({
+                'tf': tf_dict,
+                'base': os.path.basename(tf_dict['base_path']),
+                'workspace': ConcurrentTranslationPool._workspace_path(
+                    project_dir, tf_dict, base_config_path, engine),
+                'json_name': os.path.basename(json_src),
+                'prefix': f'b{index:03d}-',  # 避免不同目录下的同名文件在合并工作空间中冲突
+            })
+        send_status(_("status_translating_batch", idx=worker_idx, count=len(members),
+                      names=', '.join(m['base'] for m in members)))
+
+        batch_workspace = os.path.join(project_dir, 'cache', f'batch_{int(time() * 1000000)}_{worker_idx}')
+        errors = [None] * len(members)
+        with contextlib.ExitStack() as locks:
+            for workspace in sorted({m['workspace'] for m in members}):
+                locks.enter_context(ConcurrentTranslationPool._workspace_lock(workspace))
+            try:
+                ConcurrentTranslationPool._create_workspace_impl(batch_workspace)
+                for member in members:
+                    ConcurrentTranslationPool._create_workspace_impl(member['workspace'])
+                    shutil.copy(member['tf']['json_src'], os.path.join(
+                        batch_workspace, 'gt_input', member['prefix'] + member['json_name']))
+                    # transl_cache 及额外目标语言的 transl_cache_<lang>
+                    for cache_dir in ConcurrentTranslationPool._target_subdirs(
+                            member['workspace'], 'transl_cache'):
+                        member_cache = os.path.join(member['workspace'], cache_dir)
+                        batch_cache = os.path.join(batch_workspace, cache_dir)
+                        os.makedirs(batch_cache, exist_ok=True)
+                        for name in os.listdir(member_cache):
+                            shutil.copy2(os.path.join(member_cache, name),
+                                         os.path.join(batch_cache, member['prefix'] + name))
+                ConcurrentTranslationPool._prepare_config_impl(
+                    batch_workspace, base_config_path, project_dir, local_endpoints)
+
+                job_error = None
+                try:
+                    ConcurrentTranslationPool._run_galtransl_job(
+                        batch_workspace, engine, worker, msg_queue, worker_idx,
+                        _("status_batch_label", count=len(members)))
+                except Exception as e:
+                    job_error = e
+
+                for i, member in enumerate(members):
+                    # 无论成败都带回缓存，部分完成的进度下次可以续上
+                    for cache_dir in ConcurrentTranslationPool._target_subdirs(
+                            batch_workspace, 'transl_cache'):
+                        batch_cache = os.path.join(batch_workspace, cache_dir)
+                        member_cache = os.path.join(member['workspace'], cache_dir)
+                        os.makedirs(member_cache, exist_ok=True)
+                        for name in os.listdir(batch_cache):
+                            if name.startswith(member['prefix']):
+                                shutil.copy2(os.path.join(batch_cache, name),
+                                             os.path.join(member_cache, name[len(member['prefix']):]))
+                    if job_error is not None:
+                        send_status(_("status_translating_error", idx=worker_idx, base=member['base'], error=job_error))
+                        errors[i] = job_error
+                        continue
+                    try:
+                        for output_dir in ConcurrentTranslationPool._target_subdirs(
+                                batch_workspace, 'gt_output'):
+                            batch_output = os.path.join(
+                                batch_workspace, output_dir, member['prefix'] + member['json_name'])
+                            if output_dir != 'gt_output' and not os.path.exists(batch_output):
+                                continue
+                            os.makedirs(os.path.join(member['workspace'], output_dir), exist_ok=True)
+                            shutil.copy(batch_output, os.path.join(
+                                member['workspace'], output_dir, member['json_name']))
+                        send_status(_("status_translating_srt", idx=worker_idx, base=member['base']))
+                        tf = member['tf']
+                        ConcurrentTranslationPool._generate_output_impl(
+                            tf['json_src'], tf['base_path'], tf['output_dir'], tf['output_format'],
+                            member['workspace'], tf['orig_srt_path'])
+                        send_status(_("status_translating_done", idx=worker_idx, base=member['base']))
+                    except Exception as e:
+                        send_status(_("status_translating_error", idx=worker_idx, base=member['base'], error=e))
+                        errors[i] = e
+            finally:
+                shutil.rmtree(batch_workspace, ignore_errors=True)
+
+        ConcurrentTranslationPool._evict_workspaces(project_dir)
+        return errors
 
-            proc.stdout.close()
-            retcode = proc.wait()
+    @staticmethod
+    def _workspace_path(project_dir, tf_dict, base_config_path, engine):
+        return os.path.join(project_dir, 'cache', 'translate_' + ConcurrentTranslationPool._workspace_key(
+            project_dir, tf_dict, base_config_path, engine))
 
-            # 短暂等待，确保状态队列中的日志已排空发送到 GUI
-            send_status(_("status_translate_proc_ended", idx=worker_idx, retcode=retcode))
-            sleep(0.1)
-            if retcode != 0:
-                raise subprocess.CalledProcessError(retcode, _TRANSLATE_CMD)
-        except Exception as e:
-            send_status(_("status_translating_error", idx=worker_idx, base=base, error=e))
-            raise
+    @staticmethod
+    def _workspace_key(project_dir, tf_dict, base_config_path, engine):
+        """工作空间键：输入文件路径 + 听写 JSON 文件名（分段序号）+ 翻译配置 + 引擎 + 各字典内容。
 
-        # 生成翻译后字幕
-        send_status(_("status_translating_srt", idx=worker_idx, base=base))
-        ConcurrentTranslationPool._generate_output_impl(
-            json_src, base_path, output_dir, output_format, workspace, orig_srt_path)
+        不同目录下的同名文件、同一文件的各分段各占一个工作空间。
+        不含 JSON 内容：重新听写后沿用同一工作空间，未变的句子仍可命中 transl_cache。
+        """
+        source_path = tf_dict.get('source_path') or tf_dict['base_path']
+        digest = hashlib.sha256()
+        digest.update(os.path.abspath(source_path).encode('utf-8') + b'\0')
+        digest.update(os.path.basename(tf_dict['json_src']).encode('utf-8') + b'\0')
+        digest.update(engine.encode('utf-8') + b'\0')
+        dict_files = sorted(Path(project_dir).glob('dict_*.txt'))
+        for path in [Path(base_config_path), *dict_files]:
+            digest.update(path.name.encode('utf-8') + b'\0')
+            try:
+                digest.update(path.read_bytes())
+            except OSError:
+                pass
+            digest.update(b'\0')
+        return digest.hexdigest()[:24]
 
-        send_status(_("status_translating_done", idx=worker_idx, base=base))
+    @staticmethod
+    def _target_subdirs(workspace, name):
+        """工作空间中的 name 目录及额外目标语言的 name_<lang> 目录（extraTargetLanguages）"""
+        try:
+            entries = os.listdir(workspace)
+        except OSError:
+            return []
+        return sorted(
+            entry for entry in entries
+            if (entry == name or entry.startswith(name + '_'))
+            and os.path.isdir(os.path.join(workspace, entry)))
 
     @staticmethod
-    def _create_workspace_impl(project_dir, worker_idx):
-        """在线程中创建工作空间"""
-        import time
-        idx = int(time.time() * 1000000) + worker_idx
-        workspace = os.path.join(project_dir, 'cache', f'translate_{idx}')
+    def _create_workspace_impl(workspace):
+        """在线程中创建（或复用）工作空间：保留 transl_cache，清空上次残留的输入输出"""
+        for sub in ('gt_input', *ConcurrentTranslationPool._target_subdirs(workspace, 'gt_output')):
+            shutil.rmtree(os.path.join(workspace, sub), ignore_errors=True)
         for sub in ('gt_input', 'gt_output', 'transl_cache'):
             os.makedirs(os.path.join(workspace, sub), exist_ok=True)
+        # 更新修改时间，作为 LRU 淘汰依据
+        os.utime(workspace)
         return workspace
 
     @staticmethod
-    def _prepare_config_impl(workspace, base_config_path, project_dir):
+    @contextlib.contextmanager
+    def _workspace_lock(workspace, blocking=True):
+        """同一工作空间同一时刻只允许一个线程使用（同一文件被重复提交时）。
+
+        非阻塞模式下工作空间已被占用或有人等待时产出 False。锁表按使用/等待者计数，
+        最后一个使用者退出时移除，因此淘汰与使用总是争用同一把锁。
+        使用结束时刷新工作空间修改时间，作为 LRU 依据并使大小统计失效。
+        """
+        cls = ConcurrentTranslationPool
+        key = os.path.abspath(workspace)
+        with cls._workspace_locks_guard:
+            entry = cls._workspace_locks.get(key)
+            busy = entry is not None and not blocking
+            if entry is None:
+                entry = cls._workspace_locks[key] = [threading.Lock(), 0]
+            if not busy:
+                entry[1] += 1
+        if busy:
+            yield False
+            return
+        acquired = entry[0].acquire(blocking)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                try:
+                    os.utime(key)
+                except OSError:
+                    pass
+                entry[0].release()
+            with cls._workspace_locks_guard:
+                entry[1] -= 1
+                if entry[1] == 0 and cls._workspace_locks.get(key) is entry:
+                    del cls._workspace_locks[key]
+
+    @staticmethod
+    def _workspace_size(workspace, mtime):
+        """工作空间大小；修改时间未变时沿用上次统计结果"""
+        cached = ConcurrentTranslationPool._workspace_sizes.get(workspace)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        size = sum(f.stat().st_size for f in Path(workspace).rglob('*') if f.is_file())
+        ConcurrentTranslationPool._workspace_sizes[workspace] = (mtime, size)
+        return size
+
+    @staticmethod
+    def _evict_workspaces(project_dir, force=False):
+        """淘汰翻译工作空间：超过保留天数的先删，再按最近使用时间删到总大小不超上限。
+
+        距上次扫描不足 workspace_evict_interval 秒时跳过；正在使用的工作空间不参与淘汰，
+        删除期间持有其锁，防止其他线程同时复用。
+        """
+        cls = ConcurrentTranslationPool
+        project_key = os.path.abspath(project_dir)
+        now = time()
+        with cls._workspace_locks_guard:
+            last = cls._last_evict.get(project_key, 0.0)
+            if not force and now - last < cls.workspace_evict_interval:
+                return
+            cls._last_evict[project_key] = now
+
+        cache_dir = Path(project_dir) / 'cache'
+        entries = []
+        for workspace in cache_dir.glob('translate_*'):
+            key = os.path.abspath(workspace)
+            try:
+                if not workspace.is_dir():
+                    continue
+                mtime = workspace.stat().st_mtime
+                size = cls._workspace_size(key, mtime)
+            except OSError:
+                continue
+            entries.append((mtime, size, key))
+        present = {key for _mtime, _size, key in entries}
+        for key in list(cls._workspace_sizes):
+            if key.startswith(os.path.join(os.path.abspath(cache_dir), '')) and key not in present:
+                cls._workspace_sizes.pop(key, None)
+
+        def remove(workspace):
+            with cls._workspace_lock(workspace, blocking=False) as acquired:
+                if not acquired:
+                    return False  # 正在使用
+                shutil.rmtree(workspace, ignore_errors=True)
+                cls._workspace_sizes.pop(workspace, None)
+                return True
+
+        max_age = cls.workspace_max_age_days * 86400
+        total = 0
+        kept = []
+        for mtime, size, workspace in entries:
+            if now - mtime > max_age and remove(workspace):
+                continue
+            kept.append((mtime, size, workspace))
+            total += size
+        for mtime, size, workspace in sorted(kept):
+            if total <= cls.workspace_max_bytes:
+                break
+            if remove(workspace):
+                total -= size
+
+    @staticmethod
+    def _prepare_config_impl(workspace, base_config_path, project_dir, local_endpoints=None):
         """在线程中准备配置文件"""
         with open(base_config_path, 'r', encoding='utf-8') as f:
             content = f.read()
@@ -756,12 +2065,142 @@ class ConcurrentTranslationPool:
             flags=re.MULTILINE,
         )
 
+        if local_endpoints:
+            content = ConcurrentTranslationPool._apply_local_endpoints(content, list(local_endpoints))
+
         config_path = os.path.join(workspace, 'config.yaml')
         with open(config_path, 'w', encoding='utf-8') as f:
             f.write(content)
 
         return config_path
 
+    @staticmethod
+    def _apply_local_endpoints(content, endpoints):
+        """把配置中代表本地模型的 8989 端点替换为实际运行的各实例端点。
+
+        按行改写，保留配置中的注释与格式；遇到无法按行定位的写法（如行内列表）时退回整体重新序列化。
+        """
+        cfg = yaml.safe_load(content) or {}
+        backend = cfg.get('backendSpecific') or {}
+        lines = content.splitlines(keepends=True)
+        edits = []  # (起始行, 结束行, 替换行)
+        sakura_cfg = backend.get('SakuraLLM')
+        if isinstance(sakura_cfg, dict):
+            configured = sakura_cfg.get('endpoints') or [sakura_cfg.get('endpoint')]
+            if any(_is_local_model_placeholder(endpoint) for endpoint in configured):
+                edit = ConcurrentTranslationPool._sakura_endpoint_edits(lines, sakura_cfg, endpoints)
+                if edit is None:
+                    return ConcurrentTranslationPool._dump_local_endpoints(cfg, endpoints)
+                edits.extend(edit)
+        openai_cfg = backend.get('OpenAI-Compatible')
+        if isinstance(openai_cfg, dict) and isinstance(openai_cfg.get('tokens'), list):
+            tokens = openai_cfg['tokens']
+            if any(isinstance(token, dict) and _is_local_model_placeholder(token.get('endpoint'))
+                   for token in tokens):
+                edit = ConcurrentTranslationPool._token_endpoint_edits(lines, tokens, endpoints)
+                if edit is None:
+                    return ConcurrentTranslationPool._dump_local_endpoints(cfg, endpoints)
+                edits.extend(edit)
+        for first, last, new_lines in sorted(edits, key=lambda edit: edit[0], reverse=True):
+            lines[first:last] = new_lines
+        return ''.join(lines)
+
+    @staticmethod
+    def _sakura_endpoint_edits(lines, sakura_cfg, endpoints):
+        """SakuraLLM：endpoints 列表整体换成本地实例（保留列表中的注释行），并去掉单个 endpoint 键"""
+        base = ('backendSpecific', 'SakuraLLM')
+        list_block = _yaml_key_block(lines, base + ('endpoints',)) if 'endpoints' in sakura_cfg else None
+        single = _yaml_key_block(lines, base + ('endpoint',)) if 'endpoint' in sakura_cfg else None
+        if ('endpoints' in sakura_cfg and list_block is None) or ('endpoint' in sakura_cfg and single is None):
+            return None
+        edits = []
+        if list_block is not None and sakura_cfg.get('endpoints'):
+            key_line, end = list_block
+            items = [i for i in range(key_line + 1, end) if _yaml_line_indent(lines[i]) is not None]
+            if not items or not all(lines[i].lstrip(' ').startswith('- ') for i in items):
+                return None  # 行内列表等写法
+            indent = ' ' * _yaml_line_indent(lines[items[0]])
+            newline = '\r\n' if lines[items[0]].endswith('\r\n') else '\n'
+            edits.append((items[0], items[0] + 1, [f'{indent}- {endpoint}{newline}' for endpoint in endpoints]))
+            edits.extend((i, i + 1, []) for i in items[1:])
+            if single is not None:
+                edits.append((single[0], single[1], []))
+        else:
+            # 只有单个 endpoint（或 endpoints 为空）：就地换成 endpoints 列表
+            key_line, end = single if single is not None else list_block
+            line = lines[key_line]
+            indent = ' ' * _yaml_line_indent(line)
+            newline = '\r\n' if line.endswith('\r\n') else '\n'
+            comment = re.search(r'\s#.*$', line.rstrip('\r\n'))
+            new_lines = [f'{indent}endpoints:{comment.group(0) if comment else ""}{newline}']
+            new_lines += [f'{indent}  - {endpoint}{newline}' for endpoint in endpoints]
+            edits.append((key_line, end, new_lines))
+            if single is not None and list_block is not None:
+                edits.append((list_block[0], list_block[1], []))
+        return edits
+
+    @staticmethod
+    def _token_endpoint_edits(lines, tokens, endpoints):
+        """OpenAI-Compatible：把 endpoint 为本地占位的 token 项按本地实例逐个复制"""
+        block = _yaml_key_block(lines, ('backendSpecific', 'OpenAI-Compatible', 'tokens'))
+        if block is None:
+            return None
+        key_line, end = block
+        item_starts = [i for i in range(key_line + 1, end)
+                       if _yaml_line_indent(lines[i]) is not None and lines[i].lstrip(' ').startswith('- ')]
+        if not item_starts:
+            return None
+        item_indent = _yaml_line_indent(lines[item_starts[0]])
+        item_starts = [i for i in item_starts if _yaml_line_indent(lines[i]) == item_indent]
+        if len(item_starts) != len(tokens):
+            return None
+        edits = []
+        bounds = item_starts + [end]
+        for token, first, last in zip(tokens, bounds, bounds[1:]):
+            if not (isinstance(token, dict) and _is_local_model_placeholder(token.get('endpoint'))):
+                continue
+            while last > first + 1 and _yaml_line_indent(lines[last - 1]) is None:
+                last -= 1
+            item = lines[first:last]
+            endpoint_lines = [
+                i for i, line in enumerate(item)
+                if re.match(r'(- )?endpoint\s*:', line.lstrip(' ')) and _is_local_model_placeholder(line)
+            ]
+            if len(endpoint_lines) != 1:
+                return None
+            index = endpoint_lines[0]
+            copies = []
+            for endpoint in endpoints:
+                copy = list(item)
+                copy[index] = re.sub(
+                    r'(endpoint\s*:\s*)([\'"]?)[^\s\'"#]+\2',
+                    lambda m: m.group(1) + m.group(2) + endpoint + m.group(2),
+                    copy[index], count=1)
+                copies.extend(copy)
+            edits.append((first, last, copies))
+        return edits
+
+    @staticmethod
+    def _dump_local_endpoints(cfg, endpoints):
+        """无法按行改写时的退路：修改解析结果后整体序列化（注释会丢失）"""
+        backend = cfg.get('backendSpecific') or {}
+        sakura_cfg = backend.get('SakuraLLM')
+        if isinstance(sakura_cfg, dict):
+            configured = sakura_cfg.get('endpoints') or [sakura_cfg.get('endpoint')]
+            if any(_is_local_model_placeholder(endpoint) for endpoint in configured):
+                sakura_cfg['endpoints'] = endpoints
+                sakura_cfg.pop('endpoint', None)
+        openai_cfg = backend.get('OpenAI-Compatible')
+        if isinstance(openai_cfg, dict) and isinstance(openai_cfg.get('tokens'), list):
+            tokens = []
+            for token in openai_cfg['tokens']:
+                if isinstance(token, dict) and _is_local_model_placeholder(token.get('endpoint')):
+                    tokens.extend(dict(token, endpoint=endpoint) for endpoint in endpoints)
+                else:
+                    tokens.append(token)
+            openai_cfg['tokens'] = tokens
+        return yaml.dump(cfg, allow_unicode=True, sort_keys=False, default_flow_style=False)
+
     @staticmethod
     def _generate_output_impl(json_src, base_path, output_dir, output_format, workspace, orig_srt_path=''):
         """在线程中生成输出文件"""
@@ -791,6 +2230,29 @@ class ConcurrentTranslationPool:
                 merge_lrc_files([left, right],
                                 os.path.join(output_dir, base_name + '.combine.lrc'))
 
+        # 额外目标语言（extraTargetLanguages）的译文在 gt_output_<lang>，输出为 <文件名>.<lang>.srt/.lrc
+        for sub in ConcurrentTranslationPool._target_subdirs(workspace, 'gt_output'):
+            lang_json = os.path.join(workspace, sub, json_name)
+            if sub == 'gt_output' or not os.path.exists(lang_json):
+                continue
+            lang_base = base_name + '.' + sub[len('gt_output_'):]
+            if output_format in ('目标SRT', '双语SRT'):
+                make_srt(lang_json, os.path.join(output_dir, lang_base + '.srt'))
+            if output_format in ('目标LRC', '双语LRC'):
+                make_lrc(lang_json, os.path.join(output_dir, lang_base + '.lrc'))
+            if output_format == '双语SRT':
+                left = os.path.join(output_dir, base_name + '.srt')
+                right = os.path.join(output_dir, lang_base + '.srt')
+                if os.path.exists(left) and os.path.exists(right):
+                    merge_srt_files([left, right],
+                                    os.path.join(output_dir, lang_base + '.combine.srt'))
+            if output_format == '双语LRC':
+                left = os.path.join(output_dir, base_name + '.orig.lrc')
+                right = os.path.join(output_dir, lang_base + '.lrc')
+                if os.path.exists(left) and os.path.exists(right):
+                    merge_lrc_files([left, right],
+                                    os.path.join(output_dir, lang_base + '.combine.lrc'))
+
         if output_format not in ('双语SRT', '原文SRT'):
             left = os.path.join(output_dir, base_name + '.srt')
             if os.path.exists(left):
@@ -818,9 +2280,9 @@ class ConcurrentTranslationPool:
         self._active_threads: list[threading.Thread] = []
         self._error_count = 0
         self._error_lock = threading.Lock()
-        # 本地模型相关（所有进程共享一个本地模型）
-        self._shared_local_model_proc = None
-        self._shared_local_model_port = None
+        # 本地模型相关（所有翻译进程共享一组 llama-server 实例）
+        self._local_farm: LocalModelFarm | None = None
+        self._local_endpoints: list[str] = []  # 原地更新，工作线程持有同一个列表
         self._local_model_lock = threading.Lock()
         # 串行模式相关
         self._serial_mode = max_concurrent <= 0
@@ -835,6 +2297,11 @@ class ConcurrentTranslationPool:
         with self._error_lock:
             return self._error_count
 
+    def record_error(self):
+        """记录一个未经工作线程上报的失败（如等待超时）"""
+        with self._error_lock:
+            self._error_count += 1
+
     def start(self, engine):
         """启动 N 个工作线程"""
         self._engine = engine
@@ -843,15 +2310,11 @@ class ConcurrentTranslationPool:
         if self._serial_mode:
             return
 
-        # 如果配置了本地模型，启动一个共享的本地模型实例
+        # 如果配置了本地模型，启动共享的本地模型实例
         if self._local_model_config and self._local_model_config.get('sakura_file'):
-            proc, port = self._start_local_model(0)
-            if proc:
-                with self._local_model_lock:
-                    self._shared_local_model_proc = proc
-                    self._shared_local_model_port = port
-            else:
-                self._msg_queue.put("status", _("status_local_model_start_fail"))
+            with self._local_model_lock:
+                if not self._start_local_model():
+                    self._msg_queue.put("status", _("status_local_model_start_fail"))
 
         # 创建线程事件
         self._thread_stop_event = threading.Event()
@@ -862,60 +2325,75 @@ class ConcurrentTranslationPool:
                 target=ConcurrentTranslationPool._translate_worker_thread,
                 args=(self._task_queue, self._result_queue, self._msg_queue,
                       self._thread_stop_event, self._project_dir, self._base_config_path,
-                      engine, i),
+                      engine, i, (self._active_translate_procs, self._procs_lock),
+                      self._local_endpoints),
                 daemon=True
             )
             self._active_threads.append(t)
             t.start()
 
+    @staticmethod
+    def _task_dict(tf):
+        return {
+            'base_path': tf.base_path,
+            'json_src': tf.json_src,
+            'output_dir': tf.output_dir,
+            'output_format': tf.output_format,
+            'orig_srt_path': tf.orig_srt_path,
+            'source_path': tf.source_path,
+        }
+
     def submit(self, tf):
-        """提交翻译任务"""
+        """提交翻译任务，返回该文件的 Future（结果为 json_src，失败时带异常）"""
+        future = Future()
         if self._serial_mode:
             # 串行模式
             with self._serial_lock:
                 if self._stop_event.is_set():
-                    return
+                    future.cancel()
+                    return future
+                future.set_running_or_notify_cancel()
 
                 # 启动共享本地模型
                 if self._local_model_config and self._local_model_config.get('sakura_file'):
                     with self._local_model_lock:
-                        if not self._shared_local_model_proc:
-                            proc, port = self._start_local_model(0)
-                            if proc:
-                                self._shared_local_model_proc = proc
-                                self._shared_local_model_port = port
-                            else:
-                                self._msg_queue.put("status", _("status_local_model_start_fail"))
+                        if not self.local_model_running() and not self._start_local_model():
+                            self._msg_queue.put("status", _("status_local_model_start_fail"))
 
                 # 执行翻译（在调用线程中同步执行）
-                tf_dict = {
-                    'base_path': tf.base_path,
-                    'json_src': tf.json_src,
-                    'output_dir': tf.output_dir,
-                    'output_format': tf.output_format,
-                    'orig_srt_path': tf.orig_srt_path,
-                }
+                tf_dict = self._task_dict(tf)
                 try:
                     ConcurrentTranslationPool._translate_one_impl(
                         tf_dict, 0, self._project_dir, self._base_config_path,
-                        self._engine, self._msg_queue)
+                        self._engine, self._msg_queue, local_endpoints=self._local_endpoints)
+                    future.set_result(tf_dict['json_src'])
                 except Exception as e:
                     with self._error_lock:
                         self._error_count += 1
                     self._msg_queue.put("status", _("status_translation_fail", error=e))
+                    future.set_exception(e)
 
                 # 停止共享本地模型
                 self._stop_shared_local_model()
         else:
             # 并发模式：放入队列
-            tf_dict = {
-                'base_path': tf.base_path,
-                'json_src': tf.json_src,
-                'output_dir': tf.output_dir,
-                'output_format': tf.output_format,
-                'orig_srt_path': tf.orig_srt_path,
-            }
-            self._task_queue.put(tf_dict)
+            self._task_queue.put((self._task_dict(tf), future))
+        return future
+
+    def wait(self, futures, timeout=None):
+        """完成屏障：等待指定文件的翻译结束，线程池保持运行。
+
+        停止事件触发或超时返回 False；单个文件失败不影响返回值，由 error_count 统计。
+        """
+        deadline = None if timeout is None else time() + timeout
+        for future in futures:
+            while not future.done():
+                if self._stop_event.is_set():
+                    return False
+                if deadline is not None and time() >= deadline:
+                    return False
+                sleep(0.2)
+        return True
 
     def done(self):
         """所有任务已提交，发送哨兵信号"""
@@ -972,12 +2450,14 @@ class ConcurrentTranslationPool:
                         pass
             self._active_translate_procs.clear()
 
-        # 清空任务队列（丢弃未处理的任务）
+        # 清空任务队列（丢弃未处理的任务并取消其 Future）
         while True:
             try:
-                self._task_queue.get_nowait()
+                task = self._task_queue.get_nowait()
             except queue.Empty:
                 break
+            if task is not None:
+                task[1].cancel()
 
         # 等待所有工作线程结束
         for t in self._active_threads:
@@ -992,28 +2472,36 @@ class ConcurrentTranslationPool:
         # 排空消息队列中所有残留
         self._msg_queue.drain_all(timeout=2.0)
 
+    def local_model_running(self):
+        farm = self._local_farm
+        return farm is not None and farm.running()
+
     def _stop_shared_local_model(self):
-        """停止共享的本地模型"""
+        """归还共享的本地模型：交给 LOCAL_MODEL_DAEMON 空闲计时，下次运行配置一致时直接复用"""
         with self._local_model_lock:
-            proc = self._shared_local_model_proc
-            self._shared_local_model_proc = None
-            self._shared_local_model_port = None
-        if proc:
-            try:
-                if proc.poll() is None:
-                    self._msg_queue.put("status", _("status_local_model_stopping"))
-                    proc.terminate()
-                    proc.wait(timeout=5)
-            except Exception:
-                try:
-                    proc.kill()
-                except Exception:
-                    pass
+            farm = self._local_farm
+            self._local_farm = None
+            self._local_endpoints.clear()
+        if farm is not None:
+            LOCAL_MODEL_DAEMON.release(farm)
+
+    def _local_model_slots(self):
+        """按翻译并发度推导本地模型实例数与每实例 --parallel 槽位数"""
+        workers_per_project = 1
+        try:
+            with open(self._base_config_path, 'r', encoding='utf-8') as f:
+                common = (yaml.safe_load(f) or {}).get('common') or {}
+            workers_per_project = max(1, int(common.get('workersPerProject') or 1))
+        except (OSError, ValueError, TypeError, yaml.YAMLError):
+            pass
+        instances = max(1, self.local_model_instances)
+        total = min(max(1, self._max_concurrent) * workers_per_project, self.local_model_max_parallel)
+        return instances, max(1, -(-total // instances))
 
-    def _start_local_model(self, worker_idx):
-        """启动共享的本地模型服务"""
+    def _start_local_model(self):
+        """在空闲端口上启动共享的本地模型服务，调用方持有 _local_model_lock"""
         if not self._local_model_config:
-            return None, None
+            return False
 
         cfg = self._local_model_config
         sakura_file = cfg.get('sakura_file', '')
@@ -1021,71 +2509,45 @@ class ConcurrentTranslationPool:
         param_llama = cfg.get('param_llama', '')
 
         if not sakura_file:
-            return None, None
-
-        port = 8989
-
-        self._msg_queue.put("status", _("status_local_model_starting", port=port))
-
-        try:
-            args = _build_llama_server_command(
-                sakura_file, sakura_mode, param_llama, port
+            return False
+
+        def command_factory(port, parallel):
+            command = _build_llama_server_command(sakura_file, sakura_mode, param_llama, port)
+            _set_command_option(command, ('--parallel', '-np'), '--parallel', str(parallel))
+            return command
+
+        instances, parallel = self._local_model_slots()
+        model_path = Path(sakura_file)
+        if not model_path.is_absolute():
+            model_path = Path('llama') / model_path
+        key = (str(model_path.resolve()), str(sakura_mode), ' '.join(_split_command_template(param_llama)),
+               instances, parallel)
+
+        def create_farm():
+            farm = LocalModelFarm(
+                command_factory, self._msg_queue, self._stop_event,
+                instances=instances, parallel=parallel, label=str(Path(sakura_file).name),
             )
-            creationflags = 0x08000000 if os.name == 'nt' else 0
-            expected_model = str(Path(sakura_file).name)
-            proc = subprocess.Popen(
-                args,
-                stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-                creationflags=creationflags,
-            )
-            threading.Thread(
-                target=_stream_proc_to_queue,
-                args=(proc, self._msg_queue, expected_model),
-                daemon=True,
-            ).start()
-
-            start_wait = time()
-
-            while not self._stop_event.is_set():
-                try:
-                    chat_resp = requests.post(
-                        f"http://localhost:{port}/v1/chat/completions",
-                        json={
-                            "model": expected_model,
-                            "messages": [{"role": "user", "content": "ping"}],
-                            "max_tokens": 1,
-                            "temperature": 0
-                        },
-                        timeout=8
-                    )
-                    if chat_resp.status_code == 200:
-                        try:
-                            body = chat_resp.json()
-                            if isinstance(body, dict) and body.get("choices"):
-                                self._msg_queue.put("status",
-                                    _("status_local_model_ready", port=port))
-                                break
-                        except Exception:
-                            pass
-                except requests.exceptions.RequestException:
-                    pass
-
-                if time() - start_wait > 120:
-                    self._msg_queue.put("status",
-                        _("status_local_model_timeout"))
-                    try:
-                        proc.terminate()
-                        proc.wait(timeout=3)
-                    except Exception:
-                        pass
-                    return None, None
-                sleep(1)
-
-            return proc, port
-        except Exception as e:
-            self._msg_queue.put("status",
-                _("status_local_model_start_error", error=e))
-            return None, None
+            try:
+                ready = farm.start()
+            except Exception as e:
+                farm.stop()
+                self._msg_queue.put("status",
+                    _("status_local_model_start_error", error=e))
+                return None
+            if not ready:
+                farm.stop()
+                return None
+            return farm
+
+        farm, reused = LOCAL_MODEL_DAEMON.acquire(key, create_farm)
+        if farm is None:
+            return False
+        if reused:
+            self._msg_queue.put("status", _("status_local_model_reused", endpoints=', '.join(farm.endpoints)))
+        self._local_farm = farm
+        self._local_endpoints[:] = farm.endpoints
+        return True
 
 
 class Widget(QFrame):
@@ -1258,6 +2720,7 @@ class MainWindow(QMainWindow):
             'output_dir': output_dir,
             'use_input_dir': use_input_dir,
             'max_concurrent': self.max_concurrent_spin.value(),
+            'asr_workers': self.asr_workers_spin.value(),
             'enable_segment': enable_segment,
             'segment_duration': segment_duration,
             'enable_transcription': enable_transcription,
@@ -1268,6 +2731,7 @@ class MainWindow(QMainWindow):
             'verbose_mode': self.verbose_checkbox.isChecked(),
             'ui_language': current_lang,
             'target_translation_lang': target_translation_lang,
+            'extra_target_langs': self.extra_target_langs.text().strip() if hasattr(self, 'extra_target_langs') else '',
         }
         with open('gui_settings.yaml', 'w', encoding='utf-8') as f:
             yaml.dump(gui_settings, f, allow_unicode=True, sort_keys=False, default_flow_style=False)
@@ -1341,6 +2805,7 @@ class MainWindow(QMainWindow):
               'adv_local_translator_label', 'local_translator_group'),
              'adv_translator_tip'),
             (('io_concurrency_label', 'max_concurrent_spin'), 'io_concurrency_tip'),
+            (('io_asr_workers_label', 'asr_workers_spin'), 'io_asr_workers_tip'),
             (('adv_online_token_label', 'gpt_token'), 'adv_online_token_placeholder'),
             (('adv_online_model_label', 'gpt_model'), 'adv_online_model_placeholder'),
             (('adv_online_address_label', 'gpt_address'), 'adv_online_address_tip'),
@@ -1672,10 +3137,16 @@ class MainWindow(QMainWindow):
                 and self.enable_translation_checkbox.isChecked()
             )
             self.transcription_lang.setEnabled(language_required)
+        if hasattr(self, 'asr_workers_spin'):
+            transcription_enabled = self.enable_transcription_checkbox.isChecked()
+            self.asr_workers_spin.setEnabled(transcription_enabled)
+            self.io_asr_workers_label.setEnabled(transcription_enabled)
         if hasattr(self, 'target_lang'):
             translation_enabled = self.enable_translation_checkbox.isChecked()
             self.target_lang.setEnabled(translation_enabled)
             self.io_target_lang_label.setEnabled(translation_enabled)
+            self.extra_target_langs.setEnabled(translation_enabled)
+            self.io_extra_target_langs_label.setEnabled(translation_enabled)
             self.max_concurrent_spin.setEnabled(translation_enabled)
             self.io_concurrency_label.setEnabled(translation_enabled)
 
@@ -1685,6 +3156,17 @@ class MainWindow(QMainWindow):
             return self.local_translator_group.currentText()
         return self.online_translator_group.currentText()
 
+    def selected_extra_target_langs(self):
+        """Return the extra target languages (comma or space separated), minus the main target."""
+        if not hasattr(self, 'extra_target_langs'):
+            return []
+        main = self.target_lang.currentData() if hasattr(self, 'target_lang') else 'zh-cn'
+        langs = []
+        for code in re.split(r'[,，\s]+', self.extra_target_langs.text().strip().lower()):
+            if code and code != main and code not in langs:
+                langs.append(code)
+        return langs
+
     def set_selected_translator(self, translator, mode=None):
         """Restore a translator selection while accepting the legacy flat value."""
         inferred_mode = 'local' if translator in LOCAL_TRANSLATOR_SUPPORTED else 'online'
@@ -1975,6 +3457,7 @@ class MainWindow(QMainWindow):
                 self.output_dir_edit.setText(output_dir)
             self.use_input_dir_checkbox.setChecked(gui_settings.get('use_input_dir', False))
             self.max_concurrent_spin.setValue(gui_settings.get('max_concurrent', 1))
+            self.asr_workers_spin.setValue(gui_settings.get('asr_workers', 0))
             self.enable_segment_checkbox.setChecked(gui_settings.get('enable_segment', False))
             self.segment_duration_spin.setValue(gui_settings.get('segment_duration', 10))
             change_prompt_mode = gui_settings.get('change_prompt_mode', '')
@@ -1995,6 +3478,8 @@ class MainWindow(QMainWindow):
                 _tl_idx = self.target_lang.findData(gui_settings.get('target_translation_lang', 'zh-cn'))
                 if _tl_idx >= 0:
                     self.target_lang.setCurrentIndex(_tl_idx)
+            if hasattr(self, 'extra_target_langs'):
+                self.extra_target_langs.setText(gui_settings.get('extra_target_langs', ''))
 
         # API Key 始终从 .env 加载
         api_key = _load_api_key()
@@ -2146,26 +3631,23 @@ class MainWindow(QMainWindow):
         self.timer.stop()
         self.shutdown_children()
 
-        # 检查本地模型是否仍在运行
         local_model_running = False
         if hasattr(self, 'worker') and self.worker:
-            # 检查翻译池中的共享本地模型进程
+            # 归还翻译池持有的共享本地模型
             if hasattr(self.worker, '_translation_pool') and self.worker._translation_pool:
                 pool = self.worker._translation_pool
-                if hasattr(pool, '_shared_local_model_proc') and pool._shared_local_model_proc:
-                    proc = pool._shared_local_model_proc
-                    if proc and proc.poll() is None:
-                        local_model_running = True
-                        # 尝试再次停止
-                        pool._stop_shared_local_model()
-                        # 再次检查
-                        if proc.poll() is None:
-                            # 强制终止
-                            try:
-                                proc.kill()
-                                proc.wait(timeout=2)
-                            except Exception:
-                                pass
+                pool._stop_shared_local_model()
+
+        # 程序退出：关闭跨运行常驻的本地模型，仍存活则强制终止
+        if LOCAL_MODEL_DAEMON.running():
+            local_model_running = True
+        for proc in LOCAL_MODEL_DAEMON.shutdown():
+            if proc.poll() is None:
+                try:
+                    proc.kill()
+                    proc.wait(timeout=2)
+                except Exception:
+                    pass
 
         if local_model_running:
             print(_("status_local_model_closed"))
@@ -2348,9 +3830,11 @@ class MainWindow(QMainWindow):
             'io_transcription_lang_label': 'io_transcription_lang_label',
             'enable_segment_checkbox': 'io_segment_checkbox',
             'io_segment_duration_label': 'io_segment_duration_label',
+            'io_asr_workers_label': 'io_asr_workers_label',
             'io_translation_group_label': 'io_translation_group_title',
             'enable_translation_checkbox': 'io_enable_translation_checkbox',
             'io_target_lang_label': 'io_target_lang_label',
+            'io_extra_target_langs_label': 'io_extra_target_langs_label',
             'io_proxy_label': 'io_proxy_label',
             'io_output_group_label': 'io_output_group_title',
             'io_output_dir_label': 'io_output_dir_label',
@@ -2420,6 +3904,7 @@ class MainWindow(QMainWindow):
             'output_text_edit': 'log_realtime_placeholder',
             'input_files_list': 'io_input_placeholder',
             'proxy_address': 'io_proxy_placeholder',
+            'extra_target_langs': 'io_extra_target_langs_placeholder',
             'before_dict': 'dict_before_placeholder',
             'gpt_dict': 'dict_gpt_placeholder',
             'after_dict': 'dict_after_placeholder',
@@ -2551,6 +4036,13 @@ class MainWindow(QMainWindow):
         self.segment_duration_spin.setValue(10)
         self.segment_duration_spin.setEnabled(False)
         transcription_layout.addWidget(self.segment_duration_spin)
+        transcription_layout.addSpacing(16)
+        self.io_asr_workers_label = BodyLabel(_("io_asr_workers_label"))
+        transcription_layout.addWidget(self.io_asr_workers_label)
+        self.asr_workers_spin = QSpinBox()
+        self.asr_workers_spin.setRange(0, 16)
+        self.asr_workers_spin.setValue(0)
+        transcription_layout.addWidget(self.asr_workers_spin)
         transcription_layout.addStretch(1)
         self.input_output_layout.addLayout(transcription_layout)
 
@@ -2573,6 +4065,13 @@ class MainWindow(QMainWindow):
             )
         translation_layout.addWidget(self.target_lang, 1)
 
+        translation_layout.addSpacing(16)
+        self.io_extra_target_langs_label = BodyLabel(_("io_extra_target_langs_label"))
+        translation_layout.addWidget(self.io_extra_target_langs_label)
+        self.extra_target_langs = QLineEdit()
+        self.extra_target_langs.setPlaceholderText(_("io_extra_target_langs_placeholder"))
+        translation_layout.addWidget(self.extra_target_langs, 1)
+
         translation_layout.addSpacing(16)
         self.io_concurrency_label = BodyLabel(_("io_concurrency_label"))
         translation_layout.addWidget(self.io_concurrency_label)
@@ -3186,6 +4685,11 @@ class MainWorker(QObject):
     finished = pyqtSignal()
     show_model_dialog = pyqtSignal(list)
 
+    # 分阶段流水线各阶段的线程数与交接队列容量
+    _DOWNLOAD_WORKERS = 2
+    _EXTRACT_WORKERS = 1
+    _STAGE_QUEUE_SIZE = 2
+
     def __init__(self, master):
         super().__init__()
         self.master = master
@@ -3251,6 +4755,9 @@ class MainWorker(QObject):
     def stop(self):
         self._stop_requested = True
         self._stop_event.set()
+        if getattr(self, '_asr_pool', None) is not None:
+            # 先丢弃排队中的听写任务，避免终止子进程后又启动新的 crispasr
+            self._asr_pool.shutdown(cancel=True, wait=False)
         self._terminate_all_children()
         if hasattr(self, '_translation_pool') and self._translation_pool:
             self._translation_pool.stop()
@@ -3294,6 +4801,8 @@ class MainWorker(QObject):
         if source_lang == 'zh':
             source_lang = 'zh-cn'
         cfg['common']['language'] = f"{source_lang}2{target_lang}"
+        # 额外目标语言：译文写入各工作空间的 gt_output_<lang>，生成字幕时一并输出
+        cfg['common']['extraTargetLanguages'] = self.master.selected_extra_target_langs()
 
         # Update backendSpecific configuration
         if 'backendSpecific' not in cfg:
@@ -3798,10 +5307,36 @@ class MainWorker(QObject):
     def _process_single_audio(
         self, wav_file, asr_model_file, aligner_file, asr_backend, language,
         param_crispasr, json_path, start_named_proc, stop_named_proc,
+        proc_name='crispasr', threads=None, asr_server=None, server_template='',
     ):
-        """使用 CrispASR + forced aligner 处理单个音频文件。"""
+        """使用 CrispASR + forced aligner 处理单个音频文件。
+
+        proc_name 区分并行听写时的各个 crispasr 进程；threads 为该进程可用线程数。
+        asr_server 为 ResidentCrispASR 时复用常驻进程，不再每次重新加载模型；
+        server_template 为其启动模板，参与缓存键。
+        启动 CrispASR 前先按内容查询 project/cache/asr，命中则直接生成 JSON。
+        """
+        cache_srt = None
+        try:
+            cache_key = _asr_cache_key(
+                wav_file, asr_model_file, aligner_file, asr_backend, language, param_crispasr,
+                server_template if asr_server is not None else '')
+            cache_srt = os.path.join(_ASR_CACHE_DIR, cache_key + '.srt')
+        except (OSError, EOFError, wave.Error) as e:
+            self.msg_queue.put("detail", _("status_asr_cache_error", error=e))
         base_path = wav_file[:-4]  # 去掉 .wav
         intermediate_srt = base_path + '.srt'
+        if cache_srt and os.path.isfile(cache_srt) and os.path.getsize(cache_srt) > 0:
+            self._emit_status(_("status_asr_cache_hit", file=os.path.basename(wav_file)))
+            try:
+                os.utime(cache_srt)  # 刷新最近使用时间，供 _evict_asr_cache 按 LRU 清理
+            except OSError:
+                pass
+            if not intermediate_srt.endswith('.16k.srt'):
+                shutil.copyfile(cache_srt, intermediate_srt)
+            make_prompt(cache_srt, json_path)
+            return
+
         work_root = Path('project/cache/crispasr_jobs').resolve()
         work_root.mkdir(parents=True, exist_ok=True)
         work_dir = Path(tempfile.mkdtemp(prefix='job_', dir=work_root))
@@ -3809,23 +5344,41 @@ class MainWorker(QObject):
         output_base = work_dir / 'transcript'
         generated_srt = output_base.with_suffix('.srt')
         try:
-            shutil.copyfile(wav_file, staged_input)
-            command = _build_crispasr_command(
-                staged_input, output_base, asr_model_file, language, param_crispasr,
-                aligner_file=aligner_file, backend=asr_backend,
-            )
-            self.msg_queue.put("detail", _format_command(command))
-            asr_proc, _unused = start_named_proc('crispasr', command)
-            return_code = asr_proc.wait()
-            stop_named_proc('crispasr')
-            if return_code != 0:
-                raise RuntimeError(f'CrispASR exited with code {return_code}')
+            _stage_file(wav_file, staged_input)
+            if asr_server is not None:
+                try:
+                    generated_srt = asr_server.transcribe(staged_input, output_base, language)
+                except RuntimeError as e:
+                    # 常驻进程退出或不支持请求协议：本文件退回逐文件启动 crispasr
+                    self.msg_queue.put("detail", f"[{proc_name}] resident server failed: {e}")
+                    asr_server = None
+                    if cache_srt:
+                        cache_srt = os.path.join(_ASR_CACHE_DIR, _asr_cache_key(
+                            wav_file, asr_model_file, aligner_file, asr_backend, language,
+                            param_crispasr) + '.srt')
+            if asr_server is None:
+                command = _build_crispasr_command(
+                    staged_input, output_base, asr_model_file, language, param_crispasr,
+                    aligner_file=aligner_file, backend=asr_backend, threads=threads,
+                )
+                self.msg_queue.put("detail", _format_command(command))
+                asr_proc, _unused = start_named_proc(proc_name, command)
+                return_code = asr_proc.wait()
+                stop_named_proc(proc_name)
+                if return_code != 0:
+                    raise RuntimeError(f'CrispASR exited with code {return_code}')
             if not generated_srt.is_file() or generated_srt.stat().st_size == 0:
                 raise RuntimeError('CrispASR did not produce a non-empty SRT file')
             shutil.copyfile(generated_srt, intermediate_srt)
             make_prompt(intermediate_srt, json_path)
+            if cache_srt:
+                # 先写临时文件再原子替换，避免并行听写读到半成品
+                os.makedirs(_ASR_CACHE_DIR, exist_ok=True)
+                staged_cache = f'{cache_srt}.{proc_name}.tmp'
+                shutil.copyfile(generated_srt, staged_cache)
+                os.replace(staged_cache, cache_srt)
         finally:
-            stop_named_proc('crispasr')
+            stop_named_proc(proc_name)
             shutil.rmtree(work_dir, ignore_errors=True)
             # 单文件流程中的 16k SRT 只是中间产物。
             if intermediate_srt.endswith('.16k.srt') and os.path.exists(intermediate_srt):
@@ -3849,58 +5402,62 @@ class MainWorker(QObject):
             return 0
 
     def _split_audio(self, audio_file, segment_duration_minutes, output_dir):
-        """将音频文件切分为多个片段，返回片段路径列表"""
-        segment_files = []
-        segment_duration = segment_duration_minutes * 60  # 转换为秒
+        """按静音对齐的切点将 16k WAV 切分为多个片段。
 
-        total_duration = self._get_audio_duration(audio_file)
-        if total_duration == 0:
-            return None, 0
-
-        num_segments = int(total_duration // segment_duration) + (1 if total_duration % segment_duration > 1 else 0)
-        base_name = os.path.basename(audio_file).rsplit('.', 1)[0]
-
-        self._emit_status(_("status_audio_duration", duration=total_duration, segments=num_segments))
+        返回 (片段路径列表, 片段起始秒数列表, 片段归属区间列表)；
+        相邻片段有少量重叠，合并时只保留落在各自归属区间内的字幕。
+        """
+        segment_duration = segment_duration_minutes * 60  # 转换为秒
 
-        for i in range(num_segments):
-            start_time = i * segment_duration
-            end_time = min((i + 1) * segment_duration, total_duration)
-            duration = end_time - start_time
+        try:
+            with wave.open(audio_file, 'rb') as wav:
+                frame_rate = wav.getframerate()
+                total_frames = wav.getnframes()
+        except (OSError, EOFError, wave.Error) as e:
+            self._emit_status(_("status_audio_duration_fail", error=e))
+            return None, [], []
+        if total_frames == 0:
+            return None, [], []
 
-            segment_file = os.path.join(output_dir, f"segment_{i:04d}.16k.wav")
+        total_duration = total_frames / frame_rate
+        try:
+            cut_frames = _plan_silence_cut_frames(audio_file, segment_duration)
+            self._emit_status(_("status_audio_duration", duration=total_duration, segments=len(cut_frames)))
+            segments = _write_wav_segments(
+                audio_file, cut_frames, output_dir, overlap_seconds=_SEGMENT_OVERLAP_SECONDS)
+        except (OSError, EOFError, wave.Error) as e:
+            self._emit_status(_("status_generic_error", error=e))
+            return None, [], []
 
-            try:
-                creationflags = 0x08000000 if os.name == 'nt' else 0
-                proc = subprocess.run(
-                    [_FFMPEG, '-y', '-i', audio_file, '-ss', str(start_time),
-                     '-t', str(duration), '-acodec', 'pcm_s16le', '-ac', '1', '-ar', '16000', segment_file],
-                    capture_output=True, timeout=120, creationflags=creationflags
-                )
-                if proc.returncode == 0 and os.path.exists(segment_file):
-                    segment_files.append(segment_file)
-                else:
-                    self._emit_status(_("status_segment_slice_fail", idx=i+1))
-            except Exception as e:
-                self._emit_status(_("status_segment_slice_fail_detail", idx=i+1, error=e))
+        segment_files = [segment[0] for segment in segments]
+        segment_offsets = [segment[1] for segment in segments]
+        segment_windows = [(segment[2], segment[3]) for segment in segments]
+        return segment_files, segment_offsets, segment_windows
 
-        return segment_files, total_duration
+    def _merge_segment_translations(self, segment_files, segment_tfs, original_base_path, output_json_path, final_output_dir, output_format, segment_offsets, segment_windows):
+        """合并多个分段的翻译结果，生成最终字幕文件。
 
-    def _merge_segment_translations(self, segment_files, segment_tfs, original_base_path, output_json_path, final_output_dir, output_format, duration):
-        """合并多个分段的翻译结果，调整时间戳并生成最终字幕文件"""
+        时间戳按各片段实际起始时间平移；相邻片段重叠处的重复字幕
+        只保留落在所属片段归属区间（segment_windows）内的一份。
+        """
         from prompt2srt import make_srt, make_lrc, merge_lrc_files
         from srt2prompt import merge_srt_files
         import glob as glob_module
 
         all_data = []
-        time_offset = 0
         segment_srts_orig = []
         segment_srts_zh = []
         segment_lrcs_orig = []
         segment_lrcs_zh = []
+        # 每个收集到的字幕文件对应其片段的 (起始秒数, 归属区间)，缺失片段不会错位
+        spans_srt_orig = []
+        spans_srt_zh = []
+        spans_lrc_orig = []
+        spans_lrc_zh = []
 
         base_name = os.path.basename(original_base_path)
 
-        for i, segment_file in enumerate(segment_files):
+        for segment_file, offset, window in zip(segment_files, segment_offsets, segment_windows):
             segment_name = os.path.basename(segment_file[:-4])  # 去掉 .wav，保留 .16k
             segment_dir = os.path.dirname(segment_file)
 
@@ -3909,30 +5466,38 @@ class MainWorker(QObject):
                 orig_srt = os.path.join(segment_dir, segment_name + '.srt')
                 if os.path.exists(orig_srt):
                     segment_srts_orig.append(orig_srt)
+                    spans_srt_orig.append((offset, window))
 
             if output_format in ('目标SRT', '双语SRT'):
                 zh_srt = os.path.join(segment_dir, segment_name + '.tg.srt')
                 if os.path.exists(zh_srt):
                     segment_srts_zh.append(zh_srt)
+                    spans_srt_zh.append((offset, window))
 
             if output_format in ('原文LRC', '双语LRC'):
                 orig_lrc = os.path.join(segment_dir, segment_name + '.lrc')
                 if os.path.exists(orig_lrc):
                     segment_lrcs_orig.append(orig_lrc)
+                    spans_lrc_orig.append((offset, window))
 
             if output_format in ('目标LRC', '双语LRC'):
                 zh_lrc = os.path.join(segment_dir, segment_name + '.zh.lrc')
                 if os.path.exists(zh_lrc):
                     segment_lrcs_zh.append(zh_lrc)
+                    spans_lrc_zh.append((offset, window))
 
         # 生成最终的合并字幕文件
         if output_format in ('原文SRT', '双语SRT'):
             final_srt = os.path.join(final_output_dir, base_name + '.srt')
-            merge_srt_files(segment_srts_orig, final_srt, duration)
+            merge_srt_files(segment_srts_orig, final_srt,
+                            offsets=[span[0] for span in spans_srt_orig],
+                            windows=[span[1] for span in spans_srt_orig])
 
         if output_format in ('目标SRT', '双语SRT'):
             final_zh_srt = os.path.join(final_output_dir, base_name + '.tg.srt')
-            merge_srt_files(segment_srts_zh, final_zh_srt, duration)
+            merge_srt_files(segment_srts_zh, final_zh_srt,
+                            offsets=[span[0] for span in spans_srt_zh],
+                            windows=[span[1] for span in spans_srt_zh])
 
         if output_format == '双语SRT':
             final_combine_srt = os.path.join(final_output_dir, base_name + '.combine.srt')
@@ -3945,11 +5510,15 @@ class MainWorker(QObject):
             final_lrc = os.path.join(final_output_dir, base_name + '.lrc')
             if output_format == '双语LRC':
                 final_lrc = os.path.join(final_output_dir, base_name + '.orig.lrc')
-            merge_lrc_files(segment_lrcs_orig, final_lrc, duration)
+            merge_lrc_files(segment_lrcs_orig, final_lrc,
+                            offsets=[span[0] for span in spans_lrc_orig],
+                            windows=[span[1] for span in spans_lrc_orig])
 
         if output_format in ('目标LRC', '双语LRC'):
             final_zh_lrc = os.path.join(final_output_dir, base_name + '.zh.lrc')
-            merge_lrc_files(segment_lrcs_zh, final_zh_lrc, duration)
+            merge_lrc_files(segment_lrcs_zh, final_zh_lrc,
+                            offsets=[span[0] for span in spans_lrc_zh],
+                            windows=[span[1] for span in spans_lrc_zh])
 
         if output_format == '双语LRC':
             final_combine_lrc = os.path.join(final_output_dir, base_name + '.combine.lrc')
@@ -4068,6 +5637,150 @@ class MainWorker(QObject):
                 if target:
                     self._cleanup_process(target)
 
+        # 听写进程池：片段与文件并行送入多个 CrispASR 进程
+        asr_workers, asr_threads = _crispasr_pool_size(self.master.asr_workers_spin.value())
+
+        # 常驻听写模式：crispasr/param_server.txt 存在时每个槽位保持一个常驻进程
+        server_template = ''
+        if enable_transcription and os.path.isfile(_CRISPASR_SERVER_TEMPLATE):
+            with open(_CRISPASR_SERVER_TEMPLATE, 'r', encoding='utf-8') as f:
+                server_template = f.read().strip()
+        asr_servers = {}
+        asr_servers_lock = threading.Lock()
+        resident_failed = threading.Event()  # 常驻进程曾意外退出：本次运行不再重启
+
+        def get_asr_server(proc_name, threads):
+            if not server_template or resident_failed.is_set():
+                return None
+            with asr_servers_lock:
+                server = asr_servers.get(proc_name)
+                if server is not None:
+                    if server.alive():
+                        return server
+                    resident_failed.set()
+                    self._emit_status(_("status_asr_server_fallback"))
+                    return None
+                command = _build_crispasr_command(
+                    '', '', asr_model_file, language, server_template,
+                    aligner_file=aligner_file, backend=asr_backend, threads=threads,
+                )
+                self.msg_queue.put("detail", _format_command(command))
+                server = ResidentCrispASR(command, self.msg_queue, label=proc_name)
+                proc = server.start()
+                with self._child_processes_lock:
+                    self.child_processes.append(proc)
+                asr_servers[proc_name] = server
+                self._emit_status(_("status_asr_server_started", name=proc_name))
+                return server
+
+        def close_asr_servers():
+            with asr_servers_lock:
+                servers = list(asr_servers.values())
+                asr_servers.clear()
+            for server in servers:
+                server.close()
+                self._cleanup_process(server.proc)
+
+        def transcribe(wav_path, out_json, proc_name, threads):
+            if self._stop_event.is_set():
+                return
+            asr_server = get_asr_server(proc_name, threads)
+            self._process_single_audio(
+                wav_path,
+                asr_model_file,
+                aligner_file,
+                asr_backend,
+                language,
+                param_crispasr,
+                out_json,
+                start_named_proc,
+                stop_named_proc,
+                proc_name=proc_name,
+                threads=threads,
+                asr_server=asr_server,
+                server_template=server_template,
+            )
+
+        self._asr_pool = None
+        if enable_transcription:
+            evicted = _evict_asr_cache()
+            if evicted:
+                self.msg_queue.put("detail", f"[asr cache] evicted {evicted} entries")
+            self._asr_pool = CrispASRPool(transcribe, asr_workers, asr_threads)
+            self._emit_status(_("status_asr_pool", workers=asr_workers, threads=asr_threads))
+
+        # 已提交听写但尚未收尾的文件 [(future, finalize)]，严格按提交顺序收尾
+        pending_asr = []
+        # 分段翻译尚未合并的长文件 [(翻译 futures, merge)]：翻译与后续文件的听写并行
+        pending_merges = []
+
+        def finish_pending_merges(block):
+            """按提交顺序合并已翻译完的长文件；block=True 时等待全部完成"""
+            while pending_merges:
+                futures, merge = pending_merges[0]
+                timed_out = False
+                if block:
+                    if not all(future.done() for future in futures):
+                        self._emit_status(_("status_wait_segments"))
+                    finished = self._translation_pool.wait(futures, timeout=600)
+                    timed_out = not finished and not self._stop_event.is_set()
+                elif not all(future.done() for future in futures):
+                    return
+                pending_merges.pop(0)
+                if self._stop_event.is_set():
+                    continue
+                if timed_out:
+                    # 分段翻译超时：不合并残缺结果，计入失败数
+                    self._translation_pool.record_error()
+                    self._emit_status(_("status_segments_timeout", timeout=600))
+                    continue
+                merge()
+
+        def wait_asr(future):
+            """取回听写结果；取消任务时吞掉被终止进程带来的异常，返回是否成功"""
+            try:
+                future.result()
+            except Exception:
+                if self._stop_event.is_set():
+                    return False
+                raise
+            return not self._stop_event.is_set()
+
+        def finish_pending_asr(limit):
+            """按提交顺序收尾听写任务，直到在途数量不超过 limit"""
+            while len(pending_asr) > limit:
+                future, finalize = pending_asr.pop(0)
+                if wait_asr(future):
+                    finalize()
+
+        def finish_audio_file(base_path, json_path, wav_file, file_output_dir):
+            """单文件听写完成后：生成原文 SRT/LRC、清理临时音频并提交翻译"""
+            if output_format == '原文SRT' or output_format == '双语SRT':
+                srt_output = os.path.join(file_output_dir, os.path.basename(base_path + '.srt'))
+                make_srt(json_path, srt_output)
+
+            if output_format == '原文LRC' or output_format == '双语LRC':
+                lrc_name = os.path.basename(base_path + '.lrc')
+                if output_format == '双语LRC':
+                    lrc_name = os.path.basename(base_path + '.orig.lrc')
+                lrc_output = os.path.join(file_output_dir, lrc_name)
+                make_lrc(json_path, lrc_output)
+
+            # 清理临时文件
+            if os.path.exists(wav_file):
+                os.remove(wav_file)
+
+            self._emit_status(_("status_asr_done"))
+
+            if need_translate:
+                self._translation_pool.submit(TranscribedFile(
+                    base_path=base_path,
+                    json_src=json_path,
+                    output_dir=file_output_dir,
+                    output_format=output_format,
+                    orig_srt_path='',
+                ))
+
         # 流水线流程：听写线程 + 翻译线程并行
         transcribed_dir = os.path.join('project', 'cache', 'transcribed')
         os.makedirs(transcribed_dir, exist_ok=True)
@@ -4098,10 +5811,12 @@ class MainWorker(QObject):
             )
             self._translation_pool.start(engine)
 
-        # 主线程：顺序执行下载+听写，产出放入队列
-        for idx, input_file in enumerate(input_files):
-            if self._stop_event.is_set():
-                break
+        # 分阶段流水线：下载 → 提取音频 →（主线程调度）听写 → 翻译 → 生成字幕
+        # 各阶段有独立的工作线程数和有界交接队列：第 k+1 个文件下载/提取时，
+        # 第 k 个文件在 CrispASR 中听写，第 k-1 个文件在翻译线程池中翻译。
+        def download_stage(job):
+            """下载阶段：把 BV 号 / 链接解析为本地媒体文件"""
+            input_file = job.input_file
             if not os.path.exists(input_file):
                 if input_file.startswith('BV'):
                     self._emit_status(_("status_downloading_video"))
@@ -4126,7 +5841,7 @@ class MainWorker(QObject):
                     else:
                         self._emit_status(_("status_download_not_found", file=downloaded_file))
                         self._stop_event.set()
-                        break
+                        return None
 
                 else:
                     ydl_outtmpl = os.path.join(output_dir, 'YoutubeDL_%(title)s_%(id)s.%(ext)s')
@@ -4152,13 +5867,63 @@ class MainWorker(QObject):
                     if not os.path.exists(input_file):
                         self._emit_status(_("status_download_not_found", file=input_file))
                         self._stop_event.set()
-                        break
-
-            self._emit_status(_("status_processing_file", file=input_file, idx=idx+1, total=len(input_files)))
-            current_output_dir = output_dir
+                        return None
+            job.input_file = input_file
+            return job
+
+        def extract_stage(job):
+            """提取阶段：确定输出目录，并为需要听写的音视频提取 16k 音频"""
+            input_file = job.input_file
+            self._emit_status(_("status_processing_file", file=input_file, idx=job.index+1, total=len(input_files)))
+            job.output_dir = output_dir
             if use_input_dir:
-                current_output_dir = os.path.dirname(os.path.abspath(input_file)) or output_dir
-                self._emit_status(_("status_file_output_dir", dir=current_output_dir))
+                job.output_dir = os.path.dirname(os.path.abspath(input_file)) or output_dir
+                self._emit_status(_("status_file_output_dir", dir=job.output_dir))
+
+            if input_file.endswith('.srt'):
+                return job
+            if not enable_transcription:
+                return None
+
+            base_path = input_file.rsplit('.', 1)[0] if '.' in input_file else input_file
+            if need_translate and os.path.exists(base_path + '.srt'):
+                # 已有字幕且需要翻译时直接复用，无需提取音频
+                return job
+
+            wav_file = base_path + '.16k.wav'
+            self._emit_status(_("status_extracting_audio"))
+            proc_name = f'ffmpeg_extract_{job.index}'
+            ffmpeg_proc, _unused = start_named_proc(
+                proc_name,
+                [_FFMPEG, '-y', '-i', input_file, '-map', '0:a:0', '-vn', '-sn', '-dn',
+                 '-acodec', 'pcm_s16le', '-ac', '1', '-ar', '16000', wav_file]
+            )
+            ffmpeg_proc.wait()
+            stop_named_proc(proc_name)
+
+            if not os.path.exists(wav_file):
+                self._emit_status(_("status_audio_extract_error"))
+                pipeline.abort()
+                return None
+            job.wav_file = wav_file
+            return job
+
+        pipeline = StagedPipeline(
+            [
+                ('download', download_stage, self._DOWNLOAD_WORKERS),
+                ('extract', extract_stage, self._EXTRACT_WORKERS),
+            ],
+            stop_event=self._stop_event,
+            queue_size=self._STAGE_QUEUE_SIZE,
+        )
+
+        # 主线程：按输入顺序取出已提取的文件，调度听写并提交翻译
+        jobs = (MediaJob(index=idx, input_file=path) for idx, path in enumerate(input_files))
+        for job in pipeline.run(jobs):
+            if self._stop_event.is_set():
+                break
+            input_file = job.input_file
+            current_output_dir = job.output_dir
 
             tf: TranscribedFile | None = None
 
@@ -4190,13 +5955,10 @@ class MainWorker(QObject):
                     orig_srt_path=os.path.abspath(input_file),
                 )
             else:
-                # 音视频输入：提取音频 → 听写（如果已有srt则跳过）
-                if not enable_transcription:
-                    continue
-
+                # 音视频输入：听写（如果已有srt则跳过，音频已在提取阶段准备好）
                 base_path = input_file.rsplit('.', 1)[0] if '.' in input_file else input_file
                 existing_srt = base_path + '.srt'
-                wav_file = base_path + '.16k.wav'
+                wav_file = job.wav_file
                 json_path = os.path.join(transcribed_dir, os.path.basename(base_path) + '.json')
 
                 # 检测是否已有srt文件
@@ -4232,18 +5994,6 @@ class MainWorker(QObject):
                         self._translation_pool.submit(tf)
                         continue
 
-                self._emit_status(_("status_extracting_audio"))
-                ffmpeg_proc, _unused = start_named_proc(
-                    'ffmpeg_extract',
-                    [_FFMPEG, '-y', '-i', input_file, '-acodec', 'pcm_s16le', '-ac', '1', '-ar', '16000', wav_file]
-                )
-                ffmpeg_proc.wait()
-                stop_named_proc('ffmpeg_extract')
-
-                if not os.path.exists(wav_file):
-                    self._emit_status(_("status_audio_extract_error"))
-                    break
-
                 # 检查是否启用分段处理
                 base_path = wav_file[:-8]  # 去掉 .16k.wav
                 json_path = os.path.join(transcribed_dir, os.path.basename(base_path) + '.json')
@@ -4259,7 +6009,7 @@ class MainWorker(QObject):
                     os.makedirs(segment_dir, exist_ok=True)
 
                     # 切分音频
-                    segment_files, _unused = self._split_audio(wav_file, segment_duration_minutes, segment_dir)
+                    segment_files, segment_offsets, segment_windows = self._split_audio(wav_file, segment_duration_minutes, segment_dir)
 
                     if not segment_files:
                         self._emit_status(_("status_segment_fail"))
@@ -4267,103 +6017,87 @@ class MainWorker(QObject):
                             os.remove(wav_file)
                         break
 
-                    # 对每个片段进行听写和翻译
+                    # 所有片段一次性送入听写进程池，再按顺序取回并提交翻译
+                    # 片段听写结果按文件分目录存放：合并延后进行，下一个长文件的同名片段不能覆盖它们
+                    segment_json_dir = os.path.join(transcribed_dir, os.path.basename(base_path))
+                    os.makedirs(segment_json_dir, exist_ok=True)
+                    segment_futures = []
+                    for segment_file in segment_files:
+                        segment_name = os.path.basename(segment_file[:-4])  # 去掉 .wav
+                        segment_json = os.path.join(segment_json_dir, segment_name + '.json')
+                        segment_futures.append(self._asr_pool.submit(segment_file, segment_json))
+
+                    # 先收尾此前提交的整文件听写，保证输出顺序
+                    finish_pending_asr(0)
+
                     segment_tfs = []  # 存储每个分段的 TranscribedFile
-                    for i, segment_file in enumerate(segment_files):
+                    translate_futures = []  # 各分段翻译的 Future
+                    for i, (segment_file, future) in enumerate(zip(segment_files, segment_futures)):
                         if self._stop_event.is_set():
                             break
                         self._emit_status(_("status_segment_processing", idx=i+1, total=len(segment_files)))
+                        if not wait_asr(future):
+                            break
 
                         segment_base = segment_file[:-4] # 去掉 .wav
-                        segment_name = os.path.basename(segment_base)
-
-                        segment_json = os.path.join(transcribed_dir, segment_name + '.json')
-                        self._process_single_audio(
-                            segment_file,
-                            asr_model_file,
-                            aligner_file,
-                            asr_backend,
-                            language,
-                            param_crispasr,
-                            segment_json,
-                            start_named_proc,
-                            stop_named_proc,
-                        )
 
                         # 立即提交该分段进行翻译
                         if need_translate:
                             self._emit_status(_("status_segment_submit_translate", idx=i+1, total=len(segment_files)))
                             segment_tf = TranscribedFile(
                                 base_path=segment_base,
-                                json_src=segment_json,
+                                json_src=future.result(),
                                 output_dir=segment_dir,  # 临时输出到分段目录
                                 output_format=output_format,
                                 orig_srt_path='',
+                                source_path=base_path,
                             )
-                            self._translation_pool.submit(segment_tf)
+                            translate_futures.append(self._translation_pool.submit(segment_tf))
                             segment_tfs.append(segment_tf)
+                    for future in segment_futures:
+                        future.cancel()
 
-                    # 等待所有分段翻译完成
-                    if need_translate and segment_tfs:
-                        self._emit_status(_("status_wait_segments"))
-                        self._translation_pool.done()
-                        self._translation_pool.wait_all(timeout=600)
-
-                    # 合并所有片段的翻译结果
-                    self._emit_status(_("status_merge_segments"))
-                    self._merge_segment_translations(segment_files, segment_tfs, base_path, json_path, current_output_dir, output_format, threshold_seconds)
+                    def merge_segments(segment_files=segment_files, segment_tfs=segment_tfs,
+                                       base_path=base_path, json_path=json_path,
+                                       file_output_dir=current_output_dir,
+                                       segment_offsets=segment_offsets, segment_windows=segment_windows):
+                        self._emit_status(_("status_merge_segments"))
+                        self._merge_segment_translations(segment_files, segment_tfs, base_path, json_path, file_output_dir, output_format, segment_offsets, segment_windows)
+                        self._emit_status(_("status_segment_done"))
 
-                    self._emit_status(_("status_segment_done"))
+                    if need_translate and segment_tfs:
+                        # 不关闭线程池：分段翻译与下一个文件的听写并行，完成后再合并
+                        pending_merges.append((translate_futures, merge_segments))
+                    else:
+                        merge_segments()
 
                     # 分段处理已完成，跳过常规流程
                     tf = None
                 else:
-                    # 正常流程（未启用分段）
+                    # 正常流程（未启用分段）：送入听写进程池，收尾在完成后按顺序进行
                     self._emit_status(_("status_asr_in_progress"))
-                    self._process_single_audio(
-                        wav_file,
-                        asr_model_file,
-                        aligner_file,
-                        asr_backend,
-                        language,
-                        param_crispasr,
-                        json_path,
-                        start_named_proc,
-                        stop_named_proc,
-                    )
-
-                    # 生成原文 SRT/LRC 输出
-                    if output_format == '原文SRT' or output_format == '双语SRT':
-                        srt_output = os.path.join(current_output_dir, os.path.basename(base_path + '.srt'))
-                        make_srt(json_path, srt_output)
-
-                    if output_format == '原文LRC' or output_format == '双语LRC':
-                        lrc_name = os.path.basename(base_path + '.lrc')
-                        if output_format == '双语LRC':
-                            lrc_name = os.path.basename(base_path + '.orig.lrc')
-                        lrc_output = os.path.join(current_output_dir, lrc_name)
-                        make_lrc(json_path, lrc_output)
-
-                    # 清理临时文件
-                    if os.path.exists(wav_file):
-                        os.remove(wav_file)
-
-                    self._emit_status(_("status_asr_done"))
-
-                    tf = TranscribedFile(
-                        base_path=base_path,
-                        json_src=json_path,
-                        output_dir=current_output_dir,
-                        output_format=output_format,
-                        orig_srt_path='',
-                    )
+                    pending_asr.append((
+                        self._asr_pool.submit(wav_file, json_path),
+                        functools.partial(finish_audio_file, base_path, json_path, wav_file, current_output_dir),
+                    ))
+                    # 在途文件数不超过进程池大小，避免提前解出过多临时音频
+                    finish_pending_asr(self._asr_pool.max_workers)
+                    tf = None
 
             if need_translate and tf is not None:
                 self._translation_pool.submit(tf)
+            finish_pending_merges(False)
+
+        # 收尾所有在途听写任务
+        finish_pending_asr(0)
+        if self._asr_pool is not None:
+            self._asr_pool.shutdown(cancel=self._stop_event.is_set())
+        close_asr_servers()
 
         # 发送哨兵，等待翻译线程结束
         self._emit_status(_("status_all_transcribed"))
         if self._translation_pool is not None:
+            finish_pending_merges(True)
             self._translation_pool.done()
             self._translation_pool.wait_all(timeout=600)
             self._translation_pool.stop()
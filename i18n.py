@@ -90,6 +90,8 @@ TRANSLATIONS = {
         "io_segment_checkbox": "✂️ 分段处理长音频",
         "io_segment_tip": "先将长音频分段听写和翻译，再自动合并结果。",
         "io_segment_duration_label": "⏱️ 分段时长（分钟）",
+        "io_asr_workers_label": "🧵 听写并发（0=自动）",
+        "io_asr_workers_tip": "同时运行的 CrispASR 进程数。0为按 CPU 核数自动分配；每个进程的线程数按核数均分。GPU 显存不足时请设为1。",
         "io_run_btn": "🚀 运行",
         "io_cancel_btn": "⛔ 取消任务",
         "io_open_output_btn": "📁 打开输出目录",
@@ -99,6 +101,8 @@ TRANSLATIONS = {
         "io_enable_translation_checkbox": "🌐 翻译",
         "io_transcription_lang_label": "🎤 听写语言",
         "io_target_lang_label": "🌐 翻译目标语言",
+        "io_extra_target_langs_label": "➕ 额外目标语言",
+        "io_extra_target_langs_placeholder": "如 en, ko，逗号分隔，留空为不使用",
         "io_concurrency_label": "🧵 并发数（0=串行）",
         "io_concurrency_tip": "同时处理的翻译任务数。0为串行；本地模型建议使用0，在线模型可根据接口配额调整。",
         "target_lang_zh_cn": "简体中文(zh-cn)",
@@ -270,6 +274,7 @@ TRANSLATIONS = {
         "status_translating_done": "[INFO] [进程{idx}] 文件 {base} 翻译完成！",
         "status_local_model_starting": "[INFO] 正在启动共享本地模型，端口 {port}...",
         "status_local_model_ready": "[INFO] 共享本地模型已就绪，端口 {port}",
+        "status_local_model_reused": "[INFO] 复用已加载的本地模型：{endpoints}",
         "status_local_model_timeout": "[ERROR] 共享本地模型启动超时",
         "status_local_model_start_error": "[ERROR] 启动共享本地模型失败: {error}",
         "status_local_model_stopping": "[INFO] 正在停止共享本地模型...",
@@ -299,9 +304,15 @@ TRANSLATIONS = {
         "status_segment_processing": "[INFO] 正在处理第 {idx}/{total} 个音频片段的听写...",
         "status_segment_submit_translate": "[INFO] 正在提交第 {idx}/{total} 个片段进行翻译...",
         "status_wait_segments": "[INFO] 等待所有分段翻译完成...",
+        "status_segments_timeout": "[ERROR] 分段翻译 {timeout} 秒内未完成，跳过合并",
         "status_merge_segments": "[INFO] 合并分段翻译结果...",
         "status_segment_done": "[INFO] 分段听写完成并合并！",
         "status_asr_in_progress": "[INFO] 正在进行语音识别...",
+        "status_asr_pool": "[INFO] 听写进程池：{workers} 个 CrispASR 进程，每进程 {threads} 线程",
+        "status_asr_cache_hit": "[INFO] 命中听写缓存，跳过 CrispASR：{file}",
+        "status_asr_cache_error": "[WARN] 计算听写缓存键失败，将直接听写: {error}",
+        "status_asr_server_started": "[INFO] 已启动常驻听写进程：{name}",
+        "status_asr_server_fallback": "[WARN] 常驻听写进程已退出，改为逐文件启动 CrispASR",
         "status_asr_done": "[INFO] 语音识别完成！",
         "status_all_transcribed": "[INFO] 所有文件听写完成，等待翻译线程处理剩余文件...",
         "status_all_done": "[INFO] 所有文件处理完成！",
@@ -350,6 +361,9 @@ TRANSLATIONS = {
         "status_first_run_init": "[INFO] 首次运行，正在初始化项目配置文件...",
         "status_worker_not_exited": "[WARN] 翻译工作线程 {name} 未能在停止信号后退出",
         "status_translate_proc_ended": "[INFO] [进程{idx}] 翻译进程已结束 (exit={retcode})",
+        "status_translate_usage": "[INFO] [进程{idx}] {base} token 用量：输入 {prompt}，输出 {completion}",
+        "status_translating_batch": "[INFO] [进程{idx}] 合并 {count} 个文件为一个翻译任务：{names}",
+        "status_batch_label": "{count} 个文件",
     },
     "en": {
         # === Window & Tray ===
@@ -440,6 +454,8 @@ TRANSLATIONS = {
         "io_segment_checkbox": "✂️ Split Long Audio",
         "io_segment_tip": "Transcribe and translate long audio in segments, then merge the results automatically.",
         "io_segment_duration_label": "⏱️ Segment Length (min)",
+        "io_asr_workers_label": "🧵 ASR Workers (0=auto)",
+        "io_asr_workers_tip": "Number of CrispASR processes run at once. 0 sizes the pool from the CPU core count; cores are split evenly across processes. Set to 1 if GPU memory is limited.",
         "io_run_btn": "🚀 Run",
         "io_cancel_btn": "⛔ Cancel Task",
         "io_open_output_btn": "📁 Open Output Directory",
@@ -449,6 +465,8 @@ TRANSLATIONS = {
         "io_enable_translation_checkbox": "🌐 Translate",
         "io_transcription_lang_label": "🎤 Transcription Language",
         "io_target_lang_label": "🌐 Target Translation Language",
+        "io_extra_target_langs_label": "➕ Extra Target Languages",
+        "io_extra_target_langs_placeholder": "e.g. en, ko (comma separated), leave empty to disable",
         "io_concurrency_label": "🧵 Concurrency (0=serial)",
         "io_concurrency_tip": "Number of translation tasks processed at once. Use 0 for serial processing; 0 is recommended for local models, while online models can follow the API quota.",
         "target_lang_zh_cn": "简体中文(zh-cn)",
@@ -620,6 +638,7 @@ TRANSLATIONS = {
         "status_translating_done": "[INFO] [Worker {idx}] File {base} translation complete!",
         "status_local_model_starting": "[INFO] Starting shared local model on port {port}...",
         "status_local_model_ready": "[INFO] Shared local model ready on port {port}",
+        "status_local_model_reused": "[INFO] Reusing the already loaded local model: {endpoints}",
         "status_local_model_timeout": "[ERROR] Shared local model startup timed out",
         "status_local_model_start_error": "[ERROR] Failed to start shared local model: {error}",
         "status_local_model_stopping": "[INFO] Stopping shared local model...",
@@ -649,9 +668,15 @@ TRANSLATIONS = {
         "status_segment_processing": "[INFO] Processing segment {idx}/{total} transcription...",
         "status_segment_submit_translate": "[INFO] Submitting segment {idx}/{total} for translation...",
         "status_wait_segments": "[INFO] Waiting for all segment translations to complete...",
+        "status_segments_timeout": "[ERROR] Segment translations did not finish within {timeout}s; skipping merge",
         "status_merge_segments": "[INFO] Merging segment translation results...",
         "status_segment_done": "[INFO] Segment transcription complete and merged!",
         "status_asr_in_progress": "[INFO] Performing speech recognition...",
+        "status_asr_pool": "[INFO] ASR pool: {workers} CrispASR process(es), {threads} thread(s) each",
+        "status_asr_cache_hit": "[INFO] ASR cache hit, skipping CrispASR: {file}",
+        "status_asr_cache_error": "[WARN] Failed to compute ASR cache key, transcribing directly: {error}",
+        "status_asr_server_started": "[INFO] Started resident ASR process: {name}",
+        "status_asr_server_fallback": "[WARN] Resident ASR process exited; falling back to one CrispASR run per file",
         "status_asr_done": "[INFO] Speech recognition complete!",
         "status_all_transcribed": "[INFO] All files transcribed, waiting for translation threads to process remaining files...",
         "status_all_done": "[INFO] All files processed successfully!",
@@ -700,6 +725,9 @@ TRANSLATIONS = {
         "status_first_run_init": "[INFO] First run, initializing project config file...",
         "status_worker_not_exited": "[WARN] Translation worker thread {name} did not exit after stop signal",
         "status_translate_proc_ended": "[INFO] [Worker {idx}] Translation process ended (exit={retcode})",
+        "status_translate_usage": "[INFO] [Worker {idx}] {base} token usage: prompt {prompt}, completion {completion}",
+        "status_translating_batch": "[INFO] [Worker {idx}] Translating {count} files as one job: {names}",
+        "status_batch_label": "{count} files",
     },
     "ja": {
         # === Window & Tray ===
@@ -789,6 +817,8 @@ TRANSLATIONS = {
         "io_segment_checkbox": "✂️ 長い音声を分割",
         "io_segment_tip": "長い音声を分割して文字起こし・翻訳し、結果を自動的に結合します。",
         "io_segment_duration_label": "⏱️ 分割時間（分）",
+        "io_asr_workers_label": "🧵 文字起こし並列数（0=自動）",
+        "io_asr_workers_tip": "同時に実行する CrispASR プロセス数です。0は CPU コア数から自動設定し、各プロセスのスレッド数はコアを均等に割り当てます。GPU メモリが少ない場合は1にしてください。",
         "io_run_btn": "🚀 実行",
         "io_cancel_btn": "⛔ タスクキャンセル",
         "io_open_output_btn": "📁 出力ディレクトリを開く",
@@ -798,6 +828,8 @@ TRANSLATIONS = {
         "io_enable_translation_checkbox": "🌐 翻訳",
         "io_transcription_lang_label": "🎤 文字起こし言語",
         "io_target_lang_label": "🌐 翻訳対象言語",
+        "io_extra_target_langs_label": "➕ 追加の翻訳先言語",
+        "io_extra_target_langs_placeholder": "例：en, ko（カンマ区切り）、空欄で無効",
         "io_concurrency_label": "🧵 同時実行数（0=直列）",
         "io_concurrency_tip": "同時に処理する翻訳タスク数です。0は直列処理。ローカルモデルは0を推奨し、オンラインモデルはAPIの上限に合わせて調整してください。",
         "target_lang_zh_cn": "简体中文(zh-cn)",
@@ -969,6 +1001,7 @@ TRANSLATIONS = {
         "status_translating_done": "[INFO] [ワーカー{idx}] ファイル {base} 翻訳完了！",
         "status_local_model_starting": "[INFO] 共有ローカルモデルを起動中、ポート {port}...",
         "status_local_model_ready": "[INFO] 共有ローカルモデルの準備完了、ポート {port}",
+        "status_local_model_reused": "[INFO] 読み込み済みのローカルモデルを再利用：{endpoints}",
         "status_local_model_timeout": "[ERROR] 共有ローカルモデルの起動がタイムアウトしました",
         "status_local_model_start_error": "[ERROR] 共有ローカルモデルの起動に失敗: {error}",
         "status_local_model_stopping": "[INFO] 共有ローカルモデルを停止中...",
@@ -998,9 +1031,15 @@ TRANSLATIONS = {
         "status_segment_processing": "[INFO] セグメント {idx}/{total} の文字起こしを処理中...",
         "status_segment_submit_translate": "[INFO] セグメント {idx}/{total} を翻訳用に送信中...",
         "status_wait_segments": "[INFO] すべてのセグメント翻訳の完了を待機中...",
+        "status_segments_timeout": "[ERROR] セグメント翻訳が {timeout} 秒以内に完了しなかったため、結合をスキップします",
         "status_merge_segments": "[INFO] セグメント翻訳結果を結合中...",
         "status_segment_done": "[INFO] セグメント文字起こし完了・結合済み！",
         "status_asr_in_progress": "[INFO] 音声認識を実行中...",
+        "status_asr_pool": "[INFO] 文字起こしプール：CrispASR {workers} プロセス、各 {threads} スレッド",
+        "status_asr_cache_hit": "[INFO] 文字起こしキャッシュにヒットしたため CrispASR をスキップ：{file}",
+        "status_asr_cache_error": "[WARN] 文字起こしキャッシュキーの計算に失敗したため、直接文字起こしします: {error}",
+        "status_asr_server_started": "[INFO] 常駐文字起こしプロセスを起動しました：{name}",
+        "status_asr_server_fallback": "[WARN] 常駐文字起こしプロセスが終了したため、ファイルごとに CrispASR を起動します",
         "status_asr_done": "[INFO] 音声認識完了！",
         "status_all_transcribed": "[INFO] すべてのファイルの文字起こしが完了しました。翻訳スレッドが残りのファイルを処理するのを待機中...",
         "status_all_done": "[INFO] すべてのファイル処理が完了しました！",
@@ -1049,6 +1088,9 @@ TRANSLATIONS = {
         "status_first_run_init": "[INFO] 初回実行、プロジェクト設定ファイルを初期化中...",
         "status_worker_not_exited": "[WARN] 翻訳ワーカースレッド {name} が停止信号後に終了しませんでした",
         "status_translate_proc_ended": "[INFO] [ワーカー{idx}] 翻訳プロセスが終了しました (exit={retcode})",
+        "status_translate_usage": "[INFO] [ワーカー{idx}] {base} のトークン使用量：入力 {prompt}、出力 {completion}",
+        "status_translating_batch": "[INFO] [ワーカー{idx}] {count} 個のファイルを1つの翻訳ジョブにまとめます：{names}",
+        "status_batch_label": "{count} 個のファイル",
     },
 }
 
@@ -33,24 +33,31 @@ def make_lrc(input_file, output_file):
         for i, d in enumerate(data):
             print("["+format_result_lrc(d["start"])+"] "+d["message"], file=f)
 
-def merge_lrc_files(input_files, output_file, duration=0):
+def merge_lrc_files(input_files, output_file, duration=0, offsets=None, windows=None):
+    # offsets: per-file start seconds; falls back to a fixed duration step
+    # windows: per-file (start, end) ownership range; lines outside it are
+    # duplicates from an overlapping neighbour and get dropped
+    if offsets is None and duration > 0:
+        offsets = [i * duration for i in range(len(input_files))]
+
     lines = []
-    offset = 0
-    for input_file in input_files:
+    for index, input_file in enumerate(input_files):
         with open(input_file, encoding='utf-8') as f:
             readlines = f.readlines()
 
-        if duration > 0:
+        if offsets is not None:
+            offset = offsets[index]
             for line in readlines:
                 if line.startswith('['):
                     time_str = line.split(']')[0][1:]
                     mm, ss_ms = time_str.split(':')
                     ss, ms = ss_ms.split('.')
                     total_seconds = int(mm) * 60 + int(ss) + int(ms) / 1000 + offset
+                    if windows is not None and not windows[index][0] <= total_seconds < windows[index][1]:
+                        continue
                     new_time_str = format_result_lrc(total_seconds)
                     line = line.replace(time_str, new_time_str)
                 lines.append(line)
-            offset += duration
         else:
             lines.extend(readlines)
 
@@ -4,16 +4,29 @@ import json, argparse
 from datetime import timedelta
 import pysrt
 
-def merge_srt_files(input_files, output_file, duration=0):
+def merge_srt_files(input_files, output_file, duration=0, offsets=None, windows=None):
+    """合并多个 SRT；offsets 给出每个文件的起始秒数，未给出时按固定 duration 递增。
+
+    windows 为每个文件的归属区间 (start, end)（平移后的绝对秒数），
+    字幕中点不在区间内的条目视为与相邻文件重叠的重复字幕而丢弃。
+    """
     merged_subs = pysrt.SubRipFile()
 
-    print(f"Merging {len(input_files)} SRT files with duration {duration} seconds...")
+    if offsets is None:
+        offsets = [i * duration for i in range(len(input_files))]
+        print(f"Merging {len(input_files)} SRT files with duration {duration} seconds...")
+    else:
+        print(f"Merging {len(input_files)} SRT files with explicit offsets...")
 
-    offset = 0
-    for input_file in input_files:
+    for index, (input_file, offset) in enumerate(zip(input_files, offsets)):
         subs = pysrt.open(input_file)
-        subs.shift(seconds=offset)
-        offset += duration
+        subs.shift(milliseconds=int(round(offset * 1000)))
+        if windows is not None:
+            window_start, window_end = windows[index]
+            subs = [
+                sub for sub in subs
+                if window_start <= (sub.start.ordinal + sub.end.ordinal) / 2000 < window_end
+            ]
         merged_subs.extend(subs)
 
     # 按时间顺序重新排序
@@ -0,0 +1,46 @@
+import os
+import shutil
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def _stub_ffmpeg(bin_dir):
+    """在 bin_dir 下放置占位 ffmpeg/ffprobe，只用于通过 app.py 导入时的检查"""
+    suffix = ".exe" if os.name == "nt" else ""
+    for name in ("ffmpeg", "ffprobe"):
+        path = bin_dir / (name + suffix)
+        path.write_text("#!/bin/sh\nexit 0\n", encoding="utf-8")
+        path.chmod(0o755)
+    return str(bin_dir)
+
+
+@pytest.fixture(scope="session")
+def app_module(tmp_path_factory):
+    """导入 app.py；缺少 GUI 依赖时跳过。
+
+    测试不调用 ffmpeg，未安装时用占位程序通过导入检查。
+    app.py 导入时会切换工作目录并把 stdout/stderr 重定向到 log.log，这里在导入后还原。
+    """
+    cwd = os.getcwd()
+    stdout, stderr = sys.stdout, sys.stderr
+    path = os.environ.get("PATH", "")
+    if not shutil.which("ffmpeg"):
+        stub_dir = _stub_ffmpeg(tmp_path_factory.mktemp("ffmpeg"))
+        os.environ["PATH"] = stub_dir + os.pathsep + path
+    try:
+        import app
+    except Exception as e:  # 依赖不全的环境
+        pytest.skip(f"app.py cannot be imported here: {e}")
+    finally:
+        os.environ["PATH"] = path
+        redirected = sys.stdout
+        sys.stdout, sys.stderr = stdout, stderr
+        if redirected is not stdout:
+            redirected.close()
+        os.chdir(cwd)
+    return app
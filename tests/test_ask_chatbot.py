@@ -0,0 +1,153 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+base_translate = pytest.importorskip("GalTransl.Backend.BaseTranslate")
+
+from GalTransl.COpenAI import COpenAIToken
+
+
+class _SlowCompletions:
+    """模拟端点：每次请求按 delay 秒后返回固定译文"""
+
+    def __init__(self, delay, text):
+        self.delay = delay
+        self.text = text
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        message = SimpleNamespace(content=self.text)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+
+class _TimeoutOnceCompletions:
+    """模拟端点：第一次请求超时，之后正常返回"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        if self.calls == 1:
+            error_type = base_translate.APITimeoutError
+            raise error_type.__new__(error_type)
+        message = SimpleNamespace(content="ok")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+
+def _client(delay, text="ok"):
+    return SimpleNamespace(chat=SimpleNamespace(completions=_SlowCompletions(delay, text)))
+
+
+def _translator(clients, strategy="adaptive", hedge=False, hedge_ratio=1.0):
+    translator = object.__new__(base_translate.BaseTranslate)
+    translator.pj_config = SimpleNamespace(stop_event=None, active_workers=2, bar=None)
+    translator.client_list = [
+        (client, COpenAIToken(f"sk-test-{id(client)}", f"http://{name}", "test-model", stream=False))
+        for name, client in clients
+    ]
+    translator.tokenStrategy = strategy
+    translator.api_timeout = 30
+    translator.apiErrorWait = 0
+    translator.global_request_rpm = 0
+    translator.endpoint_limiting = True
+    translator.max_endpoint_concurrency = 4
+    translator.hedge_requests = hedge
+    translator.hedge_max_ratio = hedge_ratio
+    translator._hedge_budget = base_translate.HedgeBudget(hedge_ratio)
+    translator.request_health_metrics = base_translate.RequestHealthMetrics()
+    for _ in range(20):
+        translator.request_health_metrics.record(0.05, False)
+    return translator
+
+
+def _in_flight(translator):
+    limiters = [translator._endpoint_limiter(token).in_flight for _, token in translator.client_list]
+    routed = [item["in_flight"] for item in translator._router().snapshot()]
+    return limiters, routed
+
+
+def test_cancel_releases_limiter_and_router_slots():
+    translator = _translator([("slow-a", _client(30)), ("slow-b", _client(30))])
+
+    async def run():
+        task = asyncio.ensure_future(translator.ask_chatbot(prompt="テスト"))
+        await asyncio.sleep(0.2)
+        assert sum(_in_flight(translator)[0]) == 1
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert _in_flight(translator) == ([0, 0], [0, 0])
+
+
+def test_timeout_halves_endpoint_limit():
+    client = SimpleNamespace(chat=SimpleNamespace(completions=_TimeoutOnceCompletions()))
+    translator = _translator([("flaky", client)])
+    limiter = translator._endpoint_limiter(translator.client_list[0][1])
+    limiter.limit = 4.0
+
+    result, _token = asyncio.run(translator.ask_chatbot(prompt="テスト"))
+
+    assert result == "ok"
+    assert client.chat.completions.calls == 2
+    assert limiter.limit < 4.0
+    assert _in_flight(translator) == ([0], [0])
+
+
+def test_hedge_wins_against_slow_endpoint(monkeypatch):
+    monkeypatch.setattr(base_translate, "HEDGE_MIN_DELAY", 0.1)
+    slow, fast = _client(5, "slow"), _client(0.05, "fast")
+    translator = _translator([("slow", slow), ("fast", fast)], strategy="fallback", hedge=True)
+
+    started = time.monotonic()
+    result, token = asyncio.run(translator.ask_chatbot(prompt="テスト"))
+
+    assert result == "fast"
+    assert token.domain == "http://fast"
+    assert time.monotonic() - started < 2
+    assert (slow.chat.completions.calls, fast.chat.completions.calls) == (1, 1)
+    assert _in_flight(translator) == ([0, 0], [0, 0])
+    assert translator._hedge_budget.hedges == 1
+
+
+def test_hedge_respects_budget(monkeypatch):
+    monkeypatch.setattr(base_translate, "HEDGE_MIN_DELAY", 0.1)
+    slow, fast = _client(0.4, "slow"), _client(0.05, "fast")
+    translator = _translator(
+        [("slow", slow), ("fast", fast)], strategy="fallback", hedge=True, hedge_ratio=0)
+
+    result, _token = asyncio.run(translator.ask_chatbot(prompt="テスト"))
+
+    assert result == "slow"
+    assert fast.chat.completions.calls == 0
+    assert _in_flight(translator) == ([0, 0], [0, 0])
+
+
+def test_hedge_budget_is_atomic_and_per_copy():
+    budget = base_translate.HedgeBudget(0.5)
+    for _ in range(100):
+        budget.record_request()
+    granted = []
+
+    def take():
+        for _ in range(50):
+            if budget.try_acquire():
+                granted.append(1)
+
+    threads = [threading.Thread(target=take) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(granted) == budget.hedges == 50
+
+    translator = _translator([("a", _client(0)), ("b", _client(0))])
+    copy = translator.for_target_lang("en")
+    assert copy._hedge_budget is not translator._hedge_budget
@@ -0,0 +1,114 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+dedup = pytest.importorskip("GalTransl.Dedup")
+
+
+def _tran(pre_jp, pre_zh=""):
+    return SimpleNamespace(
+        pre_jp=pre_jp,
+        pre_zh=pre_zh,
+        post_zh="",
+        proofread_zh="",
+        trans_by="",
+        proofread_by="",
+        trans_conf=0.0,
+        doub_content="",
+        unknown_proper_noun="",
+    )
+
+
+def _chunk(trans, start=0, end=None):
+    return SimpleNamespace(
+        trans_list=trans,
+        non_cross_range=lambda: (start, len(trans) if end is None else end),
+    )
+
+
+def _translate(tran, text):
+    tran.pre_zh = text
+    tran.post_zh = text
+    tran.trans_by = "test-model"
+
+
+def test_normalize_line_unifies_width_and_spaces():
+    assert dedup.normalize_line("ＡＢＣ　は い") == dedup.normalize_line("ABCはい")
+
+
+def test_groups_short_lines_across_chunks_in_order():
+    first = [_tran("はい"), _tran("長い台詞はここで終わらないのでグループに入らない")]
+    second = [_tran("は い"), _tran("ありがとう"), _tran("長い台詞はここで終わらないのでグループに入らない")]
+    third = [_tran("ＯＫ"), _tran("ありがとう"), _tran("OK")]
+
+    async def run():
+        deduper = dedup.LineDeduplicator(max_chars=10)
+        return deduper, deduper.add_chunks([_chunk(first), _chunk(second), _chunk(third)])
+
+    deduper, (groups, saved) = asyncio.run(run())
+
+    assert (groups, saved) == (3, 3)
+    assert deduper.groups["はい"].representative is first[0]
+    assert deduper.groups["はい"].followers == [second[0]]
+    assert deduper.groups["ありがとう"].representative is second[1]
+    assert deduper.groups["OK"].followers == [third[2]]
+    assert not deduper.is_follower(first[1])
+    own, followers = deduper.split_followers(second)
+    assert own == [second[1], second[2]]
+    assert followers == [second[0]]
+
+
+def test_skips_cross_range_translated_and_unique_lines():
+    cached = _tran("はい", pre_zh="是")
+    context = _tran("はい")
+    chunk = _chunk([context, _tran("はい"), cached, _tran("うん")], start=1)
+
+    async def run():
+        deduper = dedup.LineDeduplicator()
+        return deduper, deduper.add_chunks([chunk])
+
+    deduper, (groups, saved) = asyncio.run(run())
+
+    assert (groups, saved) == (0, 0)
+    assert not deduper.is_follower(context)
+
+
+def test_followers_copy_representative_result():
+    rep, follower = _tran("はい"), _tran("はい")
+
+    async def run():
+        deduper = dedup.LineDeduplicator()
+        deduper.add_chunks([_chunk([rep]), _chunk([follower])])
+        waiting = asyncio.ensure_future(deduper.fill_followers([follower]))
+        await asyncio.sleep(0)
+        assert not waiting.done()
+        _translate(rep, "是")
+        deduper.resolve([rep, follower])
+        return await waiting
+
+    filled, leftover = asyncio.run(run())
+
+    assert (filled, leftover) == ([follower], [])
+    assert (follower.pre_zh, follower.post_zh, follower.trans_by) == ("是", "是", "test-model")
+
+
+@pytest.mark.parametrize("result", ["", "(Failed)", "是(翻译失败)"])
+def test_failed_representative_falls_back_to_normal_translation(result):
+    rep, first, second = _tran("はい"), _tran("はい"), _tran("はい")
+
+    async def run():
+        deduper = dedup.LineDeduplicator()
+        deduper.add_chunks([_chunk([rep, first]), _chunk([second])])
+        rep.pre_zh = result
+        deduper.resolve([rep])
+        # 重复登记不会覆盖第一次的结果
+        _translate(rep, "是")
+        deduper.resolve([rep])
+        return await deduper.fill_followers([first, second])
+
+    filled, leftover = asyncio.run(run())
+
+    assert filled == []
+    assert leftover == [first, second]
+    assert first.pre_zh == "" and second.pre_zh == ""
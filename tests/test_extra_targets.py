@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+
+def _write_output(path, message):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps([{"start": 0.0, "end": 1.5, "message": message}], ensure_ascii=False),
+        encoding="utf-8",
+    )
+
+
+def test_target_dict_paths_only_use_language_variants(tmp_path):
+    llm_translate = pytest.importorskip("GalTransl.Frontend.LLMTranslate")
+    gpt = tmp_path / "项目GPT字典.txt"
+    post = tmp_path / "项目字典_译后.txt"
+    names = tmp_path / "name替换表.csv"
+    gpt_en = tmp_path / "项目GPT字典_en.txt"
+    names_en = tmp_path / "name替换表_en.csv"
+    for path in (gpt, post, names, gpt_en, names_en):
+        path.write_text("", encoding="utf-8")
+
+    paths = [str(gpt), str(post), str(names)]
+    # 项目目标语言的字典与 name 替换表不会混入其他语言
+    assert llm_translate.target_dict_paths(paths, "en") == [str(gpt_en), str(names_en)]
+    assert llm_translate.target_dict_paths(paths, "ko") == []
+
+
+def test_extra_target_outputs_are_generated(app_module, tmp_path):
+    pool = app_module.ConcurrentTranslationPool
+    workspace = tmp_path / "workspace"
+    output_dir = tmp_path / "out"
+    output_dir.mkdir()
+    _write_output(workspace / "gt_output" / "ep01.json", "你好")
+    _write_output(workspace / "gt_output_en" / "ep01.json", "Hello")
+    (workspace / "gt_output_ko").mkdir()
+
+    pool._generate_output_impl(
+        "ep01.json", str(tmp_path / "ep01"), str(output_dir), "目标SRT", str(workspace))
+
+    assert "你好" in (output_dir / "ep01.tg.srt").read_text(encoding="utf-8")
+    assert "Hello" in (output_dir / "ep01.en.srt").read_text(encoding="utf-8")
+    assert not (output_dir / "ep01.ko.srt").exists()
+
+    (output_dir / "ep01.orig.lrc").write_text("[00:00.00] こんにちは\n", encoding="utf-8")
+    pool._generate_output_impl(
+        "ep01.json", str(tmp_path / "ep01"), str(output_dir), "双语LRC", str(workspace))
+
+    assert "Hello" in (output_dir / "ep01.en.lrc").read_text(encoding="utf-8")
+    combined = (output_dir / "ep01.en.combine.lrc").read_text(encoding="utf-8")
+    assert "こんにちは" in combined and "Hello" in combined
+
+
+def test_workspace_reset_clears_extra_outputs(app_module, tmp_path):
+    pool = app_module.ConcurrentTranslationPool
+    _write_output(tmp_path / "gt_output_en" / "ep01.json", "Hello")
+    _write_output(tmp_path / "transl_cache_en" / "ep01.json", "Hello")
+
+    pool._create_workspace_impl(str(tmp_path))
+
+    assert not (tmp_path / "gt_output_en").exists()
+    assert (tmp_path / "transl_cache_en" / "ep01.json").exists()
+    assert pool._target_subdirs(str(tmp_path), "transl_cache") == ["transl_cache", "transl_cache_en"]
@@ -0,0 +1,151 @@
+import sys
+import textwrap
+import threading
+import urllib.request
+
+import pytest
+import yaml
+
+LOCAL = ["http://127.0.0.1:50001", "http://127.0.0.1:50002"]
+
+
+def test_sakura_endpoints_keep_comments(app_module):
+    content = textwrap.dedent("""\
+        # 翻译后端相关设置
+        backendSpecific:
+          SakuraLLM: # (Sakura/Galtransl)
+            endpoints:
+              - http://127.0.0.1:8989
+              #- https://sakura-share.one/ # 备用
+            rewriteModelName: "" # 模型名
+        common:
+          language: "zh-cn" # 目标语言
+        """)
+    result = app_module.ConcurrentTranslationPool._apply_local_endpoints(content, LOCAL)
+    assert yaml.safe_load(result)["backendSpecific"]["SakuraLLM"]["endpoints"] == LOCAL
+    assert "# 翻译后端相关设置" in result
+    assert "#- https://sakura-share.one/ # 备用" in result
+    assert 'rewriteModelName: "" # 模型名' in result
+    assert 'language: "zh-cn" # 目标语言' in result
+
+
+def test_sakura_single_endpoint(app_module):
+    content = "backendSpecific:\n  SakuraLLM:\n    endpoint: http://localhost:8989 # 本地\n    rewriteModelName: x\n"
+    result = app_module.ConcurrentTranslationPool._apply_local_endpoints(content, LOCAL)
+    sakura = yaml.safe_load(result)["backendSpecific"]["SakuraLLM"]
+    assert sakura == {"endpoints": LOCAL, "rewriteModelName": "x"}
+    assert "endpoints: # 本地" in result
+
+
+def test_openai_tokens_duplicated_per_instance(app_module):
+    content = textwrap.dedent("""\
+        backendSpecific:
+          OpenAI-Compatible: # 通用
+            tokens:
+              - token: sk-remote
+                endpoint: https://api.deepseek.com # 远端
+                modelName: deepseek-chat
+              - token: sk-local
+                endpoint: "http://127.0.0.1:8989" # 本地模型
+                modelName: local
+            tokenStrategy: "random" # 令牌策略
+        """)
+    result = app_module.ConcurrentTranslationPool._apply_local_endpoints(content, LOCAL)
+    tokens = yaml.safe_load(result)["backendSpecific"]["OpenAI-Compatible"]["tokens"]
+    assert [t["endpoint"] for t in tokens] == ["https://api.deepseek.com"] + LOCAL
+    assert all(t["modelName"] == "local" for t in tokens[1:])
+    assert result.count("# 本地模型") == 2
+    assert 'tokenStrategy: "random" # 令牌策略' in result
+
+
+def test_flow_style_falls_back_to_dump(app_module):
+    content = "backendSpecific:\n  SakuraLLM: {endpoints: ['http://127.0.0.1:8989']}\n"
+    result = app_module.ConcurrentTranslationPool._apply_local_endpoints(content, LOCAL)
+    assert yaml.safe_load(result)["backendSpecific"]["SakuraLLM"]["endpoints"] == LOCAL
+
+
+def test_without_placeholder_is_unchanged(app_module):
+    content = "# 注释\nbackendSpecific:\n  SakuraLLM:\n    endpoints:\n      - http://127.0.0.1:8080\n"
+    assert app_module.ConcurrentTranslationPool._apply_local_endpoints(content, LOCAL) == content
+
+
+# 假的 llama-server：前几次 /health 返回 503（模拟加载模型），之后返回 200
+FAKE_LLAMA_SERVER = """
+    import sys
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    port, parallel, mode = int(sys.argv[1]), sys.argv[2], sys.argv[3]
+    if mode == "crash":
+        sys.exit(1)
+    calls = {"health": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            calls["health"] += 1
+            ready = mode == "ok" and calls["health"] > 2
+            body = parallel.encode()
+            self.send_response(200 if ready else 503)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    HTTPServer(("127.0.0.1", port), Handler).serve_forever()
+"""
+
+
+class _MsgQueue:
+    def __init__(self):
+        self.items = []
+
+    def put(self, kind, msg):
+        self.items.append((kind, msg))
+
+
+@pytest.fixture
+def make_farm(app_module):
+    farms = []
+
+    def make(modes, **kwargs):
+        modes = list(modes)
+
+        def command_factory(port, parallel):
+            return [sys.executable, "-c", textwrap.dedent(FAKE_LLAMA_SERVER),
+                    str(port), str(parallel), modes.pop(0)]
+
+        farm = app_module.LocalModelFarm(
+            command_factory, _MsgQueue(), threading.Event(), instances=len(modes), **kwargs)
+        farms.append(farm)
+        return farm
+
+    yield make
+    for farm in farms:
+        farm.stop()
+
+
+def test_farm_starts_instances_on_distinct_ports(make_farm):
+    farm = make_farm(["ok", "ok", "ok"], parallel=4, ready_timeout=20)
+    assert farm.start()
+    endpoints = farm.endpoints
+    assert len(endpoints) == 3
+    assert len(set(endpoints)) == 3
+    for endpoint in endpoints:
+        with urllib.request.urlopen(endpoint + "/health", timeout=5) as reply:
+            assert reply.read() == b"4"
+    farm.stop()
+    assert not farm.running()
+
+
+def test_farm_drops_crashed_instance(make_farm):
+    farm = make_farm(["ok", "crash"], ready_timeout=20)
+    assert farm.start()
+    assert len(farm.endpoints) == 1
+    assert len(farm.procs) == 1
+
+
+def test_farm_gives_up_when_never_healthy(make_farm):
+    farm = make_farm(["loading"], ready_timeout=2)
+    assert not farm.start()
+    assert farm.endpoints == []
+    assert any("timeout" in msg.lower() or "超时" in msg for _kind, msg in farm._msg_queue.items)
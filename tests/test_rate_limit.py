@@ -0,0 +1,39 @@
+import pytest
+
+rate_limit = pytest.importorskip("GalTransl.RateLimit")
+
+
+def _limiter(initial=8.0):
+    limiter = rate_limit.AdaptiveLimiter("test", initial=initial)
+    assert limiter.try_acquire()
+    return limiter
+
+
+def test_timeout_halves_limit():
+    limiter = _limiter()
+    limiter.release(30.0, ok=False, congested=True)
+    assert limiter.limit == 4.0
+    assert limiter.in_flight == 0
+    assert limiter.available()
+
+
+def test_other_failures_keep_limit():
+    limiter = _limiter()
+    limiter.release(0.1, ok=False)
+    assert limiter.limit == 8.0
+
+
+def test_rate_limited_blocks_endpoint():
+    limiter = _limiter()
+    limiter.release(0.1, ok=False, rate_limited=True, retry_after=5)
+    assert limiter.limit == 4.0
+    assert not limiter.available()
+
+
+def test_decrease_has_cooldown():
+    limiter = _limiter()
+    limiter.release(30.0, ok=False, congested=True)
+    assert limiter.try_acquire()
+    limiter.release(30.0, ok=False, congested=True)
+    assert limiter.limit == 4.0
+
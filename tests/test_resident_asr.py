@@ -0,0 +1,88 @@
+import sys
+import textwrap
+import time
+
+import pytest
+
+
+class _MsgQueue:
+    def __init__(self):
+        self.items = []
+
+    def put(self, kind, msg):
+        self.items.append((kind, msg))
+
+
+def _fake_server(body):
+    """返回以 python -c 运行的假听写进程命令"""
+    return [sys.executable, "-u", "-c", textwrap.dedent(body)]
+
+
+ECHO_SERVER = """
+    import json, sys
+    print("model loaded")
+    for line in sys.stdin:
+        req = json.loads(line)
+        srt = req["output"] + ".srt"
+        open(srt, "w").write("1\\n00:00:00,000 --> 00:00:01,000\\nhi\\n")
+        print(json.dumps({"id": req["id"], "srt": srt}))
+"""
+
+# 不认识请求协议：读一行后直接退出（相当于未实现 param_server.txt 协议的 crispasr）
+EXITING_SERVER = """
+    import sys
+    sys.stdin.readline()
+    print("error: unknown argument")
+    sys.exit(1)
+"""
+
+# 进程存活但永不响应
+SILENT_SERVER = """
+    import sys, time
+    for line in sys.stdin:
+        time.sleep(60)
+"""
+
+
+@pytest.fixture
+def start_server(app_module):
+    servers = []
+
+    def start(body):
+        server = app_module.ResidentCrispASR(_fake_server(body), _MsgQueue())
+        server.POLL_INTERVAL = 0.1
+        server.start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        if server.alive():
+            server.proc.kill()
+        server.close()
+
+
+def test_transcribe_round_trip(start_server, tmp_path):
+    server = start_server(ECHO_SERVER)
+    srt = server.transcribe(tmp_path / "a.wav", tmp_path / "a", "ja", timeout=10)
+    assert srt == tmp_path / "a.srt"
+    assert srt.read_text().endswith("hi\n")
+    # 非响应行按日志转发
+    assert any("model loaded" in msg for _kind, msg in server._msg_queue.items)
+
+
+def test_transcribe_fails_when_server_exits(start_server, tmp_path):
+    server = start_server(EXITING_SERVER)
+    started = time.monotonic()
+    with pytest.raises(RuntimeError, match="exited"):
+        server.transcribe(tmp_path / "a.wav", tmp_path / "a", "ja")
+    assert time.monotonic() - started < 10
+    assert not server._pending
+
+
+def test_transcribe_times_out_on_silent_server(start_server, tmp_path):
+    server = start_server(SILENT_SERVER)
+    with pytest.raises(RuntimeError, match="did not answer"):
+        server.transcribe(tmp_path / "a.wav", tmp_path / "a", "ja", timeout=0.5)
+    assert not server._pending
+    assert server.alive()
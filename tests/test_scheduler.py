@@ -0,0 +1,65 @@
+import pytest
+
+Scheduler = pytest.importorskip("GalTransl.Scheduler")
+SimChunk = Scheduler.SimChunk
+
+
+def _files(chunks):
+    return sorted({chunk.file_path for chunk in chunks})
+
+
+@pytest.mark.parametrize("workers", [4, 8, 16])
+@pytest.mark.parametrize("workload", [{}, {"big_files": 5, "small_files": 40}, {"seed": 3, "big_chunks": 20}])
+def test_fair_finishes_files_sooner_without_hurting_makespan(workers, workload):
+    chunks = Scheduler.synthetic_workload(**workload)
+    results = {
+        name: Scheduler.simulate(
+            Scheduler.create_scheduler(name, chunks, _files(chunks), workers=workers), workers)
+        for name in ("name", "size", "fair")
+    }
+    fair = results["fair"]
+    for name in ("name", "size"):
+        assert fair["mean_completion"] < 0.5 * results[name]["mean_completion"]
+        assert fair["mean_first_output"] < 0.5 * results[name]["mean_first_output"]
+    best_makespan = min(result["makespan"] for result in results.values())
+    assert fair["makespan"] <= 1.1 * best_makespan
+
+
+def test_fair_starts_small_files_first():
+    chunks = [SimChunk("big", i, 100) for i in range(3)] + [
+        SimChunk("mid", 0, 40), SimChunk("mid", 1, 40), SimChunk("tiny", 0, 5)]
+    scheduler = Scheduler.create_scheduler("fair", chunks, _files(chunks))
+    order = [(c.file_path, c.chunk_index) for c in iter(scheduler.pop, None)]
+    assert order[:3] == [("tiny", 0), ("mid", 0), ("big", 0)]
+    # 首块发完后先把剩余工作量最少的 mid 做完
+    assert order[3] == ("mid", 1)
+
+
+def test_fair_respects_priority_levels():
+    chunks = [SimChunk("ep01", 0, 50), SimChunk("ep02", 0, 5), SimChunk("ep02", 1, 5)]
+    scheduler = Scheduler.create_scheduler("fair", chunks, _files(chunks), {"ep01": 10})
+    assert [c.file_path for c in iter(scheduler.pop, None)] == ["ep01", "ep02", "ep02"]
+
+
+def test_fair_tail_runs_longest_chunks_first():
+    chunks = [SimChunk("a", 0, 1), SimChunk("a", 1, 10), SimChunk("a", 2, 50), SimChunk("a", 3, 20)]
+    scheduler = Scheduler.create_scheduler("fair", chunks, _files(chunks), workers=3)
+    assert [c.chunk_index for c in iter(scheduler.pop, None)] == [0, 2, 3, 1]
+
+
+def test_fair_iter_previews_without_consuming():
+    chunks = Scheduler.synthetic_workload(big_files=2, small_files=5)
+    scheduler = Scheduler.create_scheduler("fair", chunks, _files(chunks), workers=4)
+    first = scheduler.pop()
+    planned = list(scheduler)
+    assert len(scheduler) == len(chunks) - 1
+    assert planned == list(iter(scheduler.pop, None))
+    assert first not in planned
+
+
+def test_fair_keeps_target_languages_apart():
+    chunks = [SimChunk("a", 0, 10), SimChunk("a", 0, 10)]
+    chunks[1].target_lang = "en"
+    scheduler = Scheduler.create_scheduler("fair", chunks, _files(chunks))
+    popped = list(iter(scheduler.pop, None))
+    assert len(popped) == 2 and popped[0] is not popped[1]
@@ -0,0 +1,37 @@
+from types import SimpleNamespace
+
+import pytest
+
+base_translate = pytest.importorskip("GalTransl.Backend.BaseTranslate")
+
+
+def _lines(n, text="はい"):
+    return [SimpleNamespace(post_jp=text, get_speaker_name=lambda: "") for _ in range(n)]
+
+
+def _translator(token_limit):
+    return SimpleNamespace(
+        token_limit=token_limit,
+        output_token_limit=0,
+        transl_memory=None,
+        transl_memory_hint=0,
+        _request_overhead_tokens=lambda filename: 0,
+    )
+
+
+def test_budget_packing_respects_num_per_request():
+    split, _prompt = base_translate.BaseTranslate._next_request(
+        _translator(100000), _lines(200), 0, 16)
+    assert len(split) == 16
+
+
+def test_budget_packing_caps_at_max_packed_lines():
+    split, _prompt = base_translate.BaseTranslate._next_request(
+        _translator(100000), _lines(200), 0, 500)
+    assert len(split) == base_translate.MAX_PACKED_LINES
+
+
+def test_budget_still_limits_below_num_per_request():
+    split, _prompt = base_translate.BaseTranslate._next_request(
+        _translator(60), _lines(200), 0, 16)
+    assert 1 <= len(split) < 16
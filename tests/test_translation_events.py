@@ -0,0 +1,61 @@
+import json
+
+
+def _feed_all(log_filter, lines):
+    out = []
+    for line in lines:
+        out.extend(log_filter.feed(line))
+    return out + log_filter.flush()
+
+
+def test_filter_drops_translation_records_with_continuations(app_module):
+    lines = [
+        "[10-18 12:00:00][INFO]>>> 开始翻译 a.json",
+        "[10-18 12:00:01][INFO]",
+        "",
+        "v--1-[A]",
+        "> Src: こんにちは",
+        "> Dst: 你好",
+        "",
+        "v--2",
+        "> Src: はい",
+        "> Dst: 好",
+        "[10-18 12:00:02][WARNING]解析失败",
+        "Traceback (most recent call last):",
+        '  File "x.py", line 1',
+        "[10-18 12:00:03][INFO]+++ 结果保存 a.json",
+    ]
+    out = _feed_all(app_module._TranslationLogFilter(), lines)
+    assert out == [
+        "[10-18 12:00:00][INFO]>>> 开始翻译 a.json",
+        "[10-18 12:00:02][WARNING]解析失败",
+        "Traceback (most recent call last):",
+        '  File "x.py", line 1',
+        "[10-18 12:00:03][INFO]+++ 结果保存 a.json",
+    ]
+
+
+def test_filter_keeps_other_empty_header_records(app_module):
+    lines = ["[10-18 12:00:01][INFO]", "", "plain continuation"]
+    out = _feed_all(app_module._TranslationLogFilter(), lines)
+    assert out == ["[10-18 12:00:01][INFO]", "plain continuation"]
+
+
+def test_tailer_reads_complete_lines_only(app_module, tmp_path):
+    path = tmp_path / "events.jsonl"
+    payloads = []
+    tailer = app_module._EventFileTailer(str(path), payloads.append)
+    tailer.POLL_INTERVAL = 0.05
+    event = json.dumps({"event": "lines", "lines": [{"id": 1, "dst": "你好"}]}, ensure_ascii=False)
+    with open(path, "ab") as f:
+        f.write(event.encode("utf-8")[:10])
+        f.flush()
+        tailer._read_new()
+        assert payloads == []
+        f.write(event.encode("utf-8")[10:] + b"\n")
+    tailer.start()
+    tailer.stop()
+    assert payloads == [event]
+
+    reader = app_module._TranslationEventReader()
+    assert [json.loads(line) for line in reader.feed(payloads[0])] == [{"id": 1, "dst": "你好"}]
@@ -0,0 +1,80 @@
+from types import SimpleNamespace
+
+import pytest
+
+tm = pytest.importorskip("GalTransl.TranslationMemory")
+
+
+def _tran(post_jp, pre_jp=None):
+    return SimpleNamespace(
+        post_jp=post_jp,
+        pre_jp=post_jp if pre_jp is None else pre_jp,
+        pre_zh="",
+        post_zh="",
+        trans_by="",
+        problem="",
+        proofread_zh="",
+    )
+
+
+SRC = "明日の朝までにこの報告書を全部読んで、部長に提出しておかなければならない"
+NEGATED = "明日の朝までにこの報告書を全部読んで、部長に提出しておかなくてもいい"
+
+
+def test_reuse_only_exact_matches():
+    memory = tm.TranslationMemory()
+    memory.add(SRC, "明早之前必须读完这份报告交给部长")
+    memory.add("OKです", "好的")
+
+    same = _tran(SRC.replace("、", "、 "))
+    width = _tran("ＯＫです")
+    punct = _tran("OKです！")
+    negated = _tran(NEGATED)
+    reused, rest = memory.reuse([same, width, punct, negated])
+
+    assert reused == [same, width]
+    assert rest == [punct, negated]
+    assert same.pre_zh == "明早之前必须读完这份报告交给部长" and same.trans_by == "TranslMemory"
+    assert punct.pre_zh == "" and negated.pre_zh == ""
+
+
+def test_punctuation_variants_are_only_hints():
+    memory = tm.TranslationMemory()
+    memory.add("そうですか。", "是这样啊。")
+    memory.add(SRC, "明早之前必须读完这份报告交给部长")
+
+    assert memory.lookup("そうですか？") is None
+    assert memory.lookup(SRC + "！") is None
+    assert SRC in memory.hint_prompt([_tran(SRC + "！")], 0.6)
+
+
+def test_fuzzy_matches_are_only_hints():
+    memory = tm.TranslationMemory()
+    memory.add(SRC, "明早之前必须读完这份报告交给部长")
+
+    assert memory.match(NEGATED, 0.6) is not None
+    assert memory.lookup(NEGATED) is None
+    assert SRC in memory.hint_prompt([_tran(NEGATED)], 0.6)
+
+
+def test_reuse_skips_retransl_key():
+    memory = tm.TranslationMemory()
+    memory.add("はい", "是")
+
+    reused, rest = memory.reuse([_tran("はい")], retran_key="はい")
+
+    assert reused == [] and len(rest) == 1
+
+
+def test_shared_file_is_scoped_by_language_and_engine(tmp_path):
+    path = str(tmp_path / tm.MEMORY_FILE_NAME)
+    zh = tm.load_translation_memory(path, target_lang="zh-cn", engine="ForGal-json")
+    zh.add("はい", "是")
+    zh.flush()
+    en = tm.load_translation_memory(path, target_lang="en", engine="ForGal-json")
+    en.add("はい", "Yes")
+    en.flush()
+
+    assert tm.load_translation_memory(path, target_lang="zh-cn", engine="ForGal-json").lookup("はい") == "是"
+    assert tm.load_translation_memory(path, target_lang="en", engine="ForGal-json").lookup("はい") == "Yes"
+    assert len(tm.load_translation_memory(path, target_lang="zh-cn", engine="sakura-v1.0")) == 0
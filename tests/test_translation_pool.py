@@ -0,0 +1,29 @@
+import queue
+from concurrent.futures import Future
+
+
+def _task(name):
+    return ({"json_src": name}, Future())
+
+
+def test_drain_batch_requeues_deferred_before_sentinel(app_module, monkeypatch):
+    pool = app_module.ConcurrentTranslationPool
+    # 同名文件共享工作空间
+    monkeypatch.setattr(pool, "_workspace_path",
+                        staticmethod(lambda project_dir, tf_dict, config, engine: tf_dict["json_src"]))
+    monkeypatch.setattr(pool, "batch_max_files", 8)
+    task_queue = queue.Queue()
+    for task in (_task("b"), _task("a"), _task("c")):
+        task_queue.put(task)
+    task_queue.put(None)
+    task_queue.put(None)
+
+    batch = pool._drain_batch(task_queue, "", "", "engine", {"json_src": "a"})
+
+    assert [t[0]["json_src"] for t in batch] == ["b", "c"]
+    rest = []
+    while not task_queue.empty():
+        item = task_queue.get_nowait()
+        rest.append(None if item is None else item[0]["json_src"])
+    # 与首个文件同工作空间的 a 必须排在本线程放回的哨兵之前
+    assert rest == [None, "a", None]
@@ -0,0 +1,135 @@
+import os
+import threading
+import time
+
+import pytest
+
+
+@pytest.fixture
+def pool_cls(app_module, monkeypatch):
+    cls = app_module.ConcurrentTranslationPool
+    monkeypatch.setattr(cls, "_workspace_locks", {})
+    monkeypatch.setattr(cls, "_workspace_sizes", {})
+    monkeypatch.setattr(cls, "_last_evict", {})
+    return cls
+
+
+def _make_workspace(project_dir, name, size, age=0.0):
+    workspace = project_dir / "cache" / f"translate_{name}"
+    (workspace / "transl_cache").mkdir(parents=True)
+    (workspace / "transl_cache" / "a.json").write_bytes(b"x" * size)
+    stamp = time.time() - age
+    os.utime(workspace, (stamp, stamp))
+    return workspace
+
+
+def test_evicts_old_then_least_recently_used(pool_cls, tmp_path, monkeypatch):
+    monkeypatch.setattr(pool_cls, "workspace_max_bytes", 150)
+    old = _make_workspace(tmp_path, "old", 10, age=40 * 86400)
+    lru = _make_workspace(tmp_path, "lru", 100, age=200)
+    recent = _make_workspace(tmp_path, "recent", 100, age=100)
+
+    pool_cls._evict_workspaces(tmp_path)
+
+    assert not old.exists()
+    assert not lru.exists()
+    assert recent.exists()
+    assert pool_cls._workspace_locks == {}
+    assert list(pool_cls._workspace_sizes) == [os.path.abspath(recent)]
+
+
+def test_workspace_in_use_is_kept(pool_cls, tmp_path, monkeypatch):
+    monkeypatch.setattr(pool_cls, "workspace_max_bytes", 0)
+    busy = _make_workspace(tmp_path, "busy", 100, age=40 * 86400)
+    entered, release = threading.Event(), threading.Event()
+
+    def use():
+        with pool_cls._workspace_lock(busy):
+            entered.set()
+            release.wait(5)
+
+    user = threading.Thread(target=use)
+    user.start()
+    entered.wait(5)
+    pool_cls._evict_workspaces(tmp_path)
+    assert busy.exists()
+    release.set()
+    user.join(5)
+    # 最后一个使用者退出后锁表被清理
+    assert pool_cls._workspace_locks == {}
+
+
+def test_eviction_holds_lock_while_deleting(pool_cls, tmp_path, monkeypatch, app_module):
+    monkeypatch.setattr(pool_cls, "workspace_max_bytes", 0)
+    workspace = _make_workspace(tmp_path, "ws", 100, age=100)
+    deleting, proceed = threading.Event(), threading.Event()
+    real_rmtree = app_module.shutil.rmtree
+
+    def slow_rmtree(path, *args, **kwargs):
+        deleting.set()
+        proceed.wait(5)
+        real_rmtree(path, *args, **kwargs)
+
+    monkeypatch.setattr(app_module.shutil, "rmtree", slow_rmtree)
+    evictor = threading.Thread(target=pool_cls._evict_workspaces, args=(tmp_path,))
+    evictor.start()
+    deleting.wait(5)
+
+    used = []
+
+    def use():
+        with pool_cls._workspace_lock(workspace):
+            # 复用方等到删除结束才进入，随后重新创建工作空间
+            used.append(workspace.exists())
+            pool_cls._create_workspace_impl(str(workspace))
+
+    user = threading.Thread(target=use)
+    user.start()
+    time.sleep(0.2)
+    assert used == []
+    proceed.set()
+    evictor.join(5)
+    user.join(5)
+    assert used == [False]
+    assert (workspace / "transl_cache").is_dir()
+
+
+def test_scan_is_throttled(pool_cls, tmp_path, monkeypatch):
+    monkeypatch.setattr(pool_cls, "workspace_max_bytes", 0)
+    pool_cls._evict_workspaces(tmp_path)
+    workspace = _make_workspace(tmp_path, "ws", 100)
+    pool_cls._evict_workspaces(tmp_path)
+    assert workspace.exists()
+    pool_cls._evict_workspaces(tmp_path, force=True)
+    assert not workspace.exists()
+
+
+def test_workspace_key_survives_regenerated_input(pool_cls, tmp_path):
+    json_src = tmp_path / "ep01.json"
+    config = tmp_path / "config.yaml"
+    json_src.write_text('[{"message": "はい"}]', encoding="utf-8")
+    config.write_text("common: {}\n", encoding="utf-8")
+    tf = {"base_path": str(tmp_path / "a" / "ep01"), "json_src": str(json_src)}
+    key = pool_cls._workspace_key(str(tmp_path), tf, str(config), "ForGal-json")
+
+    json_src.write_text('[{"message": "はい"}, {"message": "いいえ"}]', encoding="utf-8")
+    assert pool_cls._workspace_key(str(tmp_path), tf, str(config), "ForGal-json") == key
+
+    (tmp_path / "dict_gpt.txt").write_text("はい\t是\n", encoding="utf-8")
+    assert pool_cls._workspace_key(str(tmp_path), tf, str(config), "ForGal-json") != key
+
+
+def test_workspace_key_separates_inputs_with_same_name(pool_cls, tmp_path):
+    config = tmp_path / "config.yaml"
+    config.write_text("common: {}\n", encoding="utf-8")
+
+    def key(**tf):
+        return pool_cls._workspace_key(str(tmp_path), tf, str(config), "ForGal-json")
+
+    # 不同目录下的同名输入
+    assert key(base_path="/a/ep01", json_src="t/ep01.json") != key(base_path="/b/ep01", json_src="t/ep01.json")
+    # 不同文件的同序号分段
+    segment = dict(base_path="seg/ep01/segment_0000.16k", json_src="t/ep01/segment_0000.16k.json")
+    assert key(source_path="/a/ep01", **segment) != key(source_path="/b/ep01", **segment)
+    assert key(source_path="/a/ep01", **segment) != key(
+        source_path="/a/ep01", base_path="seg/ep01/segment_0001.16k", json_src="t/ep01/segment_0001.16k.json")
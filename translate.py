@@ -68,6 +68,60 @@ def parse_arguments():
     return args.project_path, args.translator
 
 
+# 常驻模式下每个任务结束时输出的标记行，后面跟 JSON 格式的任务结果
+JOB_DONE_MARKER = '@@GALTRANSL_JOB_DONE '
+
+
+def serve():
+    """常驻模式：逐行读取 {"project_dir", "translator"} 任务，在同一进程和事件循环中执行。
+
+    任务可带 "events" 指定本任务的事件文件（GALTRANSL_EVENTS），事件与 stdout 日志分开输出。
+
+    已加载的插件、已解析的字典、令牌可用性检查结果与 AsyncOpenAI 客户端跨任务复用
+    （插件与字典文件改动后自动重新加载），项目配置仍按任务读取；
+    每个任务结束后输出一行 JOB_DONE_MARKER + 结果 JSON；stdin 关闭时退出。
+    """
+    import asyncio
+    import json
+    from GalTransl.Service import JobSpec, run_job_async
+    import GalTransl.Backend.BaseTranslate as base_translate
+    import GalTransl.Runner as runner
+
+    base_translate.KEEP_WARM_CLIENTS = True
+    runner.REUSE_PLUGINS = True
+
+    async def serve_loop():
+        while True:
+            line = await asyncio.to_thread(sys.stdin.readline)
+            if not line:
+                break
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                request = json.loads(line)
+                spec = JobSpec(
+                    project_dir=os.path.abspath(request['project_dir']),
+                    translator=request['translator'],
+                    config_file_name=request.get('config_file_name') or CONFIG_FILENAME,
+                    job_id=str(request.get('id', '')),
+                )
+            except (ValueError, KeyError, TypeError) as e:
+                reply = {'id': None, 'status': 'failed', 'success': False, 'error': f'bad request: {e}'}
+            else:
+                events = request.get('events')
+                if events:
+                    os.environ['GALTRANSL_EVENTS'] = events
+                else:
+                    os.environ.pop('GALTRANSL_EVENTS', None)
+                state = await run_job_async(spec)
+                reply = {'id': request.get('id'), 'status': state.status,
+                         'success': state.success, 'error': state.error}
+            print(JOB_DONE_MARKER + json.dumps(reply, ensure_ascii=False), flush=True)
+
+    asyncio.run(serve_loop())
+
+
 class ProjectManager:
     def __init__(self):
         self.user_input = ""
@@ -227,5 +281,8 @@ class ProjectManager:
 
 if __name__ == "__main__":
     # 可以在这里处理全局异常或设置
-    manager = ProjectManager()
-    manager.run()
+    if '--serve' in sys.argv[1:]:
+        serve()
+    else:
+        manager = ProjectManager()
+        manager.run()